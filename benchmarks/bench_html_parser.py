@@ -0,0 +1,84 @@
+"""HTML 파서 백엔드 벤치마크
+
+benchmarks/fixtures/의 저장된 페이지로 기사 본문(#dic_area)과 랭킹 목록 추출 시간을
+백엔드별로 측정하고, 모든 백엔드 결과가 BeautifulSoup과 같은지 확인함
+
+    python benchmarks/bench_html_parser.py [--repeat 20]
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.scrapers.html_parser import BACKENDS, extract_article_text, extract_ranking_links, stream_article_text
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+CHUNK_SIZE = 16384
+
+
+def _chunks(data: bytes):
+    for i in range(0, len(data), CHUNK_SIZE):
+        yield data[i:i + CHUNK_SIZE]
+
+
+def measure(func, repeat: int) -> float:
+    """func를 repeat번 실행한 평균 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20, help="페이지별 반복 횟수")
+    args = parser.parse_args()
+    
+    articles = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, 'article_*.html'))):
+        with open(path, 'rb') as f:
+            articles[os.path.basename(path)] = f.read()
+    with open(os.path.join(FIXTURE_DIR, 'ranking.html'), encoding='utf-8') as f:
+        ranking = f.read()
+    
+    # 결과 일치 확인 (BeautifulSoup 기준)
+    for name, data in articles.items():
+        html = data.decode('utf-8')
+        expected = extract_article_text(html, 'bs4')
+        for backend in BACKENDS:
+            assert extract_article_text(html, backend) == expected, f"{backend} 결과 불일치: {name}"
+        assert stream_article_text(_chunks(data)) == expected, f"stream 결과 불일치: {name}"
+    expected_links = extract_ranking_links(ranking, 'bs4')
+    for backend in BACKENDS:
+        assert extract_ranking_links(ranking, backend) == expected_links, f"{backend} 랭킹 결과 불일치"
+    
+    print(f"기사 {len(articles)}개, 반복 {args.repeat}회 (페이지당 평균 ms)")
+    print(f"{'backend':<12}{'article':>10}{'ranking':>10}{'speedup':>10}")
+    
+    baseline = None
+    rows = []
+    for backend in ['bs4'] + [name for name in BACKENDS if name != 'bs4']:
+        article_ms = sum(
+            measure(lambda html=data.decode('utf-8'): extract_article_text(html, backend), args.repeat)
+            for data in articles.values()
+        ) / len(articles)
+        ranking_ms = measure(lambda: extract_ranking_links(ranking, backend), args.repeat)
+        rows.append((backend, article_ms, ranking_ms))
+    
+    stream_ms = sum(
+        measure(lambda data=data: stream_article_text(_chunks(data)), args.repeat)
+        for data in articles.values()
+    ) / len(articles)
+    rows.append(('stream', stream_ms, None))
+    
+    for backend, article_ms, ranking_ms in rows:
+        baseline = baseline or article_ms
+        ranking_text = f"{ranking_ms:>10.2f}" if ranking_ms is not None else f"{'-':>10}"
+        print(f"{backend:<12}{article_ms:>10.2f}{ranking_text}{baseline / article_ms:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""가짜 Claude/Sheets 서버를 상대로 한 부하·지연 테스트
+
+src.fakes의 서버에 지연, 5xx/429 오류, 할당량을 걸어 두고 동시 Claude 요청과
+Sheets 일괄 추가/색인 조회를 실행해 처리 시간, 요청 수, 재시도 횟수, 최대 동시 요청 수를
+시나리오별로 출력함. 네트워크 접근이나 API 키가 필요 없음
+
+    python benchmarks/bench_load.py [--prompts 40] [--rows 1200] [--only flaky quota] [--check]
+
+--check는 모든 요청이 재시도 끝에 성공했는지(응답/행 수 일치)만 확인함
+"""
+import os
+import sys
+import time
+import argparse
+import logging
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, PROJECT_ROOT)
+
+from stub import isolated_state
+from src.fakes import FaultConfig, fake_apis
+from src.utils import get_claude_responses, get_metrics, get_worksheet, append_rows_batched
+from src.utils.sheet_index import load_key_index
+
+SPREADSHEET_ID = 'load-test'
+SHEET_NAME = '뉴스요약'
+HEADERS = ['날짜', '카테고리', '제목', '요약', '링크']
+
+# 시나리오 이름 → (Claude 서버 설정, Sheets 서버 설정)
+SCENARIOS = {
+    'baseline': (
+        FaultConfig(latency=0.2, jitter=0.05, seed=1),
+        FaultConfig(latency=0.05, seed=1)
+    ),
+    'flaky': (
+        FaultConfig(latency=0.2, jitter=0.05, error_rate=0.2, error_statuses=(500, 529), retry_after=0.1, seed=2),
+        FaultConfig(latency=0.05, error_rate=0.2, error_statuses=(500, 503), retry_after=0.1, seed=2)
+    ),
+    'quota': (
+        FaultConfig(latency=0.2, quota_per_minute=6, quota_window=1.0, retry_after=0.2, seed=3),
+        FaultConfig(latency=0.05, quota_per_minute=2, quota_window=1.0, retry_after=0.2, seed=3)
+    )
+}
+
+
+def counter_delta(before: dict, after: dict, name: str) -> int:
+    """실행 지표 카운터 증가분"""
+    return int(after.get(name, 0) - before.get(name, 0))
+
+
+def run_scenario(name: str, prompts: int, rows: int, chunk_size: int) -> dict:
+    """시나리오 하나 실행 후 결과 집계"""
+    claude_faults, sheets_faults = SCENARIOS[name]
+    data = [
+        [f"2025-05-{i % 28 + 1:02d}", '부동산', f"제목 {i}", f"요약 {i}", f"https://n.news.naver.com/article/001/{i:010d}"]
+        for i in range(rows)
+    ]
+    metrics = get_metrics()
+    
+    with isolated_state(), fake_apis(claude_faults, sheets_faults, {SPREADSHEET_ID: {SHEET_NAME: [HEADERS]}}) as (claude, sheets):
+        before = metrics.report()['counters']
+        
+        started = time.perf_counter()
+        responses = get_claude_responses([f"부하 테스트 프롬프트 {i}" for i in range(prompts)], retry_count=5)
+        claude_seconds = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        worksheet = get_worksheet(SPREADSHEET_ID, SHEET_NAME)
+        append_rows_batched(worksheet, data, chunk_size=chunk_size)
+        index = load_key_index(worksheet, ('A', 'E'))
+        sheets_seconds = time.perf_counter() - started
+        
+        after = metrics.report()['counters']
+        return {
+            'claude': {
+                'seconds': claude_seconds,
+                'ok': sum(1 for response in responses if 'API' not in response),
+                'expected': prompts,
+                'retries': counter_delta(before, after, 'claude.retries'),
+                **claude.stats()
+            },
+            'sheets': {
+                'seconds': sheets_seconds,
+                'ok': len(index),
+                'expected': rows,
+                'retries': counter_delta(before, after, 'sheets.retries'),
+                **sheets.stats()
+            }
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 Claude/Sheets 서버 부하 테스트")
+    parser.add_argument("--prompts", type=int, default=40, help="동시 요청할 Claude 프롬프트 수")
+    parser.add_argument("--rows", type=int, default=1200, help="Sheets에 추가할 행 수")
+    parser.add_argument("--chunk-size", type=int, default=500, help="요청당 행 수")
+    parser.add_argument("--only", nargs="+", default=None, choices=list(SCENARIOS), help="실행할 시나리오")
+    parser.add_argument("--check", action="store_true", help="실패한 요청이 있으면 종료 코드 1")
+    parser.add_argument("--verbose", action="store_true", help="재시도 경고 로그 출력")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING if args.verbose else logging.ERROR)
+    
+    failed = False
+    print(f"{'scenario':<10}{'api':<8}{'seconds':>9}{'ok':>11}{'requests':>10}{'retries':>9}{'in-flight':>11}  errors")
+    for name in args.only or SCENARIOS:
+        result = run_scenario(name, args.prompts, args.rows, args.chunk_size)
+        for api, stats in result.items():
+            ok_text = f"{stats['ok']}/{stats['expected']}"
+            print(
+                f"{name:<10}{api:<8}{stats['seconds']:>9.2f}{ok_text:>11}{stats['requests']:>10}"
+                f"{stats['retries']:>9}{stats['max_in_flight']:>11}  {stats['errors'] or '-'}"
+            )
+            failed = failed or stats['ok'] != stats['expected']
+    
+    if args.check and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""파이프라인 단계별 오프라인 벤치마크
+
+저장된 fixture(네이버 랭킹/기사 HTML, data/raw Markdown, Claude 응답, 요약결과 시트 행)로
+각 단계를 반복 실행해 평균 시간을 재고 benchmarks/baseline.json과 비교함.
+HTTP 요청은 stub.FixtureAdapter가 처리하므로 네트워크나 API 키가 필요 없음
+
+    python benchmarks/bench_pipeline.py [--repeat 20] [--only compose_kakao_message create_date_page] [--check] [--save]
+
+기준값은 측정한 머신에 따라 달라지므로, 다른 환경에서는 변경 전 코드로 --save를 먼저 실행할 것
+"""
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import tempfile
+from contextlib import contextmanager
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'google_upload'))
+
+from stub import FIXTURE_DIR, NAVER_PREFIXES, load_json_fixture, offline
+from src.scrapers.news_scraper import extract_first_paragraph
+from src.uploaders.sheets_uploader import convert_md_to_csv, parse_markdown_rows
+from src.processors.batch_scoring import select_top_by_category
+from src.processors.daily_summary import compose_kakao_message
+import generate_dashboard
+
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baseline.json')
+MARKDOWN_FIXTURE = os.path.join(FIXTURE_DIR, 'output_2025-05-13.md')
+FIXTURE_DATE = '2025-05-13'
+
+
+@contextmanager
+def working_directory(path: str):
+    """상대 경로(docs/, data/)에 쓰는 함수를 임시 디렉토리에서 실행"""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def build_benchmarks(workdir: str):
+    """벤치마크 목록: 이름 → (측정할 함수, 결과 확인용 함수)"""
+    rows = parse_markdown_rows(MARKDOWN_FIXTURE)
+    urls = [row[4] for row in rows if row[4].startswith(NAVER_PREFIXES)]
+    selected = select_top_by_category(rows, top_n=5)
+    csv_file = os.path.join(workdir, f"output_{FIXTURE_DATE}.csv")
+    os.makedirs(os.path.join(workdir, 'docs'), exist_ok=True)   # generate_dashboard.main()이 만드는 폴더
+    _, summary, insight = load_json_fixture('sheets_summary_values.json')['values'][1]
+    state = {}
+    
+    def paragraphs():
+        state['paragraphs'] = [extract_first_paragraph(url, use_cache=False) for url in urls]
+    
+    def kakao():
+        state['kakao'] = compose_kakao_message(selected, batch=True, date=FIXTURE_DATE)
+    
+    def read_csv():
+        with open(csv_file, encoding='utf-8') as f:
+            return f.read()
+    
+    def read_page():
+        with open(os.path.join(workdir, 'docs', f"{FIXTURE_DATE}.html"), encoding='utf-8') as f:
+            return f.read()
+    
+    return {
+        'extract_first_paragraph': (paragraphs, lambda: state['paragraphs']),
+        'convert_md_to_csv': (lambda: convert_md_to_csv(MARKDOWN_FIXTURE, csv_file), read_csv),
+        'select_top_by_category': (
+            lambda: state.update(selected=select_top_by_category(rows, top_n=5)),
+            lambda: state['selected']
+        ),
+        'compose_kakao_message': (kakao, lambda: state['kakao']),
+        'create_date_page': (lambda: generate_dashboard.create_date_page(FIXTURE_DATE, summary, insight), read_page)
+    }
+
+
+def digest(value) -> str:
+    """결과 비교용 짧은 해시"""
+    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def measure(func, repeat: int) -> dict:
+    """한 번 예열 후 repeat번 실행한 평균/최소 시간 (ms)"""
+    func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {'mean_ms': round(sum(samples) / len(samples), 3), 'min_ms': round(min(samples), 3)}
+
+
+def load_baseline() -> dict:
+    """저장된 기준값 (없으면 빈 dict)"""
+    if not os.path.exists(BASELINE_FILE):
+        return {}
+    with open(BASELINE_FILE, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파이프라인 단계별 오프라인 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20, help="단계별 반복 횟수")
+    parser.add_argument("--only", nargs="+", default=None, help="실행할 벤치마크 이름")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="기준 대비 허용 증가율 (기본값: 0.25 = 25%%)")
+    parser.add_argument("--check", action="store_true", help="기준보다 느리거나 결과가 다르면 종료 코드 1")
+    parser.add_argument("--save", action="store_true", help="이번 측정값을 기준값으로 저장")
+    args = parser.parse_args()
+    
+    baseline = load_baseline()
+    results = {}
+    failed = False
+    
+    with tempfile.TemporaryDirectory() as workdir, working_directory(workdir), offline() as adapter:
+        benchmarks = build_benchmarks(workdir)
+        names = [name for name in benchmarks if not args.only or name in args.only]
+        
+        print(f"반복 {args.repeat}회 (평균 ms, 허용 +{args.tolerance:.0%})")
+        print(f"{'benchmark':<26}{'mean':>10}{'min':>10}{'baseline':>10}{'ratio':>8}  status")
+        for name in names:
+            run, output = benchmarks[name]
+            result = measure(run, args.repeat)
+            result['digest'] = digest(output())
+            results[name] = result
+            
+            base = baseline.get(name)
+            if base is None:
+                base_text, ratio_text, status = f"{'-':>10}", f"{'-':>8}", 'new'
+            else:
+                ratio = result['mean_ms'] / base['mean_ms']
+                base_text, ratio_text = f"{base['mean_ms']:>10.2f}", f"{ratio:>7.2f}x"
+                if base.get('digest') != result['digest']:
+                    status = 'RESULT CHANGED'
+                elif ratio > 1 + args.tolerance:
+                    status = 'SLOWER'
+                elif ratio < 1 - args.tolerance:
+                    status = 'faster'
+                else:
+                    status = 'ok'
+                failed = failed or status in ('RESULT CHANGED', 'SLOWER')
+            print(f"{name:<26}{result['mean_ms']:>10.2f}{result['min_ms']:>10.2f}{base_text}{ratio_text}  {status}")
+        
+        print(f"스텁 요청 {adapter.requests}회")
+    
+    if args.save:
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({**baseline, **results}, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"기준값 저장: {BASELINE_FILE}")
+    
+    if args.check and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
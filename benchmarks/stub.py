@@ -0,0 +1,126 @@
+"""벤치마크용 오프라인 응답 스텁
+
+공유 HTTP 세션에 FixtureAdapter를 마운트해 네이버 기사/랭킹 페이지와 Claude Messages API
+요청을 benchmarks/fixtures/의 저장된 응답으로 대신함 (네트워크 접근 없음)
+"""
+import io
+import os
+import glob
+import json
+import zlib
+from contextlib import contextmanager
+
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+NAVER_PREFIXES = ('https://n.news.naver.com', 'https://news.naver.com')
+ANTHROPIC_PREFIX = 'https://api.anthropic.com'
+
+# 레이트 리미터를 사실상 끄는 분당 허용량
+UNLIMITED = 1e12
+
+
+def read_fixture(name: str, mode: str = 'r'):
+    """fixtures/ 파일 내용 읽기"""
+    encoding = None if 'b' in mode else 'utf-8'
+    with open(os.path.join(FIXTURE_DIR, name), mode, encoding=encoding) as f:
+        return f.read()
+
+
+class FixtureAdapter(BaseAdapter):
+    """저장된 응답을 돌려주는 requests 어댑터
+    
+    - 랭킹 페이지(/main/ranking/...): ranking.html
+    - 기사 페이지: URL 경로 해시로 article_*.html 중 하나 (같은 URL은 항상 같은 기사)
+    - Claude Messages API: claude_messages.json
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.ranking = read_fixture('ranking.html', 'rb')
+        self.articles = [
+            read_fixture(os.path.basename(path), 'rb')
+            for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, 'article_*.html')))
+        ]
+        self.messages = read_fixture('claude_messages.json', 'rb')
+        self.requests = 0
+    
+    def _body(self, request):
+        if request.url.startswith(ANTHROPIC_PREFIX):
+            return self.messages, 'application/json'
+        if '/main/ranking/' in request.url:
+            return self.ranking, 'text/html; charset=utf-8'
+        index = zlib.crc32(request.path_url.encode('utf-8')) % len(self.articles)
+        return self.articles[index], 'text/html; charset=utf-8'
+    
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        self.requests += 1
+        body, content_type = self._body(request)
+        
+        response = Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = request.url
+        response.request = request
+        response.headers = CaseInsensitiveDict({'Content-Type': content_type, 'Content-Length': str(len(body))})
+        response.encoding = 'utf-8'
+        response.raw = io.BytesIO(body)
+        response.connection = self
+        return response
+    
+    def close(self):
+        pass
+
+
+@contextmanager
+def isolated_state():
+    """반복 측정이 캐시나 레이트 리미터, 하루 예산에 영향을 받지 않는 환경
+    
+    Claude 응답 캐시(항상 미적중), 레이트 리미터, 토큰 기록을 메모리 전용 인스턴스로
+    교체함 (종료 시 원래대로 복구)
+    """
+    from src.utils import cache_utils, rate_limit, token_ledger
+    
+    previous = (cache_utils._cache, rate_limit._limiter, token_ledger._ledger)
+    # ttl이 음수면 저장된 응답도 만료로 처리되어 매번 API 경로를 거침
+    cache_utils._cache = cache_utils.ResponseCache(':memory:', ttl_seconds=-1)
+    rate_limit._limiter = rate_limit.RateLimiter(UNLIMITED, UNLIMITED)
+    token_ledger._ledger = token_ledger.TokenLedger(':memory:', daily_budget=None, hard_limit=None)
+    try:
+        yield
+    finally:
+        cache_utils._cache, rate_limit._limiter, token_ledger._ledger = previous
+
+
+@contextmanager
+def offline():
+    """네트워크 없이 수집/요약 경로를 실행하는 환경
+    
+    공유 세션에 FixtureAdapter를 마운트하고 isolated_state()를 적용함
+    
+    Yields:
+        FixtureAdapter: 요청 수를 확인할 수 있는 어댑터
+    """
+    from src.utils import http_utils
+    
+    session = http_utils.get_session()
+    adapter = FixtureAdapter()
+    previous_adapters = dict(session.adapters)
+    
+    for prefix in NAVER_PREFIXES + (ANTHROPIC_PREFIX,):
+        session.mount(prefix, adapter)
+    os.environ.setdefault('ANTHROPIC_API_KEY', 'benchmark')
+    try:
+        with isolated_state():
+            yield adapter
+    finally:
+        session.adapters.clear()
+        session.adapters.update(previous_adapters)
+
+
+def load_json_fixture(name: str):
+    """fixtures/의 JSON 파일 읽기"""
+    return json.loads(read_fixture(name))
@@ -0,0 +1,32 @@
+from datetime import datetime
+import os
+import sys
+from logging_config import setup_logger, log_execution_time
+from error_handler import error_handler
+
+# 프로젝트 루트를 Python path에 추가 (src 모듈 사용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.pipeline.daily import run_daily_pipeline
+from src.utils import setup_credentials
+
+# 로거 설정
+logger = setup_logger('daily_pipeline')
+start_time = datetime.now()
+
+@error_handler('daily_pipeline', notify_success=True)
+def main():
+    # 복호화된 credentials 생성 (import 시점이 아닌 실행 시점에)
+    setup_credentials(overwrite=True)
+    # 수집 → 점수화 → 요약 → 저장을 한 번에 스트리밍 실행 (단계 사이 cron 간격 없음)
+    logger.info("일일 파이프라인 시작")
+    result = run_daily_pipeline(target_logger=logger)
+    
+    logger.info(f"데이터 저장 완료: {result['output_file']} ({result['articles']}개 기사)")
+    log_execution_time(logger, start_time, 'daily_pipeline')
+    
+    # 콘솔에도 출력
+    print(result['message'])
+
+if __name__ == "__main__":
+    main()
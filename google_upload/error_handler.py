@@ -1,7 +1,14 @@
+import os
+import sys
 import functools
 import traceback
+
+# 프로젝트 루트를 Python path에 추가 (src 모듈 사용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from notification_utils import NotificationManager
 from logging_config import setup_logger
+from src.utils.metrics import get_metrics
 
 def error_handler(script_name, notify_success=True):  # 기본값을 True로 변경
     """에러 처리 데코레이터
@@ -15,13 +22,14 @@ def error_handler(script_name, notify_success=True):  # 기본값을 True로 변
         def wrapper(*args, **kwargs):
             logger = setup_logger(script_name)
             notifier = NotificationManager(script_name)
+            metrics = get_metrics()
             
             try:
                 result = func(*args, **kwargs)
                 
-                # 성공 시 알림 (기본적으로 활성화)
+                # 성공 시 알림 (기본적으로 활성화, 실행 지표 요약 포함)
                 if notify_success:
-                    notifier.send_success_notification(f"{script_name} 실행 완료 ✅")
+                    notifier.send_success_notification(f"{script_name} 실행 완료 ✅", metrics.summary())
                     
                 return result
             except Exception as e:
@@ -34,6 +42,12 @@ def error_handler(script_name, notify_success=True):  # 기본값을 True로 변
                     error_type="ERROR"
                 )
                 raise
+            finally:
+                # 성공/실패와 관계없이 실행 지표를 logs/YYYY-MM/에 저장
+                try:
+                    logger.info(f"실행 지표 저장: {metrics.write_report(script_name)}")
+                except OSError as e:
+                    logger.warning(f"실행 지표 저장 실패: {str(e)}")
                 
         return wrapper
     return decorator
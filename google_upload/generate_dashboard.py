@@ -1,15 +1,31 @@
 # google_upload/generate_dashboard.py 파일
 import os
-import gspread
-from google.oauth2.service_account import Credentials
+import sys
+import json
+import hashlib
 from datetime import datetime
 
+# 프로젝트 루트를 Python path에 추가 (src 모듈 사용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.metrics import get_metrics
+
 # 시트 설정
 SERVICE_ACCOUNT_FILE = 'google_upload/credentials.json'
 SPREADSHEET_ID = '1KBDB7D5sTvCGM-thDkYCnO-2kvsSoQc4RxDGoOO4Rdk'  # 실제 ID로 교체
 SOURCE_SHEET = '요약결과'
 
+# 페이지 변경 기록 (날짜 → 원본 행 해시), 템플릿을 바꾸면 버전을 올려 전체 재생성
+MANIFEST_FILE = 'docs/dashboard_manifest.json'
+TEMPLATE_VERSION = 1
+
 def main():
+    # 페이지 생성 함수만 쓰는 경우(벤치마크 등)에는 Google 라이브러리를 로드하지 않음
+    import gspread
+    from google.oauth2.service_account import Credentials
+    
+    metrics = get_metrics()
+    
     # 구글 시트 연결
     scopes = ['https://www.googleapis.com/auth/spreadsheets']
     credentials = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=scopes)
@@ -20,21 +36,66 @@ def main():
     ws = sh.worksheet(SOURCE_SHEET)
     
     # 헤더 제외한 모든 데이터
-    all_rows = ws.get_all_values()[1:]
+    with metrics.timer('sheets_call'):
+        all_rows = ws.get_all_values()[1:]
     
     # docs 폴더 생성
     os.makedirs("docs", exist_ok=True)
     
-    # 인덱스 페이지 생성
-    create_index_page(all_rows)
-    
-    # 각 날짜별 페이지 생성
+    # 같은 날짜가 여러 행이면 마지막 행 사용 (날짜, 요약, 인사이트가 있는 경우)
+    latest = {}
     for row in all_rows:
-        if len(row) >= 3:  # 날짜, 요약, 인사이트가 있는 경우
-            date, summary, insight = row[0], row[1], row[2]
+        if len(row) >= 3:
+            latest[row[0]] = row
+    
+    # 원본 행이 바뀐 날짜 페이지만 다시 생성
+    manifest = load_manifest()
+    new_manifest = {}
+    rendered = 0
+    for date, row in latest.items():
+        summary, insight = row[1], row[2]
+        safe_date = date.replace("/", "-").replace(".", "-")
+        digest = row_digest(summary, insight)
+        new_manifest[date] = digest
+        if manifest.get(date) == digest and os.path.exists(f"docs/{safe_date}.html"):
+            continue
+        with metrics.timer('dashboard_render'):
             create_date_page(date, summary, insight)
+        rendered += 1
+    
+    # 인덱스 페이지 갱신 (날짜 목록이 바뀐 경우에만 파일이 바뀜)
+    with metrics.timer('dashboard_render'):
+        create_index_page(list(latest.values()))
+    write_if_changed(MANIFEST_FILE, json.dumps(new_manifest, ensure_ascii=False, indent=2, sort_keys=True))
     
-    print("대시보드 생성 완료!")
+    print(f"대시보드 생성 완료! (페이지 {rendered}개 갱신, {len(latest) - rendered}개 유지)")
+    print(f"실행 지표 저장: {metrics.write_report('generate_dashboard')}")
+    print(metrics.summary())
+
+def row_digest(summary, insight):
+    """날짜 페이지 원본(요약, 인사이트)과 템플릿 버전의 해시"""
+    source = json.dumps([TEMPLATE_VERSION, summary, insight], ensure_ascii=False)
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+def load_manifest():
+    """페이지 변경 기록 읽기 (없거나 손상되었으면 빈 dict)"""
+    try:
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_if_changed(path, content):
+    """내용이 다를 때만 파일 저장 (같으면 수정 시각을 유지해 커밋할 변경이 생기지 않음)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    return True
 
 def create_index_page(rows):
     """메인 인덱스 페이지 생성"""
@@ -85,8 +146,7 @@ def create_index_page(rows):
 </html>"""
     
     # 인덱스 파일 저장
-    with open("docs/index.html", "w", encoding="utf-8") as f:
-        f.write(html)
+    write_if_changed("docs/index.html", html)
 
 def create_date_page(date, summary, insight):
     """날짜별 분석 페이지 생성"""
@@ -151,11 +211,12 @@ def create_date_page(date, summary, insight):
     
     # 인사이트 추가
     if insight:
+        insight_html = insight.replace("\n", "<br>")
         html += f"""
     <div class="insight">
         <h2>부동산 인사이트</h2>
         <div class="insight-content">
-            {insight.replace("\n", "<br>")}
+            {insight_html}
         </div>
     </div>
 """
@@ -165,8 +226,7 @@ def create_date_page(date, summary, insight):
 </html>"""
     
     # 파일 저장
-    with open(f"docs/{safe_date}.html", "w", encoding="utf-8") as f:
-        f.write(html)
+    write_if_changed(f"docs/{safe_date}.html", html)
 
 def extract_categories(summary_text):
     """카카오톡 스타일 요약에서 카테고리 정보 추출"""
@@ -1,84 +1,65 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 import os
+import sys
 from logging_config import setup_logger, log_execution_time
 from error_handler import error_handler
 
+# 프로젝트 루트를 Python path에 추가 (src 모듈 사용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.scrapers.news_scraper import collect_candidates, fetch_first_paragraphs
+from src.utils import get_session
+from src.utils.fetch_cache import log_fetch_cache_stats
+from src.utils.metrics import get_metrics
+from src.storage import get_article_store
+from src.scrapers.article_records import make_records, records_to_rows, write_records, render_markdown
+from src.config import NEWS_URL, MIN_ARTICLES_PER_CATEGORY, DAILY_COLLECTION_PER_CATEGORY, WRITE_MARKDOWN
+
 # 로거 설정
 logger = setup_logger('news_scraper')
 start_time = datetime.now()
 
-# 수집 설정
-MAX_COLLECTION_PER_CATEGORY = 30  # 각 카테고리별 최대 수집 개수
-
-keywords = {
-    '부동산': ['서울', '아파트', '부동산', '전세', '재건축', '입주', '실거래', '청약', '분양', '매매', '거래량', '중개업소'],
-    '금리': ['금리', '연준', '인상', '인하', '기준금리', '물가', 'CPI', '물가상승률', '금통위', '채권', '유동성'],
-    '해외주식': ['나스닥', 'S&P', '테슬라', '애플', '엔비디아', '비트코인', 'ETF', '뉴욕증시', 'AI주', '반도체', '미국주식']
-}
-
-def extract_first_paragraph(url):
-    try:
-        res = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-        soup = BeautifulSoup(res.text, 'html.parser')
-        content = soup.select_one("#dic_area")
-        if content:
-            paragraphs = content.get_text(strip=True).split('\n')
-            for p in paragraphs:
-                if len(p.strip()) > 30:
-                    return p.strip()
-        return "본문 추출 실패"
-    except Exception as e:
-        logger.warning(f"URL {url} 처리 중 오류: {str(e)}")
-        return "본문 요청 실패"
-
 logger.info("뉴스 수집 시작")
 
 @error_handler('news_scraper', notify_success=True)  # 성공 알림 받기
 def main():
-    url = "https://news.naver.com/main/ranking/popularDay.naver?mid=etc&sid1=101"
-    res = requests.get(url)
-    soup = BeautifulSoup(res.text, 'html.parser')
-    articles = soup.select('.rankingnews_box a')
-    
-    logger.info(f"총 {len(articles)}개 기사 발견")
+    with get_metrics().timer('ranking_fetch'):
+        res = get_session().get(NEWS_URL)
     
-    results = {k: [] for k in keywords}
-    for article in articles:
-        title = article.text.strip()
-        href = article['href']
-        if not href.startswith("http"):
-            link = "https://news.naver.com" + href
-        else:
-            link = href
+    # 모든 카테고리 키워드를 한 번에 검색해 KEYWORDS 순서상 첫 카테고리로 분류 (src 스크래퍼/파이프라인과 동일)
+    candidates = collect_candidates(res.text, DAILY_COLLECTION_PER_CATEGORY)
+    logger.info(f"총 {sum(len(items) for items in candidates.values())}개 후보 기사 선정")
     
-        for category, words in keywords.items():
-            if any(word in title for word in words):
-                if len(results[category]) < MAX_COLLECTION_PER_CATEGORY:
-                    paragraph = extract_first_paragraph(link)
-                    results[category].append((title, link, paragraph))
-                break
+    # 본문 병렬 수집 (입력 순서 유지)
+    links = [link for items in candidates.values() for _, link in items]
+    logger.info(f"본문 수집 시작: {len(links)}개 기사")
+    paragraphs = iter(fetch_first_paragraphs(links))
+    results = {
+        category: [(title, link, next(paragraphs)) for title, link in items]
+        for category, items in candidates.items()
+    }
     
     # 날짜별 폴더 생성
     today = (datetime.now() + timedelta(hours=9)).strftime('%Y-%m-%d')
     year_month = (datetime.now() + timedelta(hours=9)).strftime('%Y/%m')
     output_dir = f"data/raw/{year_month}"
-    os.makedirs(output_dir, exist_ok=True)
     
-    # 파일 저장
-    output_file = f"{output_dir}/output_{today}.md"
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(f"# 📅 {today} 네이버 경제 키워드 뉴스 요약\n\n")
-        for cat, items in results.items():
-            if len(items) >= 3:
-                logger.info(f"{cat} 카테고리: {len(items)}개 기사 수집")
-                f.write(f"## 📌 {cat}\n\n")
-                # 파일에는 모든 수집된 기사 저장 (30개까지)
-                for i, (title, link, para) in enumerate(items, 1):
-                    f.write(f"{i}. **{title}**\n   - {para}\n   - [기사 링크]({link})\n\n")
+    for cat, items in results.items():
+        if len(items) >= MIN_ARTICLES_PER_CATEGORY:
+            logger.info(f"{cat} 카테고리: {len(items)}개 기사 수집")
+    
+    # 구조화된 레코드(JSONL) 저장 (모든 수집된 기사, 30개까지), Markdown은 보기용
+    records = make_records(today, results, min_items=MIN_ARTICLES_PER_CATEGORY)
+    output_file = f"{output_dir}/output_{today}.jsonl"
+    write_records(output_file, records)
+    if WRITE_MARKDOWN:
+        render_markdown(f"{output_dir}/output_{today}.md", today, records)
+    
+    # 로컬 저장소에 바로 기록 (Google Sheets 동기화는 upload_to_sheets.py가 담당)
+    get_article_store().upsert_articles(records_to_rows(records))
     
     logger.info(f"데이터 저장 완료: {output_file}")
+    log_fetch_cache_stats(logger)
     log_execution_time(logger, start_time, 'news_scraper')
 
 if __name__ == "__main__":
@@ -1,8 +1,13 @@
 import os
-import requests
+import sys
 import json
 from datetime import datetime
 
+# 프로젝트 루트를 Python path에 추가 (src 모듈 사용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.http_utils import get_session
+
 class NotificationManager:
     """알림 관리자"""
     
@@ -46,7 +51,7 @@ class NotificationManager:
         # }
         
         try:
-            response = requests.post(
+            response = get_session().post(
                 self.webhook_url,
                 json=data,
                 headers={'Content-Type': 'application/json'}
@@ -55,8 +60,8 @@ class NotificationManager:
         except Exception as e:
             print(f"알림 전송 실패: {str(e)}")
     
-    def send_success_notification(self, message):
-        """성공 알림 전송"""
+    def send_success_notification(self, message, metrics_summary=None):
+        """성공 알림 전송 (metrics_summary가 있으면 실행 지표 필드 추가)"""
         if not self.webhook_url:
             return
             
@@ -71,9 +76,12 @@ class NotificationManager:
                 }
             }]
         }
+        if metrics_summary:
+            # Discord embed 필드 값은 최대 1024자
+            data["embeds"][0]["fields"] = [{"name": "실행 지표", "value": metrics_summary[:1024]}]
         
         try:
-            requests.post(
+            get_session().post(
                 self.webhook_url,
                 json=data,
                 headers={'Content-Type': 'application/json'}
@@ -1,38 +1,27 @@
 import csv
-import gspread
-import base64
 import os
-from google.oauth2.service_account import Credentials
+import sys
 from datetime import datetime, timedelta
 from logging_config import setup_logger, log_execution_time
 from error_handler import error_handler
 
+# 프로젝트 루트를 Python path에 추가 (src 모듈 사용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.uploaders.sheets_uploader import import_csv_to_store, export_records
+from src.uploaders.sheets_sync import sync_articles
+from src.utils import setup_credentials
+
 # 로거 설정
 logger = setup_logger('upload_to_sheets')
 start_time = datetime.now()
 
-# 복호화 후 credentials.json 파일 생성
-b64_cred = os.environ['GOOGLE_CREDENTIALS']
-os.makedirs("google_upload", exist_ok=True)
-with open("google_upload/credentials.json", "w") as f:
-    f.write(base64.b64decode(b64_cred).decode('utf-8'))
-
-SERVICE_ACCOUNT_FILE = 'google_upload/credentials.json'
-SPREADSHEET_ID = '1KBDB7D5sTvCGM-thDkYCnO-2kvsSoQc4RxDGoOO4Rdk'
-SHEET_NAME = '뉴스요약'
 
 def upload_csv_to_google_sheets(csv_file):
-    scopes = ['https://www.googleapis.com/auth/spreadsheets']
-    credentials = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=scopes)
-    gc = gspread.authorize(credentials)
-    sh = gc.open_by_key(SPREADSHEET_ID)
-    worksheet = sh.worksheet(SHEET_NAME)
-
-    with open(csv_file, newline='', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        next(reader)  # skip header
-        for row in reader:
-            worksheet.append_row(row, value_input_option='RAW')
+    # 로컬 저장소에 반영한 뒤 아직 시트에 없는 행과 변경된 행만 동기화
+    import_csv_to_store(csv_file)
+    synced = sync_articles()
+    logger.info(f"{synced}개 행 동기화")
 
 def convert_md_to_csv(md_file, csv_file):
     with open(md_file, 'r', encoding='utf-8') as md, open(csv_file, 'w', newline='', encoding='utf-8') as csvf:
@@ -57,10 +46,13 @@ def convert_md_to_csv(md_file, csv_file):
 
 @error_handler('upload_to_sheets')
 def main():
+    # 복호화된 credentials 생성 (import 시점이 아닌 실행 시점에)
+    setup_credentials(overwrite=True)
     today = (datetime.now() + timedelta(hours=9)).strftime('%Y-%m-%d')
     year_month = (datetime.now() + timedelta(hours=9)).strftime('%Y/%m')
     
     # 입력 파일 경로 (raw 폴더에서)
+    records_file = f"data/raw/{year_month}/output_{today}.jsonl"
     md_file = f"data/raw/{year_month}/output_{today}.md"
     
     # 출력 파일 경로 (processed 폴더로)
@@ -69,11 +61,21 @@ def main():
     csv_file = f"{csv_dir}/output_{today}.csv"
     
     logger.info("CSV 변환 시작")
-    convert_md_to_csv(md_file, csv_file)
-    logger.info(f"CSV 파일 생성: {csv_file}")
-    
-    logger.info("Google Sheets 업로드 시작")
-    upload_csv_to_google_sheets(csv_file)
+    if os.path.exists(records_file):
+        # 스크래퍼의 구조화된 레코드를 그대로 사용 (Markdown 재파싱 없음)
+        imported = export_records(records_file, csv_file)
+        logger.info(f"CSV 파일 생성: {csv_file} (레코드 {imported}개 신규 반영)")
+        
+        logger.info("Google Sheets 업로드 시작")
+        synced = sync_articles()
+        logger.info(f"{synced}개 행 동기화")
+    else:
+        # JSONL 레코드가 없는 이전 형식의 날짜는 Markdown을 파싱
+        convert_md_to_csv(md_file, csv_file)
+        logger.info(f"CSV 파일 생성: {csv_file}")
+        
+        logger.info("Google Sheets 업로드 시작")
+        upload_csv_to_google_sheets(csv_file)
     logger.info("Google Sheets 업로드 완료")
     
     log_execution_time(logger, start_time, 'upload_to_sheets')
@@ -1,70 +1,45 @@
-import gspread
-from google.oauth2.service_account import Credentials
 from datetime import datetime, timedelta
 from collections import defaultdict
 import os
-import base64
-import requests
+import sys
 from logging_config import setup_logger, log_execution_time
 from error_handler import error_handler
 
+# 프로젝트 루트를 Python path에 추가 (src 모듈 사용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.cache_utils import log_cache_stats
+from src.utils.token_ledger import log_token_usage
+from src.utils.api_utils import generate_weekly_summaries
+from src.storage import get_article_store
+from src.uploaders.sheets_sync import load_articles, sync_weekly
+from src.utils import setup_credentials
+
 # 로거 설정
 logger = setup_logger('weekly_summary')
 start_time = datetime.now()
 
-# 복호화된 credentials 생성
-b64_cred = os.environ['GOOGLE_CREDENTIALS']
-os.makedirs("google_upload", exist_ok=True)
-with open("google_upload/credentials.json", "w") as f:
-    f.write(base64.b64decode(b64_cred).decode('utf-8'))
-
-SERVICE_ACCOUNT_FILE = 'google_upload/credentials.json'
 SPREADSHEET_ID = '1KBDB7D5sTvCGM-thDkYCnO-2kvsSoQc4RxDGoOO4Rdk'
 SOURCE_SHEET = '뉴스요약'
 TARGET_SHEET = '주간요약'
 
 def fetch_week_news():
-    scopes = ['https://www.googleapis.com/auth/spreadsheets']
-    credentials = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=scopes)
-    gc = gspread.authorize(credentials)
-    sh = gc.open_by_key(SPREADSHEET_ID)
-    ws = sh.worksheet(SOURCE_SHEET)
-    rows = ws.get_all_values()[1:]
-
+    # 최근 7일 (로컬 저장소 우선, 저장소에 없는 날짜만 시트 조회)
     today = datetime.now() + timedelta(hours=9)
     week_dates = [(today - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(7)]
-    filtered = [r for r in rows if r[0] in week_dates and "본문 추출 실패" not in r[3]]
-    return filtered, sh
+    return load_articles(week_dates)
 
-def get_weekly_summary(texts):
-    prompt = f"""아래는 이번 주의 주요 경제 뉴스 기사들입니다. 이 내용을 요약하여 아파트 투자자 입장에서 의미 있는 인사이트를 제시해주세요.
-    
-{texts}
-
-요약:"""
-
-    headers = {
-        "x-api-key": os.environ['ANTHROPIC_API_KEY'],
-        "anthropic-version": "2023-06-01",
-        "Content-Type": "application/json",
-    }
-    data = {
-        "model": "claude-3-haiku-20240307",
-        "max_tokens": 500,
-        "temperature": 0.5,
-        "messages": [{"role": "user", "content": prompt}]
-    }
-
-    try:
-        response = requests.post("https://api.anthropic.com/v1/messages", headers=headers, json=data)
-        return response.json()["content"][0]["text"].strip()
-    except:
-        return "요약 실패"
+def get_weekly_summaries(text_blocks):
+    """카테고리별 주간 요약을 동시에 생성"""
+    summaries = generate_weekly_summaries(text_blocks)
+    return ["요약 실패" if summary.startswith("API") else summary for summary in summaries]
 
 @error_handler('weekly_summary')
 def main():
+    # 복호화된 credentials 생성 (import 시점이 아닌 실행 시점에)
+    setup_credentials(overwrite=True)
     logger.info("주간 요약 생성 시작")
-    rows, sh = fetch_week_news()
+    rows = fetch_week_news()
     if not rows:
         logger.warning("이번 주 데이터 없음")
         print("이번 주 데이터 없음")
@@ -79,22 +54,19 @@ def main():
     weekly_output = [f"📅 {today} 주간 경제 뉴스 요약\n"]
     
     logger.info("카테고리별 인사이트 생성")
-    for cat, texts in grouped.items():
-        joined = "\n\n".join(texts[:5])
-        insight = get_weekly_summary(joined)
+    categories = list(grouped)
+    insights = get_weekly_summaries(["\n\n".join(grouped[cat][:5]) for cat in categories])
+    for cat, insight in zip(categories, insights):
         weekly_output.append(f"📌 {cat} 인사이트\n{insight}\n")
 
     output_text = "\n\n".join(weekly_output)
 
-    logger.info("Google Sheets에 저장")
-    try:
-        ws = sh.worksheet(TARGET_SHEET)
-    except:
-        ws = sh.add_worksheet(title=TARGET_SHEET, rows="100", cols="2")
-        ws.append_row(["날짜", "요약"])
-    
-    ws.append_row([today, output_text], value_input_option='RAW')
+    logger.info("로컬 저장소 및 Google Sheets에 저장")
+    get_article_store().save_insight(today, 'weekly', output_text)
+    sync_weekly()
     logger.info("주간 요약 저장 완료")
+    log_cache_stats(logger)
+    log_token_usage(logger)
     log_execution_time(logger, start_time, 'weekly_summary')
     
     print(output_text)
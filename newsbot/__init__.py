@@ -0,0 +1,29 @@
+# Newsbot Package
+
+from .stages import (
+    Stage,
+    STAGES,
+    get_stage,
+    load_stage,
+    run_stage
+)
+
+from .importtime import (
+    ImportEntry,
+    parse_importtime,
+    measure_stage
+)
+
+__all__ = [
+    # stages
+    'Stage',
+    'STAGES',
+    'get_stage',
+    'load_stage',
+    'run_stage',
+    
+    # importtime
+    'ImportEntry',
+    'parse_importtime',
+    'measure_stage'
+]
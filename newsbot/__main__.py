@@ -0,0 +1,59 @@
+"""단일 실행 진입점
+
+    python -m newsbot <단계> [단계 인자...]
+    python -m newsbot --list
+    python -m newsbot importtime [단계 ...] [--top 8]
+
+선택한 단계가 필요로 하는 모듈만 import하며, importtime은 각 단계를 새 인터프리터에서
+`-X importtime`으로 import만 해 보고 누적 import 시간과 무거운 의존성 로드 여부를 출력함
+"""
+import sys
+import argparse
+
+from newsbot.stages import STAGES, run_stage
+
+
+def print_stages():
+    """단계 목록 출력"""
+    width = max(len(name) for name in STAGES)
+    for name, stage in STAGES.items():
+        print(f"{name:<{width}}  {stage.description}")
+
+
+def report_importtime(argv):
+    """단계별 import 시간 출력"""
+    from newsbot.importtime import measure_stage
+    
+    parser = argparse.ArgumentParser(prog="python -m newsbot importtime", description="단계별 cold start import 시간")
+    parser.add_argument("stages", nargs="*", default=None, help="측정할 단계 (기본값: 전체)")
+    parser.add_argument("--top", type=int, default=8, help="단계별로 출력할 누적 시간 상위 모듈 수")
+    args = parser.parse_args(argv)
+    
+    for name in args.stages or STAGES:
+        result = measure_stage(name, top=args.top)
+        heavy = ', '.join(result['heavy']) or '-'
+        print(f"{name}: {result['total_ms']:.1f}ms (무거운 의존성: {heavy})")
+        for module, ms in result['top']:
+            print(f"    {ms:>8.1f}ms  {module}")
+
+
+def main():
+    argv = sys.argv[1:]
+    if not argv or argv[0] in ('-h', '--help', '--list'):
+        print(__doc__.strip() + "\n")
+        print_stages()
+        return
+    
+    if argv[0] == 'importtime':
+        report_importtime(argv[1:])
+        return
+    
+    if argv[0] not in STAGES:
+        print(f"알 수 없는 단계: {argv[0]}\n", file=sys.stderr)
+        print_stages()
+        sys.exit(2)
+    run_stage(argv[0], argv[1:])
+
+
+if __name__ == "__main__":
+    main()
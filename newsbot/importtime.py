@@ -0,0 +1,77 @@
+import sys
+import subprocess
+from typing import Dict, List, NamedTuple
+
+from .stages import PROJECT_ROOT, get_stage
+
+# 시작 시간에 크게 영향을 주는 외부 의존성 (로드 여부를 따로 표시)
+HEAVY_MODULES = ('gspread', 'google.oauth2', 'google.auth', 'requests', 'numpy', 'selectolax', 'bs4', 'lxml')
+
+
+class ImportEntry(NamedTuple):
+    """-X importtime 출력 한 줄"""
+    name: str
+    depth: int              # 중첩 깊이 (0: 직접 import한 모듈)
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> List[ImportEntry]:
+    """`python -X importtime` 표준 오류 출력 파싱
+    
+    Args:
+        output: "import time: self [us] | cumulative | imported package" 형식의 출력
+    
+    Returns:
+        List[ImportEntry]: 출력 순서대로의 import 기록
+    """
+    entries = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue    # 머리글 행
+        package = fields[2].rstrip()
+        name = package.lstrip()
+        depth = (len(package) - len(name) - 1) // 2
+        entries.append(ImportEntry(name, depth, int(fields[0]), int(fields[1])))
+    return entries
+
+
+def measure_stage(name: str, top: int = 8) -> Dict:
+    """새 인터프리터에서 단계를 import만 하고 import 시간 측정
+    
+    Args:
+        name: 단계 이름
+        top: 함께 반환할 누적 시간 상위 모듈 수
+    
+    Returns:
+        Dict: total_ms(단계가 import한 모듈의 누적 시간), top([(모듈, ms)]), heavy(로드된 무거운 의존성)
+    """
+    get_stage(name)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import newsbot; newsbot.load_stage({name!r})"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()
+        raise RuntimeError(f"{name} 단계 import 실패: {error[-1] if error else result.returncode}")
+    
+    entries = parse_importtime(result.stderr)
+    # 인터프리터 시작과 newsbot 자체 import 이후에 기록된 것만 단계의 import로 봄
+    start = next(index for index, entry in enumerate(entries) if entry.depth == 0 and entry.name == 'newsbot') + 1
+    entries = entries[start:]
+    roots = [entry for entry in entries if entry.depth == 0]
+    loaded = {entry.name for entry in entries}
+    return {
+        'stage': name,
+        'total_ms': sum(entry.cumulative_us for entry in roots) / 1000,
+        'top': [
+            (entry.name, entry.cumulative_us / 1000)
+            for entry in sorted(roots, key=lambda entry: entry.cumulative_us, reverse=True)[:top]
+        ],
+        'heavy': [module for module in HEAVY_MODULES if module in loaded]
+    }
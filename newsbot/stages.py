@@ -0,0 +1,93 @@
+import os
+import sys
+import runpy
+import importlib
+from typing import Dict, NamedTuple, Sequence
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT_DIR = os.path.join(PROJECT_ROOT, 'google_upload')
+
+
+class Stage(NamedTuple):
+    """실행 단계"""
+    target: str         # src 모듈 이름 또는 google_upload 스크립트 파일 이름 (.py)
+    description: str
+    
+    @property
+    def is_script(self) -> bool:
+        return self.target.endswith('.py')
+
+
+# 단계 이름 → 실행 대상 (DAG 단계 이름과 같게 유지)
+STAGES: Dict[str, Stage] = {
+    'scraper': Stage('src.scrapers.news_scraper', "랭킹 기사 수집"),
+    'uploader': Stage('src.uploaders.sheets_uploader', "CSV 변환 및 뉴스요약 시트 동기화 (--rebuild-index)"),
+    'daily_summary': Stage('src.processors.daily_summary', "카테고리별 일일 요약"),
+    'real_estate_insight': Stage('src.processors.real_estate_insight', "부동산 인사이트 생성"),
+    'weekly_summary': Stage('src.processors.weekly_summary', "주간 요약"),
+    'dashboard': Stage('generate_dashboard.py', "대시보드 HTML 생성"),
+    'pipeline': Stage('src.pipeline.daily', "수집 → 점수화 → 요약 → 저장 스트리밍 실행 (--no-summary, --no-sync)"),
+    'dag': Stage('src.pipeline.dag', "입력이 바뀐 단계만 실행 (--only, --weekly, --force, --dry-run)"),
+    'backfill': Stage('src.processors.backfill', "보관 데이터 기간 재처리 (--start, --end, --summarize, --sync)"),
+    'rescore': Stage('src.processors.batch_scoring', "보관된 CSV 일괄 재점수화"),
+    'sync': Stage('src.uploaders.sheets_sync', "로컬 저장소 → Google Sheets 동기화 (--restore: 시트로 저장소 복원)"),
+    # 알림과 실행 지표 저장(error_handler)을 포함한 래퍼 (GitHub Actions용)
+    'daily_pipeline': Stage('daily_pipeline.py', "일일 파이프라인 래퍼 (news.yml)"),
+    'weekly_report': Stage('weekly_summary.py', "주간 요약 래퍼 (weekly_summary.yml)")
+}
+
+
+def get_stage(name: str) -> Stage:
+    """이름으로 단계 찾기
+    
+    Args:
+        name: 단계 이름
+    
+    Returns:
+        Stage: 실행 단계
+    """
+    if name not in STAGES:
+        raise ValueError(f"알 수 없는 단계: {name} (사용 가능: {', '.join(STAGES)})")
+    return STAGES[name]
+
+
+def _prepare_path(stage: Stage) -> None:
+    """src 패키지와 google_upload 스크립트의 import 경로 추가"""
+    for path in (PROJECT_ROOT, SCRIPT_DIR) if stage.is_script else (PROJECT_ROOT,):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+
+def load_stage(name: str) -> None:
+    """단계를 실행하지 않고 import만 수행 (import 시간 측정용)
+    
+    Args:
+        name: 단계 이름
+    """
+    stage = get_stage(name)
+    _prepare_path(stage)
+    if stage.is_script:
+        # __main__이 아닌 이름으로 실행하면 main() 호출 없이 모듈 본문만 실행됨
+        runpy.run_path(os.path.join(SCRIPT_DIR, stage.target), run_name=f"newsbot.{name}")
+    else:
+        importlib.import_module(stage.target)
+
+
+def run_stage(name: str, argv: Sequence[str] = ()) -> None:
+    """단계 하나를 `python <스크립트>` / `python -m <모듈>`과 같은 방식으로 실행
+    
+    선택한 단계가 import하는 모듈만 로드됨
+    
+    Args:
+        name: 단계 이름
+        argv: 단계에 넘길 명령행 인자
+    """
+    stage = get_stage(name)
+    _prepare_path(stage)
+    if stage.is_script:
+        path = os.path.join(SCRIPT_DIR, stage.target)
+        sys.argv = [path, *argv]
+        runpy.run_path(path, run_name='__main__')
+    else:
+        sys.argv = [stage.target, *argv]
+        runpy.run_module(stage.target, run_name='__main__', alter_sys=True)
@@ -5,12 +5,45 @@ SPREADSHEET_ID = '1KBDB7D5sTvCGM-thDkYCnO-2kvsSoQc4RxDGoOO4Rdk'
 SOURCE_SHEET = '뉴스요약'
 TARGET_SHEET = '요약결과'
 WEEKLY_SHEET = '주간요약'
+DATE_INDEX_SHEET = '날짜색인'  # 시트별 날짜 → 행 범위 색인
+SHEETS_BATCH_SIZE = 500  # 한 번의 요청으로 추가할 최대 행 수
+SHEETS_MAX_RETRIES = 5  # 할당량 초과(429) 및 서버 오류 시 재시도 횟수
+SHEETS_UPSERT_MODE = True  # 동기화 전 시트의 키 열((날짜, 링크) 또는 날짜)을 읽어 기존 행은 수정, 없는 행만 추가
 
 # API Configuration
 ANTHROPIC_MODELS = {
     'haiku': 'claude-3-haiku-20240307',
     'sonnet': 'claude-3-sonnet-20240229'
 }
+ANTHROPIC_API_URL = 'https://api.anthropic.com'  # ANTHROPIC_API_URL 환경변수로 대체 서버 지정 (예: src.fakes 로컬 서버)
+SHEETS_API_URL = 'https://sheets.googleapis.com'  # SHEETS_API_URL 환경변수로 대체 서버 지정 (인증 없이 요청)
+SUMMARY_BATCH_MODE = True  # 카테고리별 기사 요약을 한 번의 API 호출로 처리
+PROMPT_TEMPLATE_VERSION = 1  # 프롬프트 템플릿 변경 시 증가 (캐시 무효화)
+CLAUDE_MAX_CONCURRENCY = 4  # 동시 API 요청 수
+CLAUDE_REQUESTS_PER_MINUTE = 50  # 분당 요청 수 제한
+CLAUDE_TOKENS_PER_MINUTE = 40000  # 분당 토큰 수 제한 (입력 + 출력 추정치)
+CLAUDE_BACKOFF_BASE = 1.0  # 재시도 백오프 기본 대기 시간 (초)
+CLAUDE_BACKOFF_MAX = 30.0  # 재시도 백오프 최대 대기 시간 (초)
+CLAUDE_PRICING = {  # 모델별 100만 토큰당 가격 (USD, 입력/출력)
+    'claude-3-haiku-20240307': (0.25, 1.25),
+    'claude-3-sonnet-20240229': (3.0, 15.0)
+}
+TOKEN_LEDGER_PATH = 'data/cache/token_ledger.sqlite3'  # Claude 호출별 토큰/비용 기록
+CLAUDE_DAILY_BUDGET_USD = 1.0  # 하루(KST) 비용이 이 값에 도달하면 남은 호출은 저렴한 모델로 전환 (None이면 제한 없음)
+CLAUDE_DAILY_HARD_LIMIT_USD = 2.0  # 이 값에 도달하면 API를 호출하지 않고 로컬 대체 결과 사용
+CLAUDE_BUDGET_FALLBACK_MODEL = ANTHROPIC_MODELS['haiku']  # 예산 초과 시 사용할 모델
+
+# HTTP Configuration
+REQUEST_TIMEOUT = 10  # HTTP 요청 기본 타임아웃 (초)
+HTTP_MAX_RETRIES = 3  # 연결 오류 및 5xx 응답 재시도 횟수
+HTTP_BACKOFF_FACTOR = 0.5  # 재시도 간 지수 백오프 계수 (초)
+HTTP_DEFAULT_POOL_SIZE = 4  # 호스트별 기본 커넥션 풀 크기
+HTTP_POOL_SIZES = {
+    'https://n.news.naver.com': 8,
+    'https://news.naver.com': 8,
+    'https://api.anthropic.com': 4,
+    'https://discord.com': 1
+}
 
 # Scraper Configuration
 NEWS_URL = "https://news.naver.com/main/ranking/popularDay.naver?mid=etc&sid1=101"
@@ -19,9 +52,112 @@ KEYWORDS = {
     '금리': ['금리', '연준', '인상', '인하', '기준금리', '물가', 'CPI', '물가상승률', '금통위', '채권', '유동성'],
     '해외주식': ['나스닥', 'S&P', '테슬라', '애플', '엔비디아', '비트코인', 'ETF', '뉴욕증시', 'AI주', '반도체', '미국주식']
 }
+MAX_COLLECTION_PER_CATEGORY = 10  # 각 카테고리별 최대 수집 개수
+DAILY_COLLECTION_PER_CATEGORY = 30  # 일일 파이프라인(news.yml)의 카테고리별 최대 수집 개수 (google_upload/news_scraper.py와 동일)
+SCRAPER_MAX_WORKERS = 8  # 본문 병렬 수집 워커 수
+SCRAPER_PER_HOST_LIMIT = 4  # 호스트별 동시 요청 수 제한
+HTML_PARSER_BACKEND = 'auto'  # 'auto'(selectolax > lxml > bs4), 'selectolax', 'lxml', 'bs4'
+HTML_PARSER_STREAMING = False  # 기사 본문 영역을 읽는 즉시 다운로드를 멈추는 스트리밍 파서 사용
+MIN_ARTICLES_PER_CATEGORY = 3  # 이보다 적게 수집된 카테고리는 저장하지 않음
+WRITE_MARKDOWN = True  # JSONL 레코드와 함께 사람이 읽는 Markdown 파일도 생성
+
+# Filter Configuration
+# 투자 관련 핵심 키워드와 가중치
+INVESTMENT_KEYWORDS = {
+    # 직접적 투자 키워드 (높은 가중치)
+    '수익률': 10,
+    '투자': 9,
+    '매매': 8,
+    '시세': 8,
+    '가격': 7,
+    '상승': 6,
+    '하락': 6,
+    '수익': 7,
+    '손실': 6,
+    
+    # 간접적 투자 키워드 (중간 가중치)
+    '전망': 5,
+    '분석': 5,
+    '예상': 4,
+    '변동': 4,
+    '공급': 4,
+    '수요': 4,
+    
+    # 자산 유형 키워드 (기본 가중치)
+    '부동산': 3,
+    '주식': 3,
+    '채권': 3,
+    '금': 3,
+    '달러': 3,
+    '환율': 3
+}
+
+# 블랙리스트 키워드 - 이 키워드가 포함된 뉴스는 제외
+BLACKLIST_KEYWORDS = [
+    '성매매', '성병', '성범죄', '마약', '살인', '폭행',
+    '절도', '사기', '도박', '성폭행', '성추행', '아동',
+    '음란', '불법', '구속', '체포', '혐의', '기소'
+]
+
+# 최소 투자 관련성 점수
+MINIMUM_INVESTMENT_SCORE = 10
+
+# 종합 점수 가중치
+SCORE_WEIGHTS = {
+    'investment': 0.5,  # 투자 관련성
+    'category': 0.3,    # 카테고리 특화
+    'recency': 0.2,     # 최신성 (수집 순서)
+    'sources': 1.0      # 같은 기사를 다룬 추가 언론사 수
+}
+
+# 유사 기사 묶기 (MinHash + LSH)
+DEDUP_ENABLED = True
+DEDUP_SHINGLE_SIZE = 3  # 문자 n-gram 길이
+DEDUP_NUM_PERM = 64  # MinHash 서명 길이
+DEDUP_BANDS = 16  # LSH 구간 수 (구간당 4개 값, 약 0.5 유사도부터 후보로 잡힘)
+DEDUP_THRESHOLD = 0.5  # 같은 기사로 볼 최소 자카드 유사도
+DEDUP_CONTENT_CHARS = 200  # 비교에 사용하는 본문 앞부분 길이
+
+# 카테고리별 특화 키워드
+CATEGORY_KEYWORDS = {
+    '부동산': {
+        '강남': 5, '재건축': 5, '분양가': 4, 
+        '입주물량': 4, '거래량': 4, '규제완화': 5,
+        '청약': 4, '대출': 3, '금리': 4
+    },
+    '금리': {
+        '기준금리': 5, '인하': 4, '인상': 4,
+        '연준': 5, '한은': 5, '통화정책': 4,
+        '물가': 4, 'CPI': 4, '경기': 4
+    },
+    '해외주식': {
+        '나스닥': 4, 'S&P': 4, '실적': 5,
+        '배당': 5, 'ETF': 4, '환율': 4,
+        '테슬라': 3, '애플': 3, '엔비디아': 3
+    }
+}
+
+# Pipeline Configuration
+PIPELINE_QUEUE_SIZE = 16  # 단계 사이 큐의 최대 대기 항목 수 (가득 차면 앞 단계가 대기)
+PIPELINE_STATE_PATH = 'data/pipeline_state.json'  # DAG 단계별 입력/출력 지문 (입력이 같으면 단계 건너뜀)
+PIPELINE_MAX_PARALLEL = 3  # DAG에서 동시에 실행할 독립 단계 수
 
 # Data Configuration
 DATA_DIR = 'data'
 RAW_DATA_DIR = 'data/raw'
 PROCESSED_DATA_DIR = 'data/processed'
 LOG_DIR = 'logs'
+CACHE_DIR = 'data/cache'
+ARTICLE_DB_PATH = 'data/news.sqlite3'  # 로컬 기사/요약 저장소 (Google Sheets는 동기화 대상)
+BACKFILL_DIR = 'data/backfill'  # 백필 날짜별 체크포인트
+
+# Cache Configuration
+CLAUDE_CACHE_ENABLED = True
+CLAUDE_CACHE_PATH = 'data/cache/claude_responses.sqlite3'
+CLAUDE_CACHE_TTL_DAYS = 30  # 캐시 항목 유효 기간
+CLAUDE_CACHE_MAX_ENTRIES = 5000  # 초과 시 가장 오래 사용되지 않은 항목부터 삭제
+FETCH_CACHE_ENABLED = True
+FETCH_CACHE_PATH = 'data/cache/article_pages.sqlite3'
+FETCH_CACHE_MAX_AGE_DAYS = 14  # 마지막 검증 후 이 기간이 지나면 삭제
+FETCH_CACHE_FRESH_HOURS = 24  # 이 시간 안에 검증된 항목은 요청 없이 사용
+URL_TRACKING_PARAMS = ('ntype', 'rc', 'cds', 'ref', 'referer', 'from', 'ntype_ref')  # 캐시 키에서 제거할 쿼리 파라미터
@@ -0,0 +1,64 @@
+# Fakes Package
+
+import os
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .server import FakeServer, FaultConfig
+from .anthropic import FakeAnthropicServer, default_responder, start_fake_anthropic
+from .sheets import FakeSheetsServer, parse_range, start_fake_sheets
+
+# 가짜 서버를 가리키도록 바꾸는 환경변수 (src.utils.api_utils / sheets_utils가 호출 시점에 읽음)
+FAKE_ENV = ('ANTHROPIC_API_URL', 'ANTHROPIC_API_KEY', 'SHEETS_API_URL')
+
+
+@contextmanager
+def fake_apis(
+    anthropic: Optional[FaultConfig] = None,
+    sheets: Optional[FaultConfig] = None,
+    spreadsheets: Optional[Dict[str, Dict[str, List[List]]]] = None
+) -> Iterator[Tuple[FakeAnthropicServer, FakeSheetsServer]]:
+    """가짜 Anthropic/Sheets 서버를 띄우고 기존 모듈이 그 서버를 사용하도록 설정
+    
+    ANTHROPIC_API_URL, SHEETS_API_URL 환경변수를 서버 주소로 바꾸고 Sheets 클라이언트
+    캐시를 비움. 종료 시 환경변수와 캐시를 원래대로 되돌림
+    
+    Args:
+        anthropic: Anthropic 서버 지연/오류 설정
+        sheets: Sheets 서버 지연/오류/할당량 설정
+        spreadsheets: Sheets 초기 데이터 {문서 ID: {시트 이름: 행 리스트}}
+    
+    Yields:
+        Tuple[FakeAnthropicServer, FakeSheetsServer]: 실행 중인 서버들
+    """
+    from src.utils.sheets_utils import invalidate_sheets_cache
+    
+    previous = {name: os.environ.get(name) for name in FAKE_ENV}
+    with FakeAnthropicServer(anthropic or FaultConfig()) as claude, \
+            FakeSheetsServer(sheets or FaultConfig(), spreadsheets) as sheets_server:
+        os.environ['ANTHROPIC_API_URL'] = claude.url
+        os.environ['SHEETS_API_URL'] = sheets_server.url
+        os.environ.setdefault('ANTHROPIC_API_KEY', 'fake-key')
+        invalidate_sheets_cache()
+        try:
+            yield claude, sheets_server
+        finally:
+            for name, value in previous.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+            invalidate_sheets_cache()
+
+
+__all__ = [
+    'FakeServer',
+    'FaultConfig',
+    'FakeAnthropicServer',
+    'default_responder',
+    'start_fake_anthropic',
+    'FakeSheetsServer',
+    'parse_range',
+    'start_fake_sheets',
+    'fake_apis'
+]
@@ -0,0 +1,111 @@
+import json
+import re
+from typing import Callable, Dict, Optional
+
+from .server import FakeServer, FaultConfig, Reply, Request
+
+# 상태 코드별 Anthropic 오류 type
+ERROR_TYPES = {
+    400: 'invalid_request_error',
+    401: 'authentication_error',
+    404: 'not_found_error',
+    429: 'rate_limit_error',
+    500: 'api_error',
+    529: 'overloaded_error'
+}
+
+# 배치 요약 프롬프트의 기사 목록 JSON (api_utils.build_category_batch_prompt 형식)
+BATCH_ARTICLES = re.compile(r'기사 목록\(JSON\):\s*(\[.*?\])\s*\n', re.S)
+
+
+def default_responder(body: Dict) -> str:
+    """요청 본문으로 결정적인 응답 텍스트 생성
+    
+    배치 요약 프롬프트에는 기사 id별 JSON을, 그 외에는 프롬프트 첫 줄 일부를 돌려줌
+    
+    Args:
+        body: Messages API 요청 본문
+    
+    Returns:
+        str: 응답 텍스트
+    """
+    prompt = body['messages'][-1]['content']
+    if not isinstance(prompt, str):
+        prompt = ''.join(block.get('text', '') for block in prompt)
+    
+    match = BATCH_ARTICLES.search(prompt)
+    if match:
+        articles = json.loads(match.group(1))
+        return json.dumps({
+            'trend': '가짜 응답 트렌드',
+            'items': [
+                {'id': article['id'], 'title': article['title'][:25], 'summary': article['content'][:20]}
+                for article in articles
+            ]
+        }, ensure_ascii=False)
+    
+    first_line = next((line.strip() for line in prompt.splitlines() if line.strip()), '')
+    return f"가짜 응답: {first_line[:30]}"
+
+
+class FakeAnthropicServer(FakeServer):
+    """Anthropic Messages API(POST /v1/messages) 가짜 서버
+    
+    x-api-key 헤더와 model/max_tokens/messages 필드를 확인하고, responder가 만든 텍스트와
+    글자 수 기반 usage를 반환함. 오류 응답은 실제 API와 같은 {"type": "error", ...} 형식
+    """
+    
+    def __init__(
+        self,
+        faults: FaultConfig = FaultConfig(),
+        responder: Callable[[Dict], str] = default_responder,
+        **kwargs
+    ):
+        super().__init__(faults, **kwargs)
+        self.responder = responder
+    
+    def error_body(self, status: int, message: str) -> Dict:
+        return {'type': 'error', 'error': {'type': ERROR_TYPES.get(status, 'api_error'), 'message': message}}
+    
+    def endpoint(self, request: Request) -> str:
+        return request.path
+    
+    def handle(self, request: Request) -> Reply:
+        if request.method != 'POST' or request.path != '/v1/messages':
+            return 404, self.error_body(404, f"Not found: {request.method} {request.path}"), {}
+        if not request.headers.get('x-api-key'):
+            return 401, self.error_body(401, "x-api-key header is required"), {}
+        
+        body = request.body or {}
+        missing = [field for field in ('model', 'max_tokens', 'messages') if not body.get(field)]
+        if missing:
+            return 400, self.error_body(400, f"Missing fields: {', '.join(missing)}"), {}
+        
+        text = self.responder(body)
+        prompt_chars = sum(len(json.dumps(message, ensure_ascii=False)) for message in body['messages'])
+        return 200, {
+            'id': f"msg_fake_{self.requests}",
+            'type': 'message',
+            'role': 'assistant',
+            'model': body['model'],
+            'content': [{'type': 'text', 'text': text}],
+            'stop_reason': 'end_turn',
+            'usage': {
+                # 한국어는 대략 글자당 1토큰 미만이므로 글자 수의 절반으로 근사
+                'input_tokens': max(1, prompt_chars // 2),
+                'output_tokens': min(body['max_tokens'], max(1, len(text) // 2))
+            }
+        }, {}
+
+
+def start_fake_anthropic(faults: Optional[FaultConfig] = None, **kwargs) -> FakeAnthropicServer:
+    """가짜 Anthropic 서버를 만들어 시작
+    
+    Args:
+        faults: 지연/오류 설정 (기본값: 없음)
+        **kwargs: FakeAnthropicServer 인자 (responder, host, port)
+    
+    Returns:
+        FakeAnthropicServer: 실행 중인 서버
+    """
+    return FakeAnthropicServer(faults or FaultConfig(), **kwargs).start()
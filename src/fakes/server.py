@@ -0,0 +1,218 @@
+import json
+import math
+import random
+import logging
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+logger = logging.getLogger(__name__)
+
+# 핸들러 반환값: (상태 코드, JSON 본문, 추가 헤더)
+Reply = Tuple[int, Dict, Dict[str, str]]
+
+
+class FaultConfig(NamedTuple):
+    """가짜 서버의 지연/오류/할당량 설정"""
+    latency: float = 0.0                    # 모든 요청에 더하는 지연 (초)
+    jitter: float = 0.0                     # 0~jitter초 사이 무작위 추가 지연
+    error_rate: float = 0.0                 # error_statuses 중 하나로 실패시킬 확률
+    error_statuses: Tuple[int, ...] = (500,)
+    retry_after: Optional[float] = None     # 429/503 응답의 Retry-After 헤더 (초, 할당량 초과 시 기본값: 구간 남은 시간)
+    quota_per_minute: Optional[int] = None  # 구간 내 허용 요청 수 (초과 시 429)
+    quota_window: float = 60.0              # 할당량 구간 (초)
+    seed: Optional[int] = None              # 오류 주입 난수 시드 (재현용)
+
+
+class Request(NamedTuple):
+    """파싱된 요청"""
+    method: str
+    path: str                       # 퍼센트 디코딩된 경로
+    query: Dict[str, list]
+    headers: Dict[str, str]
+    body: Optional[Dict]
+
+
+class FakeServer:
+    """스레드에서 실행되는 로컬 HTTP 가짜 서버 (지연, 오류 주입, 할당량 지원)
+    
+    하위 클래스는 handle(request)에서 Reply를 반환하고, error_body(status)로
+    각 API 형식의 오류 본문을 만듦. with 문으로 사용하면 시작/종료가 자동으로 처리됨
+    """
+    
+    def __init__(self, faults: FaultConfig = FaultConfig(), host: str = '127.0.0.1', port: int = 0):
+        self.faults = faults
+        self.host = host
+        self.port = port
+        self._random = random.Random(faults.seed)
+        self._forced = deque()          # fail_next로 예약한 상태 코드
+        self._window = deque()          # 할당량 구간 내 요청 시각
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self.reset_stats()
+    
+    @property
+    def url(self) -> str:
+        """서버 기본 URL (start 이후 사용)"""
+        return f"http://{self.host}:{self.port}"
+    
+    def start(self) -> 'FakeServer':
+        """백그라운드 스레드에서 서버 시작"""
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            
+            def _serve(self):
+                server._serve(self)
+            
+            do_GET = do_POST = do_PUT = do_DELETE = _serve
+            
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+        
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name=type(self).__name__, daemon=True)
+        self._thread.start()
+        logger.info(f"{type(self).__name__} 시작: {self.url}")
+        return self
+    
+    def stop(self) -> None:
+        """서버 종료"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+    
+    def __enter__(self) -> 'FakeServer':
+        return self.start()
+    
+    def __exit__(self, *exc) -> None:
+        self.stop()
+    
+    def fail_next(self, *statuses: int) -> None:
+        """다음 요청들을 지정한 상태 코드로 차례로 실패시킴 (재시도 동작 확인용)"""
+        with self._lock:
+            self._forced.extend(statuses)
+    
+    def reset_stats(self) -> None:
+        """요청 통계 초기화"""
+        with self._lock:
+            self.requests = 0
+            self.errors = Counter()         # 주입한 오류 상태 코드별 횟수
+            self.endpoints = Counter()      # 엔드포인트별 요청 수
+            self.in_flight = 0
+            self.max_in_flight = 0
+    
+    def stats(self) -> Dict:
+        """요청 통계
+        
+        Returns:
+            Dict: requests, errors(상태 코드별), endpoints, max_in_flight(최대 동시 처리 수)
+        """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'errors': dict(self.errors),
+                'endpoints': dict(self.endpoints),
+                'max_in_flight': self.max_in_flight
+            }
+    
+    def handle(self, request: Request) -> Reply:
+        """요청 처리 (하위 클래스에서 구현)"""
+        raise NotImplementedError
+    
+    def endpoint(self, request: Request) -> str:
+        """통계용 엔드포인트 이름 (기본값: 메서드와 경로)"""
+        return f"{request.method} {request.path}"
+    
+    def error_body(self, status: int, message: str) -> Dict:
+        """오류 응답 본문 (하위 클래스에서 API 형식에 맞게 재정의)"""
+        return {'error': {'code': status, 'message': message}}
+    
+    def _injected_fault(self) -> Optional[Reply]:
+        """예약된 실패, 할당량 초과, 무작위 오류 중 해당하는 응답 (없으면 None)"""
+        faults = self.faults
+        now = time.monotonic()
+        with self._lock:
+            if self._forced:
+                status = self._forced.popleft()
+            elif faults.quota_per_minute is not None and self._quota_exceeded(now):
+                self.errors[429] += 1
+                if faults.retry_after is not None:
+                    retry_after = f"{faults.retry_after:g}"
+                else:
+                    retry_after = f"{max(1, math.ceil(self._window[0] + faults.quota_window - now))}"
+                return 429, self.error_body(429, "Quota exceeded"), {'Retry-After': retry_after}
+            elif faults.error_rate and self._random.random() < faults.error_rate:
+                status = self._random.choice(faults.error_statuses)
+            else:
+                return None
+            self.errors[status] += 1
+        
+        headers = {}
+        if status in (429, 503) and faults.retry_after is not None:
+            headers['Retry-After'] = f"{faults.retry_after:g}"
+        return status, self.error_body(status, "Injected fault"), headers
+    
+    def _quota_exceeded(self, now: float) -> bool:
+        window = self._window
+        while window and now - window[0] >= self.faults.quota_window:
+            window.popleft()
+        if len(window) >= self.faults.quota_per_minute:
+            return True
+        window.append(now)
+        return False
+    
+    def _serve(self, handler: BaseHTTPRequestHandler) -> None:
+        """요청 하나 처리: 지연 → 오류 주입 → handle → JSON 응답"""
+        parts = urlsplit(handler.path)
+        length = int(handler.headers.get('Content-Length') or 0)
+        raw = handler.rfile.read(length) if length else b''
+        request = Request(
+            method=handler.command,
+            path=unquote(parts.path),
+            query=parse_qs(parts.query),
+            headers={key.lower(): value for key, value in handler.headers.items()},
+            body=json.loads(raw) if raw else None
+        )
+        
+        with self._lock:
+            self.requests += 1
+            self.endpoints[self.endpoint(request)] += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            delay = self.faults.latency + (self._random.uniform(0, self.faults.jitter) if self.faults.jitter else 0)
+            if delay:
+                time.sleep(delay)
+            
+            reply = self._injected_fault()
+            if reply is None:
+                try:
+                    reply = self.handle(request)
+                except Exception as e:
+                    logger.exception(f"{type(self).__name__} 처리 오류")
+                    reply = 500, self.error_body(500, str(e)), {}
+            self._send(handler, *reply)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+    
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status: int, body: Dict, headers: Dict[str, str]) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json; charset=utf-8')
+        handler.send_header('Content-Length', str(len(data)))
+        for key, value in headers.items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(data)
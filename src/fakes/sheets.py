@@ -0,0 +1,333 @@
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .server import FakeServer, FaultConfig, Reply, Request
+
+# 상태 코드별 Google API 오류 status
+ERROR_STATUSES = {
+    400: 'INVALID_ARGUMENT',
+    404: 'NOT_FOUND',
+    429: 'RESOURCE_EXHAUSTED',
+    500: 'INTERNAL',
+    503: 'UNAVAILABLE'
+}
+
+SPREADSHEET_PATH = re.compile(r'^/v4/spreadsheets/([^/:]+)(.*)$')
+RANGE_LABEL = re.compile(r"^(?:'((?:[^']|'')+)'|([^'!]+))(?:!(.*))?$")
+CELL_LABEL = re.compile(r'^([A-Za-z]*)(\d*)$')
+
+# (시작 행, 시작 열, 끝 행, 끝 열), 1부터 시작하며 끝이 None이면 데이터 끝까지
+Bounds = Tuple[int, int, Optional[int], Optional[int]]
+
+
+def column_letter(col: int) -> str:
+    """열 번호(1부터)를 A1 표기 열 문자로 변환"""
+    letters = ''
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def _column_number(letters: str) -> int:
+    number = 0
+    for char in letters.upper():
+        number = number * 26 + ord(char) - ord('A') + 1
+    return number
+
+
+def parse_range(label: str) -> Tuple[str, Bounds]:
+    """A1 표기 범위 파싱
+    
+    Args:
+        label: 예) "'뉴스요약'!A2:E", "Sheet1!A:A", "'요약결과'" (시트 전체)
+    
+    Returns:
+        Tuple[str, Bounds]: (시트 이름, 범위)
+    """
+    match = RANGE_LABEL.match(label)
+    if not match:
+        raise ValueError(f"Unable to parse range: {label}")
+    title = match.group(1).replace("''", "'") if match.group(1) else match.group(2)
+    cells = match.group(3)
+    if not cells:
+        return title, (1, 1, None, None)
+    
+    start, _, end = cells.partition(':')
+    start_match, end_match = CELL_LABEL.match(start), CELL_LABEL.match(end or start)
+    if not start_match or not end_match:
+        raise ValueError(f"Unable to parse range: {label}")
+    row1 = int(start_match.group(2)) if start_match.group(2) else 1
+    col1 = _column_number(start_match.group(1)) if start_match.group(1) else 1
+    row2 = int(end_match.group(2)) if end_match.group(2) else None
+    col2 = _column_number(end_match.group(1)) if end_match.group(1) else None
+    return title, (row1, col1, row2, col2)
+
+
+def range_label(title: str, row1: int, col1: int, row2: int, col2: int) -> str:
+    """시트 이름과 범위로 A1 표기 범위 작성"""
+    quoted = title.replace("'", "''")
+    return f"'{quoted}'!{column_letter(col1)}{row1}:{column_letter(col2)}{row2}"
+
+
+def _cell_value(value) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    return str(value)
+
+
+class FakeSheetsServer(FakeServer):
+    """Google Sheets API v4 가짜 서버 (gspread가 쓰는 엔드포인트만 지원)
+    
+    - GET  /v4/spreadsheets/{id}                          메타데이터
+    - POST /v4/spreadsheets/{id}:batchUpdate              addSheet
+    - GET  /v4/spreadsheets/{id}/values/{range}           값 조회 (majorDimension 지원)
+    - PUT  /v4/spreadsheets/{id}/values/{range}           값 수정
+    - POST /v4/spreadsheets/{id}/values/{range}:append    표 끝에 행 추가
+    - GET  /v4/spreadsheets/{id}/values:batchGet          여러 범위 조회
+    - POST /v4/spreadsheets/{id}/values:batchUpdate       여러 범위 수정
+    
+    값은 모두 문자열로 저장되며 (FORMATTED_VALUE와 동일), 조회 결과는 실제 API처럼
+    뒤쪽 빈 셀과 빈 행을 잘라서 반환함
+    """
+    
+    def __init__(
+        self,
+        faults: FaultConfig = FaultConfig(),
+        spreadsheets: Optional[Dict[str, Dict[str, List[List]]]] = None,
+        auto_create: bool = True,
+        **kwargs
+    ):
+        super().__init__(faults, **kwargs)
+        self.auto_create = auto_create
+        self._data: Dict[str, Dict[str, Dict]] = {}
+        self._data_lock = threading.Lock()
+        self._next_sheet_id = 0
+        for spreadsheet_id, sheets in (spreadsheets or {}).items():
+            for title, rows in sheets.items():
+                self.add_sheet(spreadsheet_id, title, rows)
+    
+    def add_sheet(self, spreadsheet_id: str, title: str, rows: Optional[List[List]] = None) -> None:
+        """워크시트 추가 (이미 있으면 내용 교체)
+        
+        Args:
+            spreadsheet_id: 문서 ID
+            title: 워크시트 이름
+            rows: 초기 행 데이터
+        """
+        with self._data_lock:
+            sheets = self._data.setdefault(spreadsheet_id, {})
+            sheet_id = sheets[title]['sheetId'] if title in sheets else self._new_sheet_id()
+            sheets[title] = {'sheetId': sheet_id, 'rows': [[_cell_value(v) for v in row] for row in rows or []]}
+    
+    def get_rows(self, spreadsheet_id: str, title: str) -> List[List[str]]:
+        """워크시트의 현재 행 데이터 (검증용 복사본)"""
+        with self._data_lock:
+            return [list(row) for row in self._data[spreadsheet_id][title]['rows']]
+    
+    def _new_sheet_id(self) -> int:
+        self._next_sheet_id += 1
+        return self._next_sheet_id
+    
+    def error_body(self, status: int, message: str) -> Dict:
+        return {'error': {'code': status, 'message': message, 'status': ERROR_STATUSES.get(status, 'UNKNOWN')}}
+    
+    def endpoint(self, request: Request) -> str:
+        match = SPREADSHEET_PATH.match(request.path)
+        rest = match.group(2) if match else request.path
+        if rest.startswith('/values/'):
+            return f"{request.method} values{':append' if rest.endswith(':append') else ''}"
+        return f"{request.method} {rest.lstrip('/') or 'spreadsheet'}"
+    
+    # --- 요청 처리 ---
+    
+    def handle(self, request: Request) -> Reply:
+        match = SPREADSHEET_PATH.match(request.path)
+        if not match:
+            return 404, self.error_body(404, f"Not found: {request.path}"), {}
+        spreadsheet_id, rest = match.groups()
+        
+        with self._data_lock:
+            if spreadsheet_id not in self._data:
+                if not self.auto_create:
+                    return 404, self.error_body(404, f"Requested entity was not found: {spreadsheet_id}"), {}
+                self._data[spreadsheet_id] = {}
+            sheets = self._data[spreadsheet_id]
+            
+            try:
+                if rest == '' and request.method == 'GET':
+                    return 200, self._metadata(spreadsheet_id, sheets), {}
+                if rest == ':batchUpdate' and request.method == 'POST':
+                    return 200, self._batch_update(spreadsheet_id, sheets, request.body or {}), {}
+                if rest == '/values:batchGet' and request.method == 'GET':
+                    return 200, self._batch_get(spreadsheet_id, sheets, request), {}
+                if rest == '/values:batchUpdate' and request.method == 'POST':
+                    return 200, self._values_batch_update(spreadsheet_id, sheets, request.body or {}), {}
+                if rest.startswith('/values/'):
+                    label = rest[len('/values/'):]
+                    if label.endswith(':append') and request.method == 'POST':
+                        return 200, self._append(spreadsheet_id, sheets, label[:-len(':append')], request.body or {}), {}
+                    if request.method == 'GET':
+                        return 200, self._get_values(sheets, label, self._dimension(request)), {}
+                    if request.method == 'PUT':
+                        return 200, self._update(spreadsheet_id, sheets, label, (request.body or {}).get('values', [])), {}
+            except KeyError as e:
+                return 400, self.error_body(400, f"Unable to parse range: {e.args[0]}"), {}
+            except ValueError as e:
+                return 400, self.error_body(400, str(e)), {}
+        
+        return 404, self.error_body(404, f"Not found: {request.method} {request.path}"), {}
+    
+    @staticmethod
+    def _dimension(request: Request) -> str:
+        return request.query.get('majorDimension', ['ROWS'])[0]
+    
+    def _metadata(self, spreadsheet_id: str, sheets: Dict[str, Dict]) -> Dict:
+        return {
+            'spreadsheetId': spreadsheet_id,
+            'properties': {'title': f"fake-{spreadsheet_id}", 'locale': 'ko_KR', 'timeZone': 'Asia/Seoul'},
+            'sheets': [
+                {'properties': self._sheet_properties(title, sheet, index)}
+                for index, (title, sheet) in enumerate(sheets.items())
+            ]
+        }
+    
+    @staticmethod
+    def _sheet_properties(title: str, sheet: Dict, index: int) -> Dict:
+        rows = sheet['rows']
+        return {
+            'sheetId': sheet['sheetId'],
+            'title': title,
+            'index': index,
+            'sheetType': 'GRID',
+            'gridProperties': {
+                'rowCount': max(1000, len(rows)),
+                'columnCount': max([26] + [len(row) for row in rows])
+            }
+        }
+    
+    def _batch_update(self, spreadsheet_id: str, sheets: Dict[str, Dict], body: Dict) -> Dict:
+        replies = []
+        for request in body.get('requests', []):
+            if 'addSheet' in request:
+                title = request['addSheet'].get('properties', {}).get('title')
+                if not title or title in sheets:
+                    raise ValueError(f"Invalid sheet title: {title}")
+                sheets[title] = {'sheetId': self._new_sheet_id(), 'rows': []}
+                replies.append({'addSheet': {'properties': self._sheet_properties(title, sheets[title], len(sheets) - 1)}})
+            else:
+                replies.append({})
+        return {'spreadsheetId': spreadsheet_id, 'replies': replies}
+    
+    def _get_values(self, sheets: Dict[str, Dict], label: str, dimension: str = 'ROWS') -> Dict:
+        title, (row1, col1, row2, col2) = parse_range(label)
+        rows = sheets[title]['rows']
+        values = [row[col1 - 1:col2] for row in rows[row1 - 1:row2]]
+        
+        # 실제 API처럼 뒤쪽 빈 셀과 빈 행 제거
+        values = [self._trim(row) for row in values]
+        while values and not values[-1]:
+            values.pop()
+        
+        width = max([len(row) for row in values] + [1])
+        result = {
+            'range': range_label(title, row1, col1, row2 or row1 + max(len(values), 1) - 1, col2 or col1 + width - 1),
+            'majorDimension': dimension
+        }
+        if dimension == 'COLUMNS':
+            values = [self._trim(list(column)) for column in zip(*[row + [''] * (width - len(row)) for row in values])]
+            while values and not values[-1]:
+                values.pop()
+        if values:
+            result['values'] = values
+        return result
+    
+    @staticmethod
+    def _trim(row: List[str]) -> List[str]:
+        end = len(row)
+        while end and row[end - 1] == '':
+            end -= 1
+        return row[:end]
+    
+    def _batch_get(self, spreadsheet_id: str, sheets: Dict[str, Dict], request: Request) -> Dict:
+        dimension = self._dimension(request)
+        return {
+            'spreadsheetId': spreadsheet_id,
+            'valueRanges': [self._get_values(sheets, label, dimension) for label in request.query.get('ranges', [])]
+        }
+    
+    def _write(self, sheets: Dict[str, Dict], title: str, row1: int, col1: int, values: List[List]) -> Dict:
+        """(row1, col1)부터 값 기록 후 UpdateValuesResponse 형식으로 반환"""
+        rows = sheets[title]['rows']
+        width = max([len(row) for row in values] + [0])
+        for offset, row_values in enumerate(values):
+            index = row1 - 1 + offset
+            while len(rows) <= index:
+                rows.append([])
+            row = rows[index]
+            end = col1 - 1 + len(row_values)
+            if len(row) < end:
+                row.extend([''] * (end - len(row)))
+            row[col1 - 1:end] = [_cell_value(value) for value in row_values]
+        return {
+            'updatedRange': range_label(title, row1, col1, row1 + max(len(values), 1) - 1, col1 + max(width, 1) - 1),
+            'updatedRows': len(values),
+            'updatedColumns': width,
+            'updatedCells': sum(len(row) for row in values)
+        }
+    
+    def _update(self, spreadsheet_id: str, sheets: Dict[str, Dict], label: str, values: List[List]) -> Dict:
+        title, (row1, col1, _, _) = parse_range(label)
+        return {'spreadsheetId': spreadsheet_id, **self._write(sheets, title, row1, col1, values)}
+    
+    def _values_batch_update(self, spreadsheet_id: str, sheets: Dict[str, Dict], body: Dict) -> Dict:
+        responses = [
+            {'spreadsheetId': spreadsheet_id, **self._write(sheets, *self._start(item['range']), item.get('values', []))}
+            for item in body.get('data', [])
+        ]
+        return {
+            'spreadsheetId': spreadsheet_id,
+            'totalUpdatedRows': sum(response['updatedRows'] for response in responses),
+            'totalUpdatedCells': sum(response['updatedCells'] for response in responses),
+            'responses': responses
+        }
+    
+    @staticmethod
+    def _start(label: str) -> Tuple[str, int, int]:
+        title, (row1, col1, _, _) = parse_range(label)
+        return title, row1, col1
+    
+    def _append(self, spreadsheet_id: str, sheets: Dict[str, Dict], label: str, body: Dict) -> Dict:
+        title, (_, col1, _, _) = parse_range(label)
+        rows = sheets[title]['rows']
+        # 표의 마지막 데이터 행 다음부터 추가
+        last = len(rows)
+        while last and not any(rows[last - 1]):
+            last -= 1
+        updates = self._write(sheets, title, last + 1, col1, body.get('values', []))
+        return {
+            'spreadsheetId': spreadsheet_id,
+            'tableRange': range_label(title, 1, col1, max(last, 1), col1),
+            'updates': {'spreadsheetId': spreadsheet_id, **updates}
+        }
+
+
+def start_fake_sheets(
+    faults: Optional[FaultConfig] = None,
+    spreadsheets: Optional[Dict[str, Dict[str, List[List]]]] = None,
+    **kwargs
+) -> FakeSheetsServer:
+    """가짜 Sheets 서버를 만들어 시작
+    
+    Args:
+        faults: 지연/오류/할당량 설정 (기본값: 없음)
+        spreadsheets: 초기 데이터 {문서 ID: {시트 이름: 행 리스트}}
+        **kwargs: FakeSheetsServer 인자 (auto_create, host, port)
+    
+    Returns:
+        FakeSheetsServer: 실행 중인 서버
+    """
+    return FakeSheetsServer(faults or FaultConfig(), spreadsheets, **kwargs).start()
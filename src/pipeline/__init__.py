@@ -0,0 +1,8 @@
+# Pipeline Package
+
+from .streaming import Stage, StreamingPipeline
+
+__all__ = [
+    'Stage',
+    'StreamingPipeline'
+]
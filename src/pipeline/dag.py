@@ -0,0 +1,314 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import logging
+import argparse
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.utils import get_kst_date, get_week_dates, get_metrics
+from src.storage import get_article_store
+from src.config import RAW_DATA_DIR, PROCESSED_DATA_DIR, PIPELINE_STATE_PATH, PIPELINE_MAX_PARALLEL
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 입력: 파일 경로(내용 해시) 또는 값을 반환하는 함수(JSON 직렬화 후 해시)
+Input = Union[str, Callable[[], Any]]
+
+
+class Task(NamedTuple):
+    """DAG 단계"""
+    name: str
+    run: Callable[[], Any]          # 단계 실행 함수
+    inputs: Sequence[Input] = ()    # 바뀌면 다시 실행하는 입력
+    outputs: Sequence[str] = ()     # 단계가 만드는 파일 (삭제/변경되면 다시 실행)
+    deps: Sequence[str] = ()        # 먼저 끝나야 하는 단계 이름
+
+
+def _file_digest(path: str) -> str:
+    """파일 내용 해시 (없으면 'missing')"""
+    if not os.path.exists(path):
+        return 'missing'
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(65536), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def fingerprint(task: Task) -> str:
+    """단계 입력 전체의 지문
+    
+    Args:
+        task: 단계
+    
+    Returns:
+        str: 입력 파일 내용과 입력 값으로 만든 sha256 해시
+    """
+    digest = hashlib.sha256(task.name.encode('utf-8'))
+    for item in task.inputs:
+        if callable(item):
+            value = json.dumps(item(), ensure_ascii=False, sort_keys=True, default=str)
+            digest.update(hashlib.sha256(value.encode('utf-8')).hexdigest().encode('utf-8'))
+        else:
+            digest.update(f"{item}:{_file_digest(item)}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_state(path: str = PIPELINE_STATE_PATH) -> Dict[str, Dict]:
+    """단계별 마지막 성공 기록 읽기 (없거나 손상되었으면 빈 dict)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state: Dict[str, Dict], path: str = PIPELINE_STATE_PATH) -> None:
+    """단계별 성공 기록 저장 (임시 파일에 쓴 뒤 교체)"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def is_up_to_date(task: Task, key: str, record: Optional[Dict]) -> bool:
+    """마지막 성공 이후 입력과 출력이 그대로인지 확인"""
+    if not record or record.get('fingerprint') != key:
+        return False
+    outputs = record.get('outputs', {})
+    return all(path in outputs and outputs[path] == _file_digest(path) for path in task.outputs)
+
+
+def run_dag(
+    tasks: Sequence[Task],
+    force: bool = False,
+    dry_run: bool = False,
+    max_parallel: int = PIPELINE_MAX_PARALLEL,
+    state_path: str = PIPELINE_STATE_PATH
+) -> Dict[str, str]:
+    """의존 관계 순서로 단계를 실행 (입력이 바뀌지 않은 단계는 건너뜀)
+    
+    의존 단계가 모두 끝난 단계들은 동시에 실행되며, 지문은 의존 단계가 끝난 뒤에
+    계산하므로 앞 단계가 입력을 바꾸면 뒤 단계도 다시 실행됨
+    
+    Args:
+        tasks: 실행할 단계 목록 (목록에 없는 의존 단계는 완료된 것으로 봄)
+        force: 지문과 관계없이 모든 단계 실행
+        dry_run: 실행하지 않고 실행 대상만 판단
+        max_parallel: 동시에 실행할 최대 단계 수
+        state_path: 단계별 성공 기록 파일
+    
+    Returns:
+        Dict[str, str]: 단계별 결과 ('ran', 'skipped', 'would-run', 'failed', 'blocked')
+    """
+    by_name = {task.name: task for task in tasks}
+    state = load_state(state_path)
+    state_lock = threading.Lock()
+    results: Dict[str, str] = {}
+    
+    def execute(task: Task) -> str:
+        key = fingerprint(task)
+        if not force and is_up_to_date(task, key, state.get(task.name)):
+            logger.info(f"[{task.name}] 입력 변경 없음, 건너뜀")
+            return 'skipped'
+        # 기록에 없는 출력이 이미 있으면 (스트리밍 파이프라인 등 DAG 밖에서 생성) 그대로 사용
+        recorded = state.get(task.name, {}).get('outputs', {})
+        adopt = bool(
+            not force and task.outputs
+            and all(os.path.exists(path) and path not in recorded for path in task.outputs)
+        )
+        if dry_run:
+            logger.info(f"[{task.name}] {'기존 출력 사용' if adopt else '실행 대상'}")
+            return 'skipped' if adopt else 'would-run'
+        
+        started = time.time()
+        if adopt:
+            logger.info(f"[{task.name}] 기존 출력 사용, 건너뜀")
+        else:
+            logger.info(f"[{task.name}] 실행")
+            with get_metrics().timer(f"dag.{task.name}"):
+                task.run()
+            # 단계가 자기 입력을 갱신할 수도 있으므로 실행 후 지문을 다시 계산해 기록
+            key = fingerprint(task)
+            logger.info(f"[{task.name}] 완료 ({time.time() - started:.2f}초)")
+        
+        with state_lock:
+            state[task.name] = {
+                'fingerprint': key,
+                'outputs': {path: _file_digest(path) for path in task.outputs},
+                'finished_at': time.time(),
+                'duration': round(time.time() - started, 3)
+            }
+            save_state(state, state_path)
+        return 'skipped' if adopt else 'ran'
+    
+    pending = list(tasks)
+    running = {}
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        while pending or running:
+            progressed = False
+            for task in list(pending):
+                deps = [dep for dep in task.deps if dep in by_name]
+                if any(results.get(dep) in ('failed', 'blocked') for dep in deps):
+                    logger.warning(f"[{task.name}] 앞 단계 실패로 실행하지 않음")
+                    results[task.name] = 'blocked'
+                    pending.remove(task)
+                    progressed = True
+                elif all(dep in results for dep in deps):
+                    running[executor.submit(execute, task)] = task.name
+                    pending.remove(task)
+                    progressed = True
+            
+            if not running:
+                if pending and not progressed:
+                    raise ValueError(f"순환 의존 관계: {', '.join(task.name for task in pending)}")
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    logger.error(f"[{name}] 실패: {str(e)}")
+                    results[name] = 'failed'
+    
+    return results
+
+
+def mark_completed(
+    tasks: Sequence[Task],
+    names: Sequence[str],
+    state_path: str = PIPELINE_STATE_PATH
+) -> None:
+    """DAG 밖에서 이미 끝낸 단계를 현재 입력/출력 기준으로 완료 처리
+    
+    스트리밍 파이프라인이 수집과 요약을 마친 뒤 호출하면, 같은 날 DAG를 다시
+    실행해도 입력이 그대로인 단계는 건너뜀
+    
+    Args:
+        tasks: build_daily_tasks 결과
+        names: 완료 처리할 단계 이름
+        state_path: 단계별 성공 기록 파일
+    """
+    state = load_state(state_path)
+    for task in tasks:
+        if task.name not in names:
+            continue
+        state[task.name] = {
+            'fingerprint': fingerprint(task),
+            'outputs': {path: _file_digest(path) for path in task.outputs},
+            'finished_at': time.time(),
+            'duration': 0.0
+        }
+    save_state(state, state_path)
+
+
+def _run_module(module: str) -> Callable[[], None]:
+    """src 모듈의 main()을 호출하는 실행 함수 (필요할 때만 import)"""
+    def run():
+        __import__(module, fromlist=['main']).main()
+    return run
+
+
+def _run_script(script: str) -> Callable[[], None]:
+    """google_upload 스크립트를 별도 프로세스로 실행하는 함수"""
+    def run():
+        subprocess.run([sys.executable, script], cwd=PROJECT_ROOT, check=True)
+    return run
+
+
+def _source(module: str) -> str:
+    """모듈 소스 파일 경로 (코드가 바뀌면 단계 재실행)"""
+    return os.path.join(*module.split('.')) + '.py'
+
+
+def build_daily_tasks(date: Optional[str] = None, weekly: bool = False) -> List[Task]:
+    """일일 워크플로 단계 구성
+    
+    Args:
+        date: 기사 날짜 (기본값: 오늘 KST, 각 단계는 오늘 날짜로 실행됨)
+        weekly: 주간 요약 단계 포함 여부
+    
+    Returns:
+        List[Task]: scraper, uploader, daily_summary, real_estate_insight, (weekly_summary), dashboard
+    """
+    date = date or get_kst_date()
+    year_month = date[:7].replace('-', '/')
+    records_file = os.path.join(RAW_DATA_DIR, year_month, f"output_{date}.jsonl")
+    csv_file = os.path.join(PROCESSED_DATA_DIR, year_month, f"output_{date}.csv")
+    store = get_article_store()
+    
+    tasks = [
+        Task(
+            'scraper', _run_module('src.scrapers.news_scraper'),
+            inputs=[lambda: date, _source('src.scrapers.news_scraper')],
+            outputs=[records_file]
+        ),
+        Task(
+            'uploader', _run_module('src.uploaders.sheets_uploader'),
+            inputs=[records_file, _source('src.uploaders.sheets_uploader')],
+            outputs=[csv_file],
+            deps=['scraper']
+        ),
+        Task(
+            'daily_summary', _run_module('src.processors.daily_summary'),
+            inputs=[lambda: store.get_articles([date], exclude_failed=False), _source('src.processors.daily_summary')],
+            deps=['scraper']
+        ),
+        Task(
+            'real_estate_insight', _run_module('src.processors.real_estate_insight'),
+            inputs=[lambda: store.get_summary(date), _source('src.processors.real_estate_insight')],
+            deps=['daily_summary']
+        )
+    ]
+    if weekly:
+        tasks.append(Task(
+            'weekly_summary', _run_module('src.processors.weekly_summary'),
+            inputs=[lambda: store.get_articles(get_week_dates()), _source('src.processors.weekly_summary')],
+            deps=['scraper']
+        ))
+    tasks.append(Task(
+        'dashboard', _run_script(os.path.join('google_upload', 'generate_dashboard.py')),
+        inputs=[store.get_summary_rows, os.path.join('google_upload', 'generate_dashboard.py')],
+        outputs=[os.path.join('docs', 'index.html')],
+        deps=['daily_summary', 'real_estate_insight']
+    ))
+    return tasks
+
+
+def main():
+    """DAG 실행 CLI"""
+    parser = argparse.ArgumentParser(description="입력이 바뀐 단계만 실행하는 일일 워크플로")
+    parser.add_argument("--only", nargs="+", default=None, help="실행할 단계 이름 (나머지 의존 단계는 완료로 간주)")
+    parser.add_argument("--weekly", action="store_true", help="주간 요약 단계 포함")
+    parser.add_argument("--force", action="store_true", help="입력 변경 여부와 관계없이 실행")
+    parser.add_argument("--dry-run", action="store_true", help="실행하지 않고 실행 대상만 출력")
+    parser.add_argument("--max-parallel", type=int, default=PIPELINE_MAX_PARALLEL, help="동시에 실행할 단계 수")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    tasks = build_daily_tasks(weekly=args.weekly or bool(args.only and 'weekly_summary' in args.only))
+    if args.only:
+        tasks = [task for task in tasks if task.name in args.only]
+    
+    results = run_dag(tasks, force=args.force, dry_run=args.dry_run, max_parallel=args.max_parallel)
+    for name, result in results.items():
+        print(f"{name}: {result}")
+    get_metrics().write_report('pipeline_dag')
+    
+    if any(result in ('failed', 'blocked') for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+import os
+import sys
+import logging
+import argparse
+from typing import Dict, Iterator, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.utils import get_kst_date, get_session, generate_real_estate_insight, log_cache_stats, log_token_usage
+from src.utils.fetch_cache import log_fetch_cache_stats
+from src.utils.metrics import get_metrics
+from src.storage import get_article_store
+from src.storage.article_store import FAILED_CONTENT_MARKERS
+from src.scrapers.news_scraper import collect_candidates, iter_first_paragraphs
+from src.scrapers.article_records import make_records, write_records, write_records_csv, render_markdown
+from src.processors.batch_scoring import select_top_by_category
+from src.processors.daily_summary import summarize_categories, render_kakao_message
+from src.pipeline.streaming import StreamingPipeline
+from src.pipeline.dag import build_daily_tasks, mark_completed
+from src.config import (
+    NEWS_URL,
+    RAW_DATA_DIR,
+    PROCESSED_DATA_DIR,
+    MIN_ARTICLES_PER_CATEGORY,
+    DAILY_COLLECTION_PER_CATEGORY,
+    WRITE_MARKDOWN,
+    SUMMARY_BATCH_MODE,
+    CLAUDE_MAX_CONCURRENCY
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryCollector:
+    """본문 수집이 끝난 기사를 카테고리별로 모으고, 카테고리가 채워지는 즉시 선별
+    
+    본문 수집에 실패한 기사는 출력 행(저장 대상)에는 남기되 선별에서는 제외함.
+    기사는 완료 순서대로 들어오지만 점수의 순서 항목이 랭킹 순서에 의존하므로
+    카테고리 안에서는 원래 랭킹 위치에 배치함
+    """
+    
+    def __init__(self, date: str, candidates: Dict[str, List[Tuple[str, str]]], top_n: int):
+        self.date = date
+        self.top_n = top_n
+        self.rows = {cat: [None] * len(items) for cat, items in candidates.items()}
+        self.remaining = {cat: len(items) for cat, items in candidates.items()}
+    
+    def __call__(self, item, emit):
+        category, position, title, link, paragraph = item
+        self.rows[category][position] = (self.date, category, title, paragraph, link)
+        self.remaining[category] -= 1
+        if self.remaining[category] == 0:
+            rows = self.rows[category]
+            # 본문을 받지 못한 기사는 저장만 하고 선별 대상에서 제외 (get_articles와 동일한 기준)
+            scorable = [row for row in rows if not any(marker in row[3] for marker in FAILED_CONTENT_MARKERS)]
+            selected = select_top_by_category(scorable, top_n=self.top_n).get(category, [])
+            emit((category, rows, selected))
+
+
+def iter_articles(candidates: Dict[str, List[Tuple[str, str]]]) -> Iterator[Tuple[str, int, str, str, str]]:
+    """후보 기사의 본문을 병렬로 받아 완료되는 순서대로 반환
+    
+    Args:
+        candidates: 카테고리별 (제목, 링크) 후보
+    
+    Yields:
+        Tuple: (카테고리, 카테고리 내 위치, 제목, 링크, 첫 문단)
+    """
+    index = [
+        (category, position, title, link)
+        for category, items in candidates.items()
+        for position, (title, link) in enumerate(items)
+    ]
+    for i, paragraph in iter_first_paragraphs([link for _, _, _, link in index]):
+        category, position, title, link = index[i]
+        yield category, position, title, link, paragraph
+
+
+def build_pipeline(
+    date: str,
+    candidates: Dict[str, List[Tuple[str, str]]],
+    top_n: int = 5,
+    summarize: bool = True,
+    batch: bool = SUMMARY_BATCH_MODE
+) -> StreamingPipeline:
+    """수집 → 점수화/중복 제거 → 요약 → 저장 단계 구성
+    
+    Args:
+        date: 기사 날짜 (YYYY-MM-DD)
+        candidates: 카테고리별 (제목, 링크) 후보
+        top_n: 카테고리별 선택 수
+        summarize: Claude 요약 단계 실행 여부
+        batch: 카테고리별 배치 요약 사용 여부
+    
+    Returns:
+        StreamingPipeline: (카테고리, 행, 선별 기사, 요약 결과)를 출력하는 파이프라인
+    """
+    store = get_article_store()
+    
+    def summarize_stage(item, emit):
+        category, rows, selected = item
+        summarized = None
+        if summarize and selected:
+            summarized = summarize_categories({category: selected[:5]}, batch=batch)[category]
+        emit((category, rows, selected, summarized))
+    
+    def store_stage(item, emit):
+        store.upsert_articles(item[1])
+        emit(item)
+    
+    pipeline = StreamingPipeline()
+    pipeline.add_stage('score', CategoryCollector(date, candidates, top_n))
+    pipeline.add_stage('summarize', summarize_stage, workers=CLAUDE_MAX_CONCURRENCY)
+    pipeline.add_stage('store', store_stage)
+    return pipeline
+
+
+def run_daily_pipeline(
+    date: Optional[str] = None,
+    top_n: int = 5,
+    summarize: bool = True,
+    sync: bool = True,
+    target_logger: Optional[logging.Logger] = None
+) -> Dict:
+    """일일 수집부터 요약 저장까지 한 프로세스에서 스트리밍으로 실행
+    
+    카테고리 하나의 본문 수집이 끝나면 바로 점수화와 Claude 요약이 시작되므로
+    수집, 업로드, 요약을 차례로 실행할 때보다 전체 시간이 짧음
+    
+    Args:
+        date: 기사 날짜 (기본값: 오늘 KST, 오늘이 아니면 ValueError)
+        top_n: 카테고리별 선택 수
+        summarize: 요약 메시지와 부동산 인사이트 생성 여부
+        sync: 결과를 Google Sheets에 동기화
+        target_logger: 진행 상황과 단계별 통계를 기록할 로거 (기본값: 모듈 로거)
+    
+    Returns:
+        Dict: output_file, articles(기사 수), message(요약 메시지, 요약하지 않았으면 None)
+    """
+    log = target_logger or logger
+    today = get_kst_date()
+    date = date or today
+    if date != today:
+        # 랭킹 페이지는 오늘 기사만 제공하므로 다른 날짜로 저장하면 잘못된 날짜가 붙음
+        raise ValueError(f"일일 파이프라인은 오늘({today}) 기사만 수집할 수 있습니다: {date} (지난 날짜는 backfill 사용)")
+    
+    with get_metrics().timer('ranking_fetch'):
+        res = get_session().get(NEWS_URL)
+    
+    # 최소 개수에 못 미치는 카테고리는 저장하지 않으므로 본문도 받지 않음
+    candidates = {
+        category: items for category, items in collect_candidates(res.text, DAILY_COLLECTION_PER_CATEGORY).items()
+        if items and len(items) >= MIN_ARTICLES_PER_CATEGORY
+    }
+    log.info(f"본문 수집 시작: {sum(len(items) for items in candidates.values())}개 기사")
+    
+    pipeline = build_pipeline(date, candidates, top_n=top_n, summarize=summarize)
+    outputs = {category: rest for category, *rest in pipeline.run(iter_articles(candidates))}
+    pipeline.log_stats(log)
+    
+    # 출력은 완료 순서이므로 카테고리 순서를 후보(KEYWORDS) 순서로 되돌림
+    ordered = [category for category in candidates if category in outputs]
+    results = {
+        category: [(title, link, content) for _, _, title, content, link in outputs[category][0]]
+        for category in ordered
+    }
+    records = make_records(date, results)
+    year_month = date[:7].replace('-', '/')
+    output_dir = os.path.join(RAW_DATA_DIR, year_month)
+    output_file = os.path.join(output_dir, f"output_{date}.jsonl")
+    write_records(output_file, records)
+    if WRITE_MARKDOWN:
+        render_markdown(os.path.join(output_dir, f"output_{date}.md"), date, records)
+    # 보관용 CSV (재점수화 CLI와 uploader 단계가 사용하는 PROCESSED_DATA_DIR)
+    write_records_csv(os.path.join(PROCESSED_DATA_DIR, year_month, f"output_{date}.csv"), records)
+    
+    message = None
+    store = get_article_store()
+    if summarize:
+        grouped = {category: outputs[category][1] for category in ordered if outputs[category][1]}
+        summarized = {category: outputs[category][2] for category in grouped}
+        message = render_kakao_message(grouped, summarized, date)
+        store.save_summary(date, message)
+        
+        insight = generate_real_estate_insight(message)
+        if insight.startswith("API"):
+            log.error(f"부동산 인사이트 API 오류: {insight}")
+            insight = "부동산 인사이트 생성 실패"
+        store.save_insight(date, 'real_estate', insight)
+    
+    if sync:
+        from src.uploaders.sheets_sync import sync_articles, sync_summaries
+        log.info(f"{sync_articles(store)}개 기사 행 동기화")
+        if summarize:
+            sync_summaries(store)
+    
+    # 같은 날 DAG를 다시 실행해도 이미 끝낸 단계는 건너뛰도록 기록
+    # (uploader는 시트 동기화까지 마친 경우에만 완료로 봄)
+    done = ['scraper'] + (['uploader'] if sync else []) + (['daily_summary', 'real_estate_insight'] if summarize else [])
+    mark_completed(build_daily_tasks(date), done)
+    
+    log_fetch_cache_stats(log)
+    log_cache_stats(log)
+    log_token_usage(log)
+    return {'output_file': output_file, 'articles': len(records), 'message': message}
+
+
+def main():
+    """스트리밍 파이프라인 CLI"""
+    parser = argparse.ArgumentParser(description="수집 → 점수화 → 요약 → 저장 스트리밍 실행")
+    parser.add_argument("--date", default=None, help="기사 날짜 (오늘 KST만 허용, 지난 날짜는 backfill 사용)")
+    parser.add_argument("--top-n", type=int, default=5, help="카테고리별 선택 수")
+    parser.add_argument("--no-summary", action="store_true", help="Claude 요약 없이 수집/저장만 실행")
+    parser.add_argument("--no-sync", action="store_true", help="Google Sheets 동기화 생략")
+    args = parser.parse_args()
+    
+    if args.date and args.date != get_kst_date():
+        parser.error(f"--date는 오늘({get_kst_date()})만 가능합니다. 지난 날짜는 python -m src.processors.backfill을 사용하세요")
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    result = run_daily_pipeline(
+        args.date,
+        top_n=args.top_n,
+        summarize=not args.no_summary,
+        sync=not args.no_sync
+    )
+    
+    print(f"뉴스 수집 완료: {result['output_file']} ({result['articles']}개 기사)")
+    if result['message']:
+        print(result['message'])
+    print(f"실행 지표 저장: {get_metrics().write_report('daily_pipeline')}")
+
+
+if __name__ == "__main__":
+    main()
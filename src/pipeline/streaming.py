@@ -0,0 +1,211 @@
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, List, Optional
+
+from src.config import PIPELINE_QUEUE_SIZE
+from src.utils.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+# 스트림 종료 표시
+_END = object()
+
+# 정지 신호 확인 간격 (초)
+_POLL_INTERVAL = 0.1
+
+
+class Stage:
+    """파이프라인 단계 (입력 항목마다 func(item, emit) 호출)
+    
+    func는 emit(결과)로 다음 단계에 0개 이상의 항목을 넘기고, flush가 있으면
+    입력이 모두 끝난 뒤 flush(emit)를 한 번 호출함 (모아 두었던 항목 처리용)
+    """
+    
+    def __init__(self, name: str, func: Callable, workers: int = 1, flush: Optional[Callable] = None):
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.flush = flush
+        self.items_in = 0
+        self.items_out = 0
+        self.busy = 0.0                 # 워커들의 처리 시간 합 (초)
+        self.first_output = None        # 실행 시작 후 첫 출력까지 걸린 시간 (초)
+        self.finished = None            # 실행 시작 후 단계 완료까지 걸린 시간 (초)
+        self._active = workers
+        self._lock = threading.Lock()
+
+
+class StreamingPipeline:
+    """스레드와 크기 제한 큐로 연결된 단계별 스트리밍 실행기
+    
+    각 단계는 앞 단계가 항목을 넘기는 즉시 처리를 시작하므로 전체 소요 시간은
+    단계 시간의 합이 아니라 가장 느린 단계에 가까워짐. 큐가 가득 차면 앞 단계가
+    기다리므로 메모리 사용량이 제한됨
+    """
+    
+    def __init__(self, queue_size: int = PIPELINE_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.stages: List[Stage] = []
+        self._stop = threading.Event()
+        self._errors: List[BaseException] = []
+        self._started = 0.0
+    
+    def add_stage(self, name: str, func: Callable, workers: int = 1, flush: Optional[Callable] = None) -> 'StreamingPipeline':
+        """단계 추가 (추가한 순서대로 연결됨)
+        
+        Args:
+            name: 단계 이름 (로그용)
+            func: func(item, emit) 형태의 처리 함수
+            workers: 동시 처리 스레드 수
+            flush: 입력이 끝난 뒤 호출할 flush(emit) 함수
+        
+        Returns:
+            StreamingPipeline: 체이닝용 self
+        """
+        self.stages.append(Stage(name, func, workers, flush))
+        return self
+    
+    def _put(self, q: queue.Queue, item: Any) -> bool:
+        """정지 신호가 올 때까지 큐에 넣기 시도 (정지되면 False)"""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _get(self, q: queue.Queue) -> Any:
+        """정지 신호가 올 때까지 큐에서 꺼내기 시도 (정지되면 _END)"""
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+        return _END
+    
+    def _fail(self, name: str, error: BaseException) -> None:
+        logger.error(f"파이프라인 단계 {name} 실패: {str(error)}")
+        self._errors.append(error)
+        self._stop.set()
+    
+    def _elapsed(self) -> float:
+        return time.perf_counter() - self._started
+    
+    def _feed(self, source: Iterable, out: queue.Queue, consumers: int) -> None:
+        """입력 소스를 첫 번째 큐로 전달"""
+        try:
+            for item in source:
+                if not self._put(out, item):
+                    return
+        except Exception as e:
+            self._fail('source', e)
+        finally:
+            for _ in range(consumers):
+                self._put(out, _END)
+    
+    def _work(self, stage: Stage, inbox: queue.Queue, out: queue.Queue, consumers: int) -> None:
+        """단계 워커: 입력 큐의 항목을 처리해 다음 큐로 전달"""
+        def emit(result):
+            with stage._lock:
+                stage.items_out += 1
+                if stage.first_output is None:
+                    stage.first_output = self._elapsed()
+            self._put(out, result)
+        
+        metrics = get_metrics()
+        try:
+            while True:
+                item = self._get(inbox)
+                if item is _END:
+                    break
+                started = time.perf_counter()
+                stage.func(item, emit)
+                elapsed = time.perf_counter() - started
+                metrics.record_time(f"pipeline.{stage.name}", elapsed)
+                with stage._lock:
+                    stage.items_in += 1
+                    stage.busy += elapsed
+        except Exception as e:
+            self._fail(stage.name, e)
+        finally:
+            with stage._lock:
+                stage._active -= 1
+                last = stage._active == 0
+            if last:
+                # 마지막으로 끝난 워커가 flush 후 다음 단계에 종료를 알림
+                try:
+                    if stage.flush and not self._stop.is_set():
+                        stage.flush(emit)
+                except Exception as e:
+                    self._fail(stage.name, e)
+                stage.finished = self._elapsed()
+                for _ in range(consumers):
+                    self._put(out, _END)
+    
+    def run(self, source: Iterable) -> List[Any]:
+        """소스 항목을 모든 단계에 흘려보내고 마지막 단계의 출력을 반환
+        
+        Args:
+            source: 입력 항목 iterable (별도 스레드에서 소비됨)
+        
+        Returns:
+            List[Any]: 마지막 단계가 emit한 항목들 (출력된 순서)
+        
+        Raises:
+            Exception: 어느 단계에서든 예외가 나면 나머지 단계를 멈추고 첫 예외를 다시 발생
+        """
+        if not self.stages:
+            return list(source)
+        
+        self._stop.clear()
+        self._errors = []
+        self._started = time.perf_counter()
+        for stage in self.stages:
+            stage._active = stage.workers
+        
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(
+            target=self._feed, args=(source, queues[0], self.stages[0].workers),
+            name='pipeline-source', daemon=True
+        )]
+        for i, stage in enumerate(self.stages):
+            consumers = self.stages[i + 1].workers if i + 1 < len(self.stages) else 1
+            threads.extend(
+                threading.Thread(
+                    target=self._work, args=(stage, queues[i], queues[i + 1], consumers),
+                    name=f'pipeline-{stage.name}-{n}', daemon=True
+                )
+                for n in range(stage.workers)
+            )
+        for thread in threads:
+            thread.start()
+        
+        outputs = []
+        while True:
+            item = self._get(queues[-1])
+            if item is _END:
+                break
+            outputs.append(item)
+        
+        for thread in threads:
+            thread.join()
+        if self._errors:
+            raise self._errors[0]
+        return outputs
+    
+    def log_stats(self, target_logger: Optional[logging.Logger] = None) -> None:
+        """단계별 처리량과 시간 로깅
+        
+        Args:
+            target_logger: 사용할 로거 (기본값: 모듈 로거)
+        """
+        target_logger = target_logger or logger
+        for stage in self.stages:
+            first_output = f"{stage.first_output:.2f}초" if stage.first_output is not None else "-"
+            target_logger.info(
+                f"[{stage.name}] 입력 {stage.items_in}개, 출력 {stage.items_out}개, "
+                f"처리 {stage.busy:.2f}초, 첫 출력 {first_output}, 완료 {stage.finished or 0:.2f}초"
+            )
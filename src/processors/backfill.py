@@ -0,0 +1,291 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.storage import get_article_store
+from src.scrapers.article_records import read_records, records_to_rows
+from src.processors.batch_scoring import load_csv_rows, select_top_by_category
+from src.uploaders.sheets_uploader import parse_markdown_rows
+from src.config import RAW_DATA_DIR, PROCESSED_DATA_DIR, BACKFILL_DIR, SCORE_WEIGHTS
+
+logger = logging.getLogger(__name__)
+
+
+def date_range(start: str, end: str) -> List[str]:
+    """시작일부터 종료일까지의 날짜 리스트 (양 끝 포함)
+    
+    Args:
+        start: 시작일 (YYYY-MM-DD)
+        end: 종료일 (YYYY-MM-DD)
+    
+    Returns:
+        List[str]: YYYY-MM-DD 형식의 날짜 리스트
+    """
+    first = datetime.strptime(start, '%Y-%m-%d')
+    last = datetime.strptime(end, '%Y-%m-%d')
+    return [(first + timedelta(days=i)).strftime('%Y-%m-%d') for i in range((last - first).days + 1)]
+
+
+def find_day_source(date: str) -> Optional[str]:
+    """날짜별 보관 파일 경로 찾기 (JSONL > 가공 CSV > 원본 CSV > Markdown 순)
+    
+    Args:
+        date: 날짜 (YYYY-MM-DD)
+    
+    Returns:
+        str: 파일 경로 (없으면 None)
+    """
+    year_month = date[:7].replace('-', '/')
+    candidates = [
+        os.path.join(RAW_DATA_DIR, year_month, f"output_{date}.jsonl"),
+        os.path.join(PROCESSED_DATA_DIR, year_month, f"output_{date}.csv"),
+        os.path.join(RAW_DATA_DIR, year_month, f"output_{date}.csv"),
+        os.path.join(RAW_DATA_DIR, year_month, f"output_{date}.md")
+    ]
+    return next((path for path in candidates if os.path.exists(path)), None)
+
+
+def load_day_rows(path: str) -> List[Tuple[str, str, str, str, str]]:
+    """보관 파일에서 기사 행 읽기
+    
+    이전 Markdown 변환기로 만든 CSV는 링크 끝에 ')'와 줄바꿈이 붙어 있어 정리함
+    
+    Args:
+        path: find_day_source가 반환한 경로
+    
+    Returns:
+        List[Tuple]: (날짜, 카테고리, 제목, 요약, 링크) 행 리스트
+    """
+    if path.endswith('.jsonl'):
+        return records_to_rows(read_records(path))
+    if path.endswith('.md'):
+        return parse_markdown_rows(path)
+    return [
+        (date, category, title, content, link.strip().rstrip(')'))
+        for date, category, title, content, link in load_csv_rows([path])
+        if category
+    ]
+
+
+def checkpoint_path(date: str) -> str:
+    """날짜별 체크포인트 파일 경로"""
+    return os.path.join(BACKFILL_DIR, f"{date}.json")
+
+
+def load_checkpoint(date: str) -> Optional[Dict]:
+    """체크포인트 읽기 (없거나 손상되었으면 None)"""
+    try:
+        with open(checkpoint_path(date), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_checkpoint(state: Dict) -> None:
+    """체크포인트 저장 (임시 파일에 쓴 뒤 교체해 중단되어도 손상되지 않음)"""
+    path = checkpoint_path(state['date'])
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    state['updated_at'] = time.time()
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def fingerprint(path: str, top_n: int, weights: Dict[str, float]) -> str:
+    """입력 파일 내용과 선별 설정의 해시 (바뀌면 재점수화)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        digest.update(f.read())
+    digest.update(json.dumps({'top_n': top_n, 'weights': weights}, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def score_day(date: str, path: str, top_n: int, weights: Dict[str, float], key: str) -> Dict:
+    """하루치 파싱 및 점수화 (프로세스 풀 워커에서 실행)
+    
+    Args:
+        date: 날짜 (YYYY-MM-DD)
+        path: 보관 파일 경로
+        top_n: 카테고리별 선택 수
+        weights: 종합 점수 가중치
+        key: 입력 지문 (fingerprint)
+    
+    Returns:
+        Dict: 체크포인트 상태 (rows, selected 포함)
+    """
+    rows = [row for row in load_day_rows(path) if row[0] == date]
+    selected = select_top_by_category(rows, top_n=top_n, weights=weights)
+    return {
+        'date': date,
+        'source': path,
+        'fingerprint': key,
+        'articles': len(rows),
+        'rows': [list(row) for row in rows],
+        'selected': {category: [list(item) for item in items] for category, items in selected.items()},
+        'stored': False,
+        'summarized': False
+    }
+
+
+def finish_day(state: Dict, summarize: bool, sync: bool, force: bool = False) -> Dict:
+    """점수화된 하루치를 저장소에 반영하고 필요하면 요약 생성
+    
+    저장소 쓰기와 Claude 호출은 단일 프로세스(호출자)에서만 수행함
+    
+    Args:
+        state: score_day 결과 또는 이전 체크포인트
+        summarize: 요약 메시지 생성 여부
+        sync: False이면 이번에 백필한 행만 이미 시트에 있는 것으로 표시 (중복 추가 방지)
+        force: 이미 요약이 있는 날짜도 요약을 다시 생성
+    
+    Returns:
+        Dict: 갱신된 체크포인트 상태
+    """
+    store = get_article_store()
+    date = state['date']
+    
+    if not state['stored']:
+        # 스크래퍼가 이미 기록한 날짜는 덮어쓰지 않음
+        if store.count_articles(date) == 0:
+            store.upsert_articles(tuple(row) for row in state['rows'])
+            if not sync:
+                links = {row[4] for row in state['rows']}
+                store.mark_synced('articles', [
+                    {'id': item['id']} for item in store.get_pending_articles()
+                    if item['row'][0] == date and item['row'][4] in links
+                ])
+        state['stored'] = True
+        save_checkpoint(state)
+    
+    if summarize and not state['summarized'] and not force and store.get_summary(date) is not None:
+        # 운영 중 생성된 요약은 덮어쓰지 않음 (--force로 재생성)
+        logger.info(f"{date}: 이미 요약이 있어 요약 생성을 건너뜀")
+        state['summarized'] = True
+        save_checkpoint(state)
+    
+    if summarize and not state['summarized']:
+        # 지연 import: 요약 없이 실행할 때는 Claude 관련 모듈을 불러오지 않음
+        from src.processors.daily_summary import compose_kakao_message
+        
+        selected = {cat: [tuple(item) for item in items] for cat, items in state['selected'].items() if items}
+        if selected:
+            store.save_summary(date, compose_kakao_message(selected, date=date))
+            if not sync:
+                store.mark_synced('summaries', [{'date': date}])
+        state['summarized'] = True
+        save_checkpoint(state)
+    
+    return state
+
+
+def run_backfill(
+    start: str,
+    end: str,
+    summarize: bool = False,
+    workers: Optional[int] = None,
+    top_n: int = 5,
+    weights: Optional[Dict[str, float]] = None,
+    force: bool = False,
+    sync: bool = False
+) -> Dict[str, Dict]:
+    """기간 내 보관 데이터를 파싱 → 점수화 → (요약) → 저장
+    
+    파싱/점수화는 날짜별로 프로세스 풀에 분산하고, 완료된 단계는 날짜별 체크포인트에
+    기록해 중단 후 다시 실행하면 남은 단계부터 이어서 처리함
+    
+    Args:
+        start: 시작일 (YYYY-MM-DD)
+        end: 종료일 (YYYY-MM-DD)
+        summarize: 요약 메시지 생성 여부
+        workers: 프로세스 수 (기본값: CPU 수)
+        top_n: 카테고리별 선택 수
+        weights: 종합 점수 가중치 (기본값: SCORE_WEIGHTS)
+        force: 체크포인트를 무시하고 다시 처리 (이미 요약이 있는 날짜도 요약 재생성)
+        sync: 백필 결과를 Google Sheets에 동기화
+    
+    Returns:
+        Dict[str, Dict]: 날짜별 체크포인트 상태
+    """
+    weights = weights or SCORE_WEIGHTS
+    results = {}
+    pending = []
+    
+    for date in date_range(start, end):
+        path = find_day_source(date)
+        if path is None:
+            logger.info(f"{date}: 보관 파일 없음")
+            continue
+        
+        key = fingerprint(path, top_n, weights)
+        state = None if force else load_checkpoint(date)
+        if state and state.get('fingerprint') == key:
+            results[date] = state
+        else:
+            pending.append((date, path, key))
+    
+    # 1단계: 파싱 및 점수화 (CPU 작업, 프로세스 병렬)
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(score_day, date, path, top_n, weights, key): date
+                for date, path, key in pending
+            }
+            for future in as_completed(futures):
+                state = future.result()
+                save_checkpoint(state)
+                results[state['date']] = state
+                logger.info(f"{state['date']}: {state['articles']}개 기사 점수화")
+    
+    # 2단계: 저장 및 요약 (저장소/API 접근은 현재 프로세스에서 날짜 순으로)
+    for date in sorted(results):
+        results[date] = finish_day(results[date], summarize, sync, force)
+    
+    if sync:
+        from src.uploaders.sheets_sync import sync_articles, sync_summaries
+        sync_articles()
+        if summarize:
+            sync_summaries()
+    
+    return results
+
+
+def main():
+    """백필 CLI"""
+    parser = argparse.ArgumentParser(description="보관된 뉴스 데이터 기간 재처리")
+    parser.add_argument("--start", required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", required=True, help="종료일 (YYYY-MM-DD)")
+    parser.add_argument("--summarize", action="store_true", help="Claude로 일일 요약 메시지 재생성")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--top-n", type=int, default=5, help="카테고리별 선택 수")
+    parser.add_argument("--force", action="store_true", help="체크포인트를 무시하고 다시 처리 (기존 요약도 재생성)")
+    parser.add_argument("--sync", action="store_true", help="결과를 Google Sheets에 동기화")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    results = run_backfill(
+        args.start, args.end,
+        summarize=args.summarize,
+        workers=args.workers,
+        top_n=args.top_n,
+        force=args.force,
+        sync=args.sync
+    )
+    
+    for date, state in sorted(results.items()):
+        counts = ", ".join(f"{cat} {len(items)}" for cat, items in state['selected'].items())
+        print(f"{date}: {state['articles']}개 기사 → {counts}")
+    print(f"백필 완료: {len(results)}일")
+
+
+if __name__ == "__main__":
+    main()
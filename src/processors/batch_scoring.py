@@ -0,0 +1,322 @@
+import os
+import sys
+import csv
+import glob
+import argparse
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.processors.news_filter import get_filter_matcher, SCORE_CONTENT_CHARS, BLACKLIST_CONTENT_CHARS
+from src.processors.dedup import cluster_labels
+from src.utils.metrics import timed
+from src.config import MINIMUM_INVESTMENT_SCORE, SCORE_WEIGHTS, PROCESSED_DATA_DIR, DEDUP_ENABLED
+
+
+class ScoreTable(NamedTuple):
+    """기사별 점수 배열 (입력 행 순서와 동일)"""
+    groups: List[Tuple[str, str]]   # (날짜, 카테고리) 그룹 목록
+    group_ids: np.ndarray           # 기사별 그룹 번호
+    blacklisted: np.ndarray         # 블랙리스트 키워드 포함 여부
+    investment: np.ndarray          # 투자 관련성 점수
+    category: np.ndarray            # 카테고리 특화 점수
+    recency: np.ndarray             # 순서 점수 (그룹 내 앞쪽일수록 높음, 블랙리스트 제외 후 계산)
+    total: np.ndarray               # 종합 점수
+    eligible: np.ndarray            # 선별 대상 여부 (블랙리스트 아님 + 최소 투자 점수 이상)
+    clusters: np.ndarray            # 유사 기사 묶음 번호 (묶음 대표의 인덱스)
+    sources: np.ndarray             # 묶음 크기 (같은 기사를 다룬 언론사 수)
+
+
+def _weight_vectors(categories: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """매처 키워드 순서에 맞춘 가중치 벡터 생성
+    
+    Args:
+        categories: 카테고리 목록 (카테고리 가중치 행렬의 행 순서)
+    
+    Returns:
+        Tuple: (투자 가중치 벡터, 블랙리스트 마스크, 카테고리×키워드 가중치 행렬)
+    """
+    entries = get_filter_matcher().entries
+    category_index = {category: i for i, category in enumerate(categories)}
+    
+    investment = np.zeros(len(entries))
+    blacklist = np.zeros(len(entries), dtype=bool)
+    category = np.zeros((len(categories), len(entries)))
+    
+    for col, (_, group, weight) in enumerate(entries):
+        if group == 'investment':
+            investment[col] = weight
+        elif group == 'blacklist':
+            blacklist[col] = True
+        elif isinstance(group, tuple) and group[1] in category_index:
+            category[category_index[group[1]], col] = weight
+    return investment, blacklist, category
+
+
+def _hit_coordinates(titles: Sequence[str], contents: Sequence[str]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """기사×키워드 희소 매칭 행렬을 좌표(행, 열) 배열로 생성
+    
+    같은 기사에서 같은 키워드가 여러 번 나와도 한 번만 기록함
+    
+    Args:
+        titles: 기사 제목들
+        contents: 기사 본문(요약)들
+    
+    Returns:
+        Dict: 'title'(제목), 'content'(본문 앞 200자), 'blacklist'(제목 + 본문 앞 500자) 좌표
+    """
+    matcher = get_filter_matcher()
+    n_entries = len(matcher)
+    coords = {'title': ([], []), 'content': ([], []), 'blacklist': ([], [])}
+    
+    for row, (title, content) in enumerate(zip(titles, contents)):
+        for _, _, col in matcher.iter_matches(title or ''):
+            coords['title'][0].append(row)
+            coords['title'][1].append(col)
+        for _, end, col in matcher.iter_matches((content or '')[:BLACKLIST_CONTENT_CHARS]):
+            coords['blacklist'][0].append(row)
+            coords['blacklist'][1].append(col)
+            if end <= SCORE_CONTENT_CHARS:
+                coords['content'][0].append(row)
+                coords['content'][1].append(col)
+    
+    result = {}
+    for field, (rows, cols) in coords.items():
+        # 선형 인덱스로 중복 제거 후 다시 (행, 열)로 분리
+        linear = np.unique(np.asarray(rows, dtype=np.int64) * n_entries + np.asarray(cols, dtype=np.int64))
+        result[field] = (linear // n_entries, linear % n_entries)
+    
+    # 블랙리스트는 제목 매칭도 포함
+    title_rows, title_cols = result['title']
+    result['blacklist'] = (
+        np.concatenate([result['blacklist'][0], title_rows]),
+        np.concatenate([result['blacklist'][1], title_cols])
+    )
+    return result
+
+
+def _group_clusters(rows: Sequence[Sequence[str]], group_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(날짜, 카테고리) 그룹 안에서 유사 기사 묶기
+    
+    Args:
+        rows: [날짜, 카테고리, 제목, 요약, 링크] 행들
+        group_ids: 기사별 그룹 번호
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: 전체 행 기준 (묶음 번호, 묶음 크기) 배열
+    """
+    clusters = np.arange(len(rows), dtype=np.int64)
+    sources = np.ones(len(rows), dtype=np.int64)
+    for group in np.unique(group_ids):
+        members = np.flatnonzero(group_ids == group)
+        labels, sizes = cluster_labels([rows[i][2] for i in members], [rows[i][3] for i in members])
+        clusters[members] = members[labels]
+        sources[members] = sizes
+    return clusters, sources
+
+
+@timed('scoring')
+def score_articles(
+    rows: Sequence[Sequence[str]],
+    weights: Optional[Dict[str, float]] = None,
+    dedup: bool = DEDUP_ENABLED
+) -> ScoreTable:
+    """기사 전체를 한 번에 점수화
+    
+    점수 계산은 키워드 매칭 좌표와 가중치 벡터의 희소 행렬-벡터 곱(bincount)으로 수행하며,
+    news_filter의 기사별 점수 함수와 같은 점수를 반환함
+    
+    Args:
+        rows: [날짜, 카테고리, 제목, 요약, 링크] 행들 (하루치 또는 여러 날짜)
+        weights: 종합 점수 가중치 (기본값: SCORE_WEIGHTS)
+        dedup: 유사 기사 묶기 여부 (묶음 크기는 'sources' 가중치로 종합 점수에 반영)
+    
+    Returns:
+        ScoreTable: 기사별 점수 배열
+    """
+    weights = weights or SCORE_WEIGHTS
+    n = len(rows)
+    
+    # (날짜, 카테고리) 그룹 번호 부여 (등장 순서 유지)
+    group_index = {}
+    group_ids = np.fromiter(
+        (group_index.setdefault((row[0], row[1]), len(group_index)) for row in rows),
+        dtype=np.int64, count=n
+    )
+    groups = list(group_index)
+    categories = sorted({category for _, category in groups})
+    category_of_group = np.array([categories.index(category) for _, category in groups], dtype=np.int64)
+    
+    w_investment, blacklist_mask, w_category = _weight_vectors(categories)
+    coords = _hit_coordinates([row[2] for row in rows], [row[3] for row in rows])
+    
+    # 투자 점수: 제목 2배 + 본문 앞부분 1배
+    title_rows, title_cols = coords['title']
+    content_rows, content_cols = coords['content']
+    investment = (
+        2 * np.bincount(title_rows, weights=w_investment[title_cols], minlength=n)
+        + np.bincount(content_rows, weights=w_investment[content_cols], minlength=n)
+    )
+    
+    # 카테고리 점수: 기사가 속한 카테고리의 가중치 행만 사용
+    article_category = category_of_group[group_ids] if n else np.zeros(0, dtype=np.int64)
+    category = (
+        2 * np.bincount(title_rows, weights=w_category[article_category[title_rows], title_cols], minlength=n)
+        + np.bincount(content_rows, weights=w_category[article_category[content_rows], content_cols], minlength=n)
+    )
+    
+    # 블랙리스트 여부
+    bl_rows, bl_cols = coords['blacklist']
+    blacklisted = np.bincount(bl_rows, weights=blacklist_mask[bl_cols], minlength=n) > 0
+    
+    # 순서 점수: 블랙리스트를 제외한 그룹 내 남은 기사 수 - 순번
+    kept = (~blacklisted).astype(np.int64)
+    kept_per_group = np.bincount(group_ids, weights=kept, minlength=len(groups)).astype(np.int64)
+    order = np.argsort(group_ids, kind='stable')
+    rank_sorted = np.cumsum(kept[order]) - 1
+    group_start = np.concatenate([[0], np.cumsum(kept_per_group)[:-1]]) if len(groups) else np.zeros(0, dtype=np.int64)
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = rank_sorted - group_start[group_ids[order]]
+    recency = np.where(blacklisted, 0, kept_per_group[group_ids] - rank) if n else np.zeros(0)
+    
+    if dedup:
+        clusters, sources = _group_clusters(rows, group_ids)
+    else:
+        clusters, sources = np.arange(n, dtype=np.int64), np.ones(n, dtype=np.int64)
+    
+    total = (
+        investment * weights['investment']
+        + category * weights['category']
+        + recency * weights['recency']
+        + (sources - 1) * weights.get('sources', 0)
+    )
+    eligible = ~blacklisted & (investment >= MINIMUM_INVESTMENT_SCORE)
+    
+    return ScoreTable(groups, group_ids, blacklisted, investment, category, recency, total, eligible, clusters, sources)
+
+
+def rank_articles(
+    rows: Sequence[Sequence[str]],
+    top_n: Optional[int] = 5,
+    weights: Optional[Dict[str, float]] = None,
+    dedup: bool = DEDUP_ENABLED
+) -> Dict[Tuple[str, str], List[int]]:
+    """(날짜, 카테고리)별 선별 기사 인덱스를 종합 점수 순으로 반환
+    
+    유사 기사 묶음에서는 점수가 가장 높은 기사 하나만 선택함
+    
+    Args:
+        rows: [날짜, 카테고리, 제목, 요약, 링크] 행들
+        top_n: 그룹별 최대 선택 수 (None이면 전체)
+        weights: 종합 점수 가중치 (기본값: SCORE_WEIGHTS)
+        dedup: 유사 기사 묶기 여부
+    
+    Returns:
+        Dict[Tuple[str, str], List[int]]: 그룹별 rows 인덱스 리스트 (선별 대상이 없어도 그룹은 포함)
+    """
+    table = score_articles(rows, weights, dedup)
+    ranked = {group: [] for group in table.groups}
+    used_clusters = set()
+    
+    # 그룹 오름차순 → 점수 내림차순 → 원래 순서 (동점은 입력 순서 유지)
+    candidates = np.flatnonzero(table.eligible)
+    order = np.lexsort((candidates, -table.total[candidates], table.group_ids[candidates]))
+    for index in candidates[order]:
+        selected = ranked[table.groups[table.group_ids[index]]]
+        if table.clusters[index] in used_clusters:
+            continue
+        if top_n is None or len(selected) < top_n:
+            used_clusters.add(table.clusters[index])
+            selected.append(int(index))
+    return ranked
+
+
+def select_top_by_category(
+    rows: Sequence[Sequence[str]],
+    top_n: int = 5,
+    weights: Optional[Dict[str, float]] = None,
+    dedup: bool = DEDUP_ENABLED
+) -> Dict[str, List[Tuple[str, str, str]]]:
+    """하루치 기사를 카테고리별로 한 번에 선별
+    
+    Args:
+        rows: [날짜, 카테고리, 제목, 요약, 링크] 행들 (단일 날짜)
+        top_n: 카테고리별 최대 선택 수
+        weights: 종합 점수 가중치 (기본값: SCORE_WEIGHTS)
+        dedup: 유사 기사 묶기 여부
+    
+    Returns:
+        Dict[str, List[Tuple[str, str, str]]]: 카테고리별 (제목, 요약, 링크) 리스트
+    """
+    selected = {}
+    for (_, category), indices in rank_articles(rows, top_n, weights, dedup).items():
+        selected.setdefault(category, []).extend(
+            (rows[i][2], rows[i][3], rows[i][4]) for i in indices
+        )
+    return selected
+
+
+def load_csv_rows(paths: Iterable[str]) -> List[List[str]]:
+    """보관된 CSV 파일들에서 기사 행 읽기
+    
+    Args:
+        paths: CSV 파일 경로들
+    
+    Returns:
+        List[List[str]]: [날짜, 카테고리, 제목, 요약, 링크] 행 리스트
+    """
+    rows = []
+    for path in paths:
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            next(reader, None)  # skip header
+            rows.extend(row for row in reader if len(row) == 5)
+    return rows
+
+
+def main():
+    """보관된 CSV 전체를 다시 점수화해 선별 결과를 출력"""
+    parser = argparse.ArgumentParser(description="보관된 뉴스 CSV 일괄 재점수화")
+    parser.add_argument("paths", nargs="*", help="CSV 파일 (기본값: PROCESSED_DATA_DIR 전체)")
+    parser.add_argument("--top-n", type=int, default=5, help="날짜/카테고리별 선택 수")
+    parser.add_argument("--investment", type=float, default=SCORE_WEIGHTS['investment'], help="투자 관련성 가중치")
+    parser.add_argument("--category", type=float, default=SCORE_WEIGHTS['category'], help="카테고리 특화 가중치")
+    parser.add_argument("--recency", type=float, default=SCORE_WEIGHTS['recency'], help="최신성 가중치")
+    parser.add_argument("--sources", type=float, default=SCORE_WEIGHTS['sources'], help="추가 언론사 수 가중치")
+    parser.add_argument("--no-dedup", action="store_true", help="유사 기사 묶기 끄기")
+    parser.add_argument("--output", help="선별 결과를 저장할 CSV 경로")
+    args = parser.parse_args()
+    
+    paths = args.paths or sorted(glob.glob(os.path.join(PROCESSED_DATA_DIR, '**', '*.csv'), recursive=True))
+    rows = load_csv_rows(paths)
+    weights = {
+        'investment': args.investment,
+        'category': args.category,
+        'recency': args.recency,
+        'sources': args.sources
+    }
+    dedup = not args.no_dedup
+    
+    table = score_articles(rows, weights, dedup)
+    ranked = rank_articles(rows, args.top_n, weights, dedup)
+    selected = sum(len(indices) for indices in ranked.values())
+    print(f"{len(paths)}개 파일, {len(rows)}개 기사, {len(ranked)}개 그룹 → {selected}개 선택")
+    
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['날짜', '카테고리', '순위', '제목', '링크', '총점', '투자점수', '카테고리점수', '출처수'])
+            for (date, category), indices in ranked.items():
+                for position, i in enumerate(indices, 1):
+                    writer.writerow([
+                        date, category, position, rows[i][2], rows[i][4],
+                        f"{table.total[i]:.2f}", f"{table.investment[i]:g}", f"{table.category[i]:g}",
+                        int(table.sources[i])
+                    ])
+        print(f"선별 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,51 +1,73 @@
 import os
 import sys
-from collections import defaultdict
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from src.utils import (
     get_kst_date, 
     get_kst_date_with_weekday,
-    get_sheets_client,
-    get_all_values,
-    create_worksheet_if_not_exists,
-    append_row_to_sheet,
     summarize_title,
     summarize_content,
-    get_category_trend
+    get_category_trend,
+    summarize_categories_batch,
+    log_cache_stats,
+    log_token_usage
 )
-from src.config import SPREADSHEET_ID, SOURCE_SHEET, TARGET_SHEET
+from src.storage import get_article_store
+from src.processors.batch_scoring import select_top_by_category
+from src.config import SUMMARY_BATCH_MODE, NEWS_URL, KEYWORDS
 
 
 def fetch_today_news():
-    """오늘자 뉴스 데이터를 Google Sheets에서 가져오기"""
-    sh = get_sheets_client(SPREADSHEET_ID)
-    rows = get_all_values(SPREADSHEET_ID, SOURCE_SHEET)
+    """오늘자 뉴스 데이터 가져오기 (로컬 저장소 우선, 없으면 Google Sheets)"""
+    from src.uploaders.sheets_sync import load_articles
+    return load_articles([get_kst_date()])
+
+
+def summarize_categories(grouped, batch=SUMMARY_BATCH_MODE):
+    """카테고리별 (트렌드, [(제목 요약, 내용 요약), ...]) 반환
     
-    today = get_kst_date()
-    filtered = [r for r in rows if r[0] == today and "본문 추출 실패" not in r[3]]
-    return filtered, sh
+    배치 모드에서는 카테고리당 1회씩 모든 카테고리 요청을 동시에 보냄
+    """
+    if batch:
+        return summarize_categories_batch(grouped)
+    
+    results = {}
+    for cat, items in grouped.items():
+        trend = get_category_trend(items)
+        summaries = [(summarize_title(title), summarize_content(content)) for title, content, _ in items]
+        results[cat] = (trend, summaries)
+    return results
 
 
-def compose_kakao_message(grouped):
-    """카카오톡에 최적화된 메시지 작성"""
-    today_str = get_kst_date_with_weekday()
+def render_kakao_message(grouped, summarized, date=None):
+    """요약 결과로 카카오톡 메시지 작성 (date가 없으면 오늘 날짜로 작성)
+    
+    Args:
+        grouped: 카테고리별 (제목, 내용, 링크) 튜플 리스트 (메시지의 카테고리 순서)
+        summarized: summarize_categories 결과
+        date: 날짜 (YYYY-MM-DD)
+    
+    Returns:
+        str: 카카오톡 메시지
+    """
+    today_str = get_kst_date_with_weekday(date)
+    
+    # 선별된 뉴스가 전혀 없는 경우
+    if not grouped:
+        return f"📅 {today_str} 경제뉴스입니다\n\n오늘은 투자 관련 뉴스가 없습니다.\n\n📌 전체뉴스\n{NEWS_URL}"
     
     lines = [f"📅 {today_str} 경제뉴스입니다\n"]
     
     for cat, items in grouped.items():
         lines.append(f"【{cat}】")
         
-        # 카테고리 트렌드
-        trend = get_category_trend(items)
-        lines.append(f"💡 {trend}\n")
+        trend, summaries = summarized[cat]
+        lines.append(f"💡 {trend}")
+        lines.append(f"(투자 관련 뉴스 {len(items)}개)\n")
         
         # 각 기사 제목과 내용 요약
-        for idx, (title, content, link) in enumerate(items[:5], 1):
-            title_summary = summarize_title(title)
-            content_summary = summarize_content(content)
-            
+        for idx, (title_summary, content_summary) in enumerate(summaries, 1):
             lines.append(f"{idx}. {title_summary}")
             lines.append(f"   → {content_summary}")
             
@@ -62,40 +84,52 @@ def compose_kakao_message(grouped):
     return "\n".join(lines)
 
 
+def compose_kakao_message(grouped, batch=SUMMARY_BATCH_MODE, date=None):
+    """카카오톡에 최적화된 메시지 작성 (date가 없으면 오늘 날짜로 작성)
+    
+    스트리밍 파이프라인, DAG, google_upload 스크립트가 같은 메시지를 만들도록 공통으로 사용
+    """
+    # 선별된 기사가 없는 카테고리는 제외
+    grouped = {cat: items for cat, items in grouped.items() if items}
+    
+    # 카테고리 트렌드 및 기사 요약
+    summarized = summarize_categories({cat: items[:5] for cat, items in grouped.items()}, batch=batch)
+    return render_kakao_message(grouped, summarized, date)
+
+
+def select_daily_articles(rows, top_n=5):
+    """하루치 기사 행에서 카테고리별 상위 기사 선별
+    
+    스트리밍 파이프라인과 같은 투자 관련성 점수로 고르며, 카테고리는 KEYWORDS 순서로 정렬
+    
+    Args:
+        rows: [날짜, 카테고리, 제목, 요약, 링크] 행들 (본문 수집 실패 기사 제외)
+        top_n: 카테고리별 선택 수
+    
+    Returns:
+        Dict[str, List[Tuple[str, str, str]]]: 카테고리별 (제목, 요약, 링크) 리스트
+    """
+    selected = select_top_by_category(rows, top_n=top_n)
+    return {cat: selected[cat] for cat in KEYWORDS if cat in selected}
+
+
 def main():
     """메인 실행 함수"""
     today = get_kst_date()
-    rows, sh = fetch_today_news()
-
-    grouped = defaultdict(list)
-    for row in rows:
-        category, title, content, link = row[1], row[2], row[3], row[4]
-        grouped[category].append((title, content, link))
-
-    # 카테고리별 5개로 제한
-    for cat in grouped:
-        grouped[cat] = grouped[cat][:5]
-
-    kakao_message = compose_kakao_message(grouped)
-    
-    # 타겟 워크시트 생성 또는 가져오기
-    target_ws = create_worksheet_if_not_exists(
-        SPREADSHEET_ID, 
-        TARGET_SHEET, 
-        rows=100, 
-        cols=3,
-        headers=["날짜", "요약", "부동산인사이트"]
-    )
-    
-    # 데이터 추가
-    append_row_to_sheet(
-        SPREADSHEET_ID,
-        TARGET_SHEET,
-        [today, kakao_message, ""]
-    )
+    rows = fetch_today_news()
+    
+    # 스트리밍 파이프라인과 같은 선별/메시지 작성 경로 사용
+    kakao_message = compose_kakao_message(select_daily_articles(rows))
+    
+    # 로컬 저장소에 저장 후 요약결과 시트에 동기화
+    get_article_store().save_summary(today, kakao_message)
+    from src.uploaders.sheets_sync import sync_summaries
+    sync_summaries()
     
     # 콘솔에도 출력
     print(kakao_message)
+    log_cache_stats()
+    log_token_usage()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,164 @@
+import os
+import sys
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.storage.article_store import FAILED_CONTENT_MARKERS
+from src.config import (
+    DEDUP_SHINGLE_SIZE,
+    DEDUP_NUM_PERM,
+    DEDUP_BANDS,
+    DEDUP_THRESHOLD,
+    DEDUP_CONTENT_CHARS
+)
+
+# MinHash 해시 함수 (a * x + b) mod p 계수 (실행마다 같은 결과가 나오도록 고정 시드)
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(1, 1 << 31, size=DEDUP_NUM_PERM).astype(np.uint64)
+_PERM_B = _rng.randint(0, 1 << 31, size=DEDUP_NUM_PERM).astype(np.uint64)
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+class Cluster(NamedTuple):
+    """유사 기사 묶음"""
+    representative: int     # 대표 기사 인덱스 (묶음 중 입력 순서가 가장 앞선 기사)
+    members: List[int]      # 묶음에 속한 기사 인덱스 (입력 순서)
+    
+    @property
+    def size(self) -> int:
+        return len(self.members)
+
+
+def _normalize(title: str, content: str) -> str:
+    """비교용 텍스트 (제목 + 본문 앞부분, 공백 제거)"""
+    content = content or ''
+    if any(marker in content for marker in FAILED_CONTENT_MARKERS):
+        content = ''
+    return _WHITESPACE.sub('', f"{title or ''}{content[:DEDUP_CONTENT_CHARS]}")
+
+
+def shingles(text: str, size: int = DEDUP_SHINGLE_SIZE) -> np.ndarray:
+    """문자 n-gram 해시 집합
+    
+    Args:
+        text: 정규화된 텍스트
+        size: n-gram 길이
+    
+    Returns:
+        np.ndarray: 중복 없는 32비트 해시 배열
+    """
+    if len(text) <= size:
+        grams = [text] if text else []
+    else:
+        grams = [text[i:i + size] for i in range(len(text) - size + 1)]
+    return np.unique(np.fromiter((zlib.crc32(g.encode('utf-8')) for g in grams), dtype=np.uint64, count=len(grams)))
+
+
+def minhash(hashes: np.ndarray) -> np.ndarray:
+    """n-gram 해시 집합의 MinHash 서명
+    
+    Args:
+        hashes: shingles 결과
+    
+    Returns:
+        np.ndarray: 길이 DEDUP_NUM_PERM의 서명 (빈 집합이면 최댓값으로 채움)
+    """
+    if hashes.size == 0:
+        return np.full(DEDUP_NUM_PERM, _MAX_HASH, dtype=np.uint64)
+    # (순열 수 × n-gram 수) 행렬에서 순열별 최솟값
+    permuted = (np.outer(_PERM_A, hashes) + _PERM_B[:, None]) % _MERSENNE_PRIME & _MAX_HASH
+    return permuted.min(axis=1)
+
+
+def cluster_articles(
+    titles: Sequence[str],
+    contents: Sequence[str],
+    threshold: float = DEDUP_THRESHOLD,
+    bands: int = DEDUP_BANDS
+) -> List[Cluster]:
+    """제목과 첫 문단이 거의 같은 기사끼리 묶기 (MinHash + LSH)
+    
+    서명을 bands개 구간으로 나눠 같은 구간 값을 가진 기사만 후보로 비교하고,
+    추정 자카드 유사도가 threshold 이상이면 같은 묶음으로 합침
+    
+    Args:
+        titles: 기사 제목들
+        contents: 기사 본문(요약)들
+        threshold: 같은 기사로 볼 최소 자카드 유사도
+        bands: LSH 구간 수 (DEDUP_NUM_PERM의 약수)
+    
+    Returns:
+        List[Cluster]: 입력 순서대로 정렬된 묶음 목록 (단독 기사도 크기 1 묶음으로 포함)
+    """
+    n = len(titles)
+    if n == 0:
+        return []
+    
+    texts = [_normalize(title, content) for title, content in zip(titles, contents)]
+    signatures = np.vstack([minhash(shingles(text)) for text in texts])
+    rows_per_band = DEDUP_NUM_PERM // bands
+    
+    parent = list(range(n))
+    
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    checked = set()
+    for band in range(bands):
+        buckets = defaultdict(list)
+        chunk = signatures[:, band * rows_per_band:(band + 1) * rows_per_band]
+        for i in range(n):
+            if texts[i]:
+                buckets[chunk[i].tobytes()].append(i)
+        
+        for members in buckets.values():
+            for pos, i in enumerate(members):
+                for j in members[pos + 1:]:
+                    if (i, j) in checked:
+                        continue
+                    checked.add((i, j))
+                    if np.mean(signatures[i] == signatures[j]) >= threshold:
+                        root_i, root_j = find(i), find(j)
+                        if root_i != root_j:
+                            # 입력 순서가 앞선 기사를 대표로 유지
+                            parent[max(root_i, root_j)] = min(root_i, root_j)
+    
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for i in range(n):
+        groups[find(i)].append(i)
+    return [Cluster(root, members) for root, members in sorted(groups.items())]
+
+
+def cluster_labels(
+    titles: Sequence[str],
+    contents: Sequence[str],
+    threshold: Optional[float] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """기사별 묶음 번호와 묶음 크기
+    
+    Args:
+        titles: 기사 제목들
+        contents: 기사 본문(요약)들
+        threshold: 같은 기사로 볼 최소 자카드 유사도 (기본값: DEDUP_THRESHOLD)
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (대표 기사 인덱스, 묶음 크기(출처 수)) 배열
+    """
+    labels = np.arange(len(titles), dtype=np.int64)
+    sizes = np.ones(len(titles), dtype=np.int64)
+    for cluster in cluster_articles(titles, contents, threshold or DEDUP_THRESHOLD):
+        labels[cluster.members] = cluster.representative
+        sizes[cluster.members] = cluster.size
+    return labels, sizes
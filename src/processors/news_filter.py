@@ -0,0 +1,134 @@
+import os
+import sys
+import threading
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.utils.keyword_matcher import KeywordHit, KeywordMatcher
+from src.config import KEYWORDS, INVESTMENT_KEYWORDS, BLACKLIST_KEYWORDS, CATEGORY_KEYWORDS
+
+# 본문에서 점수/블랙리스트 판정에 사용하는 앞부분 길이
+SCORE_CONTENT_CHARS = 200
+BLACKLIST_CONTENT_CHARS = 500
+
+_matcher: Optional[KeywordMatcher] = None
+_topic_matcher: Optional[KeywordMatcher] = None
+_matcher_lock = threading.Lock()
+
+
+def get_filter_matcher() -> KeywordMatcher:
+    """투자/블랙리스트/카테고리 키워드를 모두 담은 매처 반환 (프로세스당 한 번 생성)
+    
+    그룹 이름은 'investment', 'blacklist', ('category', 카테고리명)
+    
+    Returns:
+        KeywordMatcher: 공유 매처
+    """
+    global _matcher
+    if _matcher is None:
+        with _matcher_lock:
+            if _matcher is None:
+                matcher = KeywordMatcher()
+                matcher.add_group('investment', INVESTMENT_KEYWORDS)
+                matcher.add_group('blacklist', BLACKLIST_KEYWORDS)
+                for category, keywords in CATEGORY_KEYWORDS.items():
+                    matcher.add_group(('category', category), keywords)
+                _matcher = matcher
+    return _matcher
+
+
+def get_topic_matcher() -> KeywordMatcher:
+    """스크래퍼 카테고리 분류용 매처 반환 (그룹 이름은 카테고리명)
+    
+    Returns:
+        KeywordMatcher: 공유 매처
+    """
+    global _topic_matcher
+    if _topic_matcher is None:
+        with _matcher_lock:
+            if _topic_matcher is None:
+                _topic_matcher = KeywordMatcher(KEYWORDS)
+    return _topic_matcher
+
+
+def categorize_title(title: str) -> Optional[str]:
+    """제목을 KEYWORDS 순서상 처음 매칭되는 카테고리로 분류
+    
+    Args:
+        title: 기사 제목
+    
+    Returns:
+        str: 카테고리명 (매칭되는 키워드가 없으면 None)
+    """
+    return get_topic_matcher().first_group(title, KEYWORDS)
+
+
+def scan_article(title: str, content: str) -> List[KeywordHit]:
+    """제목과 본문 앞부분을 한 번씩 순회해 모든 필터 키워드 매칭 반환
+    
+    Args:
+        title: 기사 제목
+        content: 기사 본문(요약)
+    
+    Returns:
+        List[KeywordHit]: field가 'title' 또는 'content'인 매칭 목록
+    """
+    return get_filter_matcher().scan({
+        'title': title or '',
+        'content': (content or '')[:BLACKLIST_CONTENT_CHARS]
+    })
+
+
+def _weighted_sum(hits: List[KeywordHit], group) -> float:
+    """그룹별 키워드 점수 합산 (키워드마다 제목 2배, 본문 앞부분 1배, 출현 횟수와 무관)"""
+    title_words = {}
+    content_words = {}
+    for hit in hits:
+        if hit.group != group:
+            continue
+        if hit.field == 'title':
+            title_words[hit.keyword] = hit.weight
+        elif hit.field == 'content' and hit.end <= SCORE_CONTENT_CHARS:
+            content_words[hit.keyword] = hit.weight
+    return sum(title_words.values()) * 2 + sum(content_words.values())
+
+
+def calculate_investment_score(title, content, hits: Optional[List[KeywordHit]] = None):
+    """투자 관련성 점수 계산
+    
+    Args:
+        title: 기사 제목
+        content: 기사 본문(요약)
+        hits: scan_article 결과 (없으면 새로 계산)
+    """
+    if hits is None:
+        hits = scan_article(title, content)
+    return _weighted_sum(hits, 'investment')
+
+
+def has_blacklist_keywords(title, content, hits: Optional[List[KeywordHit]] = None):
+    """블랙리스트 키워드 포함 여부 확인
+    
+    Args:
+        title: 기사 제목
+        content: 기사 본문(요약)
+        hits: scan_article 결과 (없으면 새로 계산)
+    """
+    if hits is None:
+        hits = scan_article(title, content)
+    return any(hit.group == 'blacklist' for hit in hits)
+
+
+def calculate_category_score(title, content, category, hits: Optional[List[KeywordHit]] = None):
+    """카테고리별 특화 키워드 점수
+    
+    Args:
+        title: 기사 제목
+        content: 기사 본문(요약)
+        category: 카테고리명
+        hits: scan_article 결과 (없으면 새로 계산)
+    """
+    if hits is None:
+        hits = scan_article(title, content)
+    return _weighted_sum(hits, ('category', category))
@@ -8,13 +8,20 @@ from src.utils import (
     get_all_values,
     update_cell,
     find_cell,
-    generate_real_estate_insight
+    generate_real_estate_insight,
+    log_token_usage
 )
+from src.storage import get_article_store
+from src.uploaders.sheets_sync import sync_summaries
 from src.config import SPREADSHEET_ID, TARGET_SHEET
 
 
 def get_today_summary():
-    """오늘자 요약 데이터 가져오기"""
+    """오늘자 요약 데이터 가져오기 (로컬 저장소 우선, 없으면 Google Sheets)"""
+    message = get_article_store().get_summary(get_kst_date())
+    if message:
+        return message, None
+    
     records = get_all_values(SPREADSHEET_ID, TARGET_SHEET, skip_headers=False)
     today = get_kst_date()
     
@@ -35,6 +42,15 @@ def main():
         return
 
     insight = generate_real_estate_insight(text_block)
+    log_token_usage()
+    
+    store = get_article_store()
+    if store.get_summary(today):
+        # 로컬 저장소에 저장 후 요약결과 시트의 해당 행만 동기화
+        store.save_insight(today, 'real_estate', insight)
+        sync_summaries(store)
+        print("부동산 인사이트 저장 완료")
+        return
     
     # 오늘 날짜의 셀 찾기
     cell = find_cell(SPREADSHEET_ID, TARGET_SHEET, today)
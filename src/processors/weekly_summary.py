@@ -7,20 +7,17 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 from src.utils import (
     get_kst_date,
     get_week_dates,
-    get_all_values,
-    create_worksheet_if_not_exists,
-    append_row_to_sheet,
-    generate_weekly_summary
+    generate_weekly_summaries,
+    log_cache_stats,
+    log_token_usage
 )
-from src.config import SPREADSHEET_ID, SOURCE_SHEET, WEEKLY_SHEET
+from src.storage import get_article_store
+from src.uploaders.sheets_sync import load_articles, sync_weekly
 
 
 def fetch_week_news():
-    """일주일간의 뉴스 데이터 가져오기"""
-    rows = get_all_values(SPREADSHEET_ID, SOURCE_SHEET)
-    week_dates = get_week_dates()
-    filtered = [r for r in rows if r[0] in week_dates and "본문 추출 실패" not in r[3]]
-    return filtered
+    """일주일간의 뉴스 데이터 가져오기 (로컬 저장소 우선, 없는 날짜만 Google Sheets)"""
+    return load_articles(get_week_dates())
 
 
 def main():
@@ -39,30 +36,21 @@ def main():
     today = get_kst_date()
     weekly_output = [f"📅 {today} 주간 경제 뉴스 요약\n"]
     
-    for cat, texts in grouped.items():
-        joined = "\n\n".join(texts[:5])
-        insight = generate_weekly_summary(joined)
+    # 카테고리별 인사이트 동시 생성
+    categories = list(grouped)
+    insights = generate_weekly_summaries(["\n\n".join(grouped[cat][:5]) for cat in categories])
+    for cat, insight in zip(categories, insights):
         weekly_output.append(f"📌 {cat} 인사이트\n{insight}\n")
 
     output_text = "\n\n".join(weekly_output)
 
-    # 주간요약 워크시트 생성 또는 가져오기
-    ws = create_worksheet_if_not_exists(
-        SPREADSHEET_ID,
-        WEEKLY_SHEET,
-        rows=100,
-        cols=2,
-        headers=["날짜", "요약"]
-    )
-    
-    # 데이터 추가
-    append_row_to_sheet(
-        SPREADSHEET_ID,
-        WEEKLY_SHEET,
-        [today, output_text]
-    )
+    # 로컬 저장소에 저장 후 주간요약 시트에 동기화
+    get_article_store().save_insight(today, 'weekly', output_text)
+    sync_weekly()
     
     print(output_text)
+    log_cache_stats()
+    log_token_usage()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+import csv
+import json
+import logging
+import os
+from typing import Dict, Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기사 레코드 스키마 (CSV/시트 열 순서와 동일)
+ARTICLE_FIELDS = ('date', 'category', 'title', 'summary', 'link')
+CSV_HEADERS = ['날짜', '카테고리', '제목', '요약', '링크']
+
+
+def make_records(date: str, results: Dict[str, List[tuple]], min_items: int = 0) -> List[Dict[str, str]]:
+    """스크래핑 결과를 기사 레코드 리스트로 변환
+    
+    Args:
+        date: 수집 날짜 (YYYY-MM-DD)
+        results: 카테고리별 (제목, 링크, 첫 문단) 튜플 리스트
+        min_items: 이보다 적게 수집된 카테고리는 제외
+    
+    Returns:
+        List[Dict[str, str]]: ARTICLE_FIELDS 키를 가진 레코드 리스트
+    """
+    return [
+        {'date': date, 'category': category, 'title': title, 'summary': paragraph, 'link': link}
+        for category, items in results.items() if len(items) >= min_items
+        for title, link, paragraph in items
+    ]
+
+
+def records_to_rows(records: Iterable[Dict[str, str]]) -> List[Tuple[str, ...]]:
+    """레코드를 (날짜, 카테고리, 제목, 요약, 링크) 튜플로 변환
+    
+    Args:
+        records: 기사 레코드들
+    
+    Returns:
+        List[Tuple[str, ...]]: 행 튜플 리스트
+    """
+    return [tuple(record[field] for field in ARTICLE_FIELDS) for record in records]
+
+
+def write_records(path: str, records: Iterable[Dict[str, str]]) -> None:
+    """기사 레코드를 JSONL 파일로 저장
+    
+    Args:
+        path: 저장 경로 (.jsonl)
+        records: 기사 레코드들
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps({field: record[field] for field in ARTICLE_FIELDS}, ensure_ascii=False) + '\n')
+
+
+def read_records(path: str) -> List[Dict[str, str]]:
+    """JSONL 파일에서 기사 레코드 읽기 (스키마에 맞지 않는 줄은 경고 후 건너뜀)
+    
+    Args:
+        path: JSONL 파일 경로
+    
+    Returns:
+        List[Dict[str, str]]: 기사 레코드 리스트
+    """
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning(f"{path}:{line_no} JSON 파싱 실패")
+                continue
+            if not isinstance(record, dict) or not all(isinstance(record.get(field), str) for field in ARTICLE_FIELDS):
+                logger.warning(f"{path}:{line_no} 스키마 불일치")
+                continue
+            records.append(record)
+    return records
+
+
+def write_records_csv(path: str, records: Iterable[Dict[str, str]]) -> None:
+    """기사 레코드를 CSV 파일로 저장
+    
+    Args:
+        path: 저장 경로 (.csv)
+        records: 기사 레코드들
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADERS)
+        writer.writerows(records_to_rows(records))
+
+
+def render_markdown(path: str, date: str, records: Iterable[Dict[str, str]]) -> None:
+    """기사 레코드를 사람이 읽는 Markdown 파일로 저장
+    
+    Args:
+        path: 저장 경로 (.md)
+        date: 수집 날짜 (YYYY-MM-DD)
+        records: 기사 레코드들
+    """
+    by_category = {}
+    for record in records:
+        by_category.setdefault(record['category'], []).append(record)
+    
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"# 📅 {date} 네이버 경제 키워드 뉴스 요약\n\n")
+        for category, items in by_category.items():
+            f.write(f"## 📌 {category}\n\n")
+            for i, record in enumerate(items, 1):
+                f.write(f"{i}. **{record['title']}**\n   - {record['summary']}\n   - [기사 링크]({record['link']})\n\n")
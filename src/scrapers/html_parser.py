@@ -0,0 +1,225 @@
+import codecs
+import logging
+from html.parser import HTMLParser
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 선택적 C 기반 파서 (설치되어 있지 않으면 BeautifulSoup 사용)
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml.etree
+    import lxml.html
+except ImportError:
+    lxml = None
+
+ARTICLE_ID = 'dic_area'
+RANKING_BOX_CLASS = 'rankingnews_box'
+
+# 본문 텍스트에서 제외하는 태그 (BeautifulSoup get_text와 동일)
+NON_TEXT_TAGS = ('script', 'style', 'template')
+
+
+# --- selectolax (lexbor) ---
+
+def _selectolax_article_text(html: str) -> Optional[str]:
+    node = LexborHTMLParser(html).css_first(f'#{ARTICLE_ID}')
+    if node is None:
+        return None
+    node.strip_tags(list(NON_TEXT_TAGS))
+    return node.text(deep=True, separator='', strip=True)
+
+
+def _selectolax_ranking_links(html: str) -> List[Tuple[str, str]]:
+    return [
+        (node.text().strip(), node.attributes.get('href') or '')
+        for node in LexborHTMLParser(html).css(f'.{RANKING_BOX_CLASS} a')
+    ]
+
+
+# --- lxml ---
+
+def _lxml_article_text(html: str) -> Optional[str]:
+    nodes = lxml.html.fromstring(html).xpath(f'//*[@id="{ARTICLE_ID}"]')
+    if not nodes:
+        return None
+    lxml.etree.strip_elements(nodes[0], *NON_TEXT_TAGS, with_tail=False)
+    return ''.join(text.strip() for text in nodes[0].itertext())
+
+
+def _lxml_ranking_links(html: str) -> List[Tuple[str, str]]:
+    xpath = f'//*[contains(concat(" ", normalize-space(@class), " "), " {RANKING_BOX_CLASS} ")]//a'
+    return [
+        (node.text_content().strip(), node.get('href') or '')
+        for node in lxml.html.fromstring(html).xpath(xpath)
+    ]
+
+
+# --- BeautifulSoup (기존 방식, 최종 대체 경로) ---
+
+def _bs4_article_text(html: str) -> Optional[str]:
+    from bs4 import BeautifulSoup
+    content = BeautifulSoup(html, 'html.parser').select_one(f'#{ARTICLE_ID}')
+    return content.get_text(strip=True) if content else None
+
+
+def _bs4_ranking_links(html: str) -> List[Tuple[str, str]]:
+    from bs4 import BeautifulSoup
+    return [
+        (node.text.strip(), node.get('href', ''))
+        for node in BeautifulSoup(html, 'html.parser').select(f'.{RANKING_BOX_CLASS} a')
+    ]
+
+
+BACKENDS: Dict[str, Tuple[Callable, Callable]] = {
+    'bs4': (_bs4_article_text, _bs4_ranking_links)
+}
+if lxml is not None:
+    BACKENDS['lxml'] = (_lxml_article_text, _lxml_ranking_links)
+if LexborHTMLParser is not None:
+    BACKENDS['selectolax'] = (_selectolax_article_text, _selectolax_ranking_links)
+
+# 'auto'일 때 사용 순서
+BACKEND_PREFERENCE = ('selectolax', 'lxml', 'bs4')
+
+
+def resolve_backend(backend: str = 'auto') -> str:
+    """사용할 파서 백엔드 이름 결정
+    
+    Args:
+        backend: 'auto', 'selectolax', 'lxml', 'bs4'
+    
+    Returns:
+        str: 설치된 백엔드 이름 ('auto'면 가장 빠른 백엔드)
+    """
+    if backend == 'auto':
+        return next(name for name in BACKEND_PREFERENCE if name in BACKENDS)
+    if backend not in BACKENDS:
+        logger.warning(f"파서 백엔드 {backend} 사용 불가, BeautifulSoup 사용")
+        return 'bs4'
+    return backend
+
+
+def _run(index: int, html: str, backend: str):
+    """백엔드 실행 (실패하면 BeautifulSoup으로 다시 파싱)"""
+    name = resolve_backend(backend)
+    try:
+        return BACKENDS[name][index](html)
+    except Exception as e:
+        if name == 'bs4':
+            raise
+        logger.warning(f"{name} 파싱 실패, BeautifulSoup으로 재시도: {str(e)}")
+        return BACKENDS['bs4'][index](html)
+
+
+def extract_article_text(html: str, backend: str = 'auto') -> Optional[str]:
+    """기사 본문(#dic_area) 텍스트 추출
+    
+    텍스트 노드를 각각 공백 제거 후 이어 붙임 (BeautifulSoup get_text(strip=True)와 동일)
+    
+    Args:
+        html: 기사 페이지 HTML
+        backend: 파서 백엔드 (기본값: 'auto')
+    
+    Returns:
+        str: 본문 텍스트 (본문 영역이 없으면 None)
+    """
+    return _run(0, html, backend)
+
+
+def extract_ranking_links(html: str, backend: str = 'auto') -> List[Tuple[str, str]]:
+    """랭킹 페이지의 기사 (제목, href) 목록 추출
+    
+    Args:
+        html: 랭킹 페이지 HTML
+        backend: 파서 백엔드 (기본값: 'auto')
+    
+    Returns:
+        List[Tuple[str, str]]: 페이지 순서대로의 (제목, href) 리스트
+    """
+    return _run(1, html, backend)
+
+
+class ArticleStreamParser(HTMLParser):
+    """#dic_area 영역만 읽고 영역이 닫히면 파싱을 끝내는 스트리밍 파서
+    
+    청크 단위로 feed하다가 done이 True가 되면 나머지 문서는 받지 않아도 됨
+    """
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.done = False
+        self._tag = None        # 본문 영역 태그 이름 (영역 안에 있을 때만 설정)
+        self._depth = 0         # 본문 영역 태그와 같은 이름의 중첩 깊이
+        self._skip = 0          # script/style 안쪽 깊이
+        self._buffer = []       # 현재 텍스트 노드 조각
+        self._parts = []        # 공백 제거된 텍스트 노드들
+    
+    def _flush(self):
+        if self._buffer:
+            text = ''.join(self._buffer).strip()
+            if text:
+                self._parts.append(text)
+            self._buffer = []
+    
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if self._tag is None:
+            if dict(attrs).get('id') == ARTICLE_ID:
+                self._tag = tag
+            return
+        self._flush()
+        if tag == self._tag:
+            self._depth += 1
+        elif tag in NON_TEXT_TAGS:
+            self._skip += 1
+    
+    def handle_endtag(self, tag):
+        if self.done or self._tag is None:
+            return
+        self._flush()
+        if tag in NON_TEXT_TAGS and self._skip:
+            self._skip -= 1
+        elif tag == self._tag:
+            if self._depth == 0:
+                self.done = True
+            else:
+                self._depth -= 1
+    
+    def handle_data(self, data):
+        if self._tag is not None and not self.done and not self._skip:
+            self._buffer.append(data)
+    
+    @property
+    def text(self) -> Optional[str]:
+        """추출한 본문 텍스트 (본문 영역을 찾지 못했으면 None)"""
+        if self._tag is None:
+            return None
+        self._flush()
+        return ''.join(self._parts)
+
+
+def stream_article_text(chunks: Iterable, encoding: Optional[str] = None) -> Optional[str]:
+    """청크 단위 HTML에서 본문 텍스트 추출 (본문 영역이 닫히면 즉시 중단)
+    
+    Args:
+        chunks: HTML 조각들 (str 또는 bytes, 예: response.iter_content())
+        encoding: bytes 청크의 인코딩 (기본값: utf-8)
+    
+    Returns:
+        str: 본문 텍스트 (본문 영역이 없으면 None)
+    """
+    parser = ArticleStreamParser()
+    decoder = codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+    for chunk in chunks:
+        parser.feed(decoder.decode(chunk) if isinstance(chunk, bytes) else chunk)
+        if parser.done:
+            break
+    else:
+        parser.close()
+    return parser.text
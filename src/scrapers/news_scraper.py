@@ -1,71 +1,227 @@
 import os
 import sys
-import requests
-from bs4 import BeautifulSoup
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
 
 # 프로젝트 루트를 Python path에 추가 (GitHub Actions 호환성 유지)
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.utils import get_kst_date, get_year_month_path
-from src.config import KEYWORDS, NEWS_URL, RAW_DATA_DIR
+from src.utils import get_kst_date, get_year_month_path, get_session
+from src.utils.fetch_cache import get_fetch_cache, normalize_url, log_fetch_cache_stats
+from src.utils.metrics import get_metrics
+from src.storage import get_article_store
+from src.processors.news_filter import categorize_title
+from src.scrapers.html_parser import extract_article_text, extract_ranking_links, stream_article_text
+from src.scrapers.article_records import make_records, records_to_rows, write_records, render_markdown
+from src.config import (
+    KEYWORDS,
+    NEWS_URL,
+    RAW_DATA_DIR,
+    MAX_COLLECTION_PER_CATEGORY,
+    MIN_ARTICLES_PER_CATEGORY,
+    WRITE_MARKDOWN,
+    SCRAPER_MAX_WORKERS,
+    SCRAPER_PER_HOST_LIMIT,
+    FETCH_CACHE_ENABLED,
+    HTML_PARSER_BACKEND,
+    HTML_PARSER_STREAMING
+)
 
+logger = logging.getLogger(__name__)
 
-def extract_first_paragraph(url):
-    """뉴스 기사의 첫 번째 문단 추출"""
+
+def first_long_paragraph(text):
+    """본문 텍스트에서 30자가 넘는 첫 번째 문단 반환 (없으면 None)"""
+    if text:
+        paragraphs = text.split('\n')
+        for p in paragraphs:
+            if len(p.strip()) > 30:
+                return p.strip()
+    return None
+
+
+def parse_first_paragraph(html, backend=HTML_PARSER_BACKEND):
+    """기사 HTML에서 30자가 넘는 첫 번째 문단 추출 (없으면 None)"""
+    return first_long_paragraph(extract_article_text(html, backend))
+
+
+def _count_bytes(chunks, metrics):
+    """스트리밍 응답 청크를 그대로 넘기면서 받은 바이트 수 집계"""
+    for chunk in chunks:
+        metrics.incr('article.bytes', len(chunk))
+        yield chunk
+
+
+def extract_first_paragraph(url, use_cache=FETCH_CACHE_ENABLED):
+    """뉴스 기사의 첫 번째 문단 추출
+    
+    캐시에 최근 검증된 결과가 있으면 요청하지 않고, 오래된 항목은
+    ETag/Last-Modified 조건부 요청으로 재검증함 (304면 다시 파싱하지 않음)
+    """
+    cache = get_fetch_cache() if use_cache else None
+    key = normalize_url(url)
+    entry = cache.get(key) if cache else None
+    
+    if entry and entry['fresh']:
+        cache.record('hits')
+        return entry['paragraph']
+    
+    headers = {'User-Agent': 'Mozilla/5.0'}
+    if entry and entry['etag']:
+        headers['If-None-Match'] = entry['etag']
+    if entry and entry['last_modified']:
+        headers['If-Modified-Since'] = entry['last_modified']
+    
+    metrics = get_metrics()
     try:
-        res = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-        soup = BeautifulSoup(res.text, 'html.parser')
-        content = soup.select_one("#dic_area")
-        if content:
-            paragraphs = content.get_text(strip=True).split('\n')
-            for p in paragraphs:
-                if len(p.strip()) > 30:
-                    return p.strip()
-        return "본문 추출 실패"
-    except:
+        with metrics.timer('article_fetch'):
+            # 스트리밍 모드에서는 본문 영역을 읽는 즉시 연결을 닫고 나머지 문서는 받지 않음
+            res = get_session().get(url, headers=headers, stream=HTML_PARSER_STREAMING)
+            if res.status_code == 304 and entry:
+                res.close()
+                cache.touch(key)
+                cache.record('revalidated')
+                return entry['paragraph']
+            
+            if HTML_PARSER_STREAMING:
+                with res:
+                    chunks = _count_bytes(res.iter_content(16384), metrics)
+                    paragraph = first_long_paragraph(stream_article_text(chunks, res.encoding))
+            else:
+                metrics.incr('article.bytes', len(res.content))
+                paragraph = parse_first_paragraph(res.text)
+        if cache:
+            cache.record('misses')
+            # 추출에 성공한 정상 응답만 캐시
+            if paragraph and res.ok:
+                cache.set(key, paragraph, res.headers.get('ETag'), res.headers.get('Last-Modified'))
+        return paragraph or "본문 추출 실패"
+    except Exception as e:
+        logger.warning(f"URL {url} 처리 중 오류: {str(e)}")
+        # 재검증에 실패해도 이전에 추출한 문단이 있으면 사용
+        if entry:
+            return entry['paragraph']
         return "본문 요청 실패"
 
 
-def main():
-    """메인 실행 함수"""
-    res = requests.get(NEWS_URL)
-    soup = BeautifulSoup(res.text, 'html.parser')
-    articles = soup.select('.rankingnews_box a')
-
-    results = {k: [] for k in KEYWORDS}
-    for article in articles:
-        title = article.text.strip()
-        href = article['href']
+def iter_first_paragraphs(
+    urls: List[str],
+    max_workers: int = SCRAPER_MAX_WORKERS,
+    per_host_limit: int = SCRAPER_PER_HOST_LIMIT
+) -> Iterator[Tuple[int, str]]:
+    """여러 기사의 첫 번째 문단을 병렬로 추출해 완료되는 순서대로 반환
+    
+    Args:
+        urls: 기사 URL 리스트
+        max_workers: 최대 동시 요청 수 (기본값: SCRAPER_MAX_WORKERS)
+        per_host_limit: 호스트별 최대 동시 요청 수 (기본값: SCRAPER_PER_HOST_LIMIT)
+        
+    Yields:
+        Tuple[int, str]: (입력 URL 인덱스, 첫 번째 문단)
+    """
+    if not urls:
+        return
+    
+    # 호스트별 세마포어는 작업 시작 전에 미리 생성 (스레드 간 경쟁 방지)
+    host_semaphores = {
+        host: threading.BoundedSemaphore(per_host_limit)
+        for host in {urlparse(url).netloc for url in urls}
+    }
+    
+    def fetch(url):
+        with host_semaphores[urlparse(url).netloc]:
+            return extract_first_paragraph(url)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch, url): i for i, url in enumerate(urls)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def fetch_first_paragraphs(
+    urls: List[str],
+    max_workers: int = SCRAPER_MAX_WORKERS,
+    per_host_limit: int = SCRAPER_PER_HOST_LIMIT
+) -> List[str]:
+    """여러 기사의 첫 번째 문단을 병렬로 추출
+    
+    Args:
+        urls: 기사 URL 리스트
+        max_workers: 최대 동시 요청 수 (기본값: SCRAPER_MAX_WORKERS)
+        per_host_limit: 호스트별 최대 동시 요청 수 (기본값: SCRAPER_PER_HOST_LIMIT)
+        
+    Returns:
+        List[str]: 입력 URL 순서와 동일한 순서의 첫 번째 문단 리스트
+    """
+    paragraphs: List[Optional[str]] = [None] * len(urls)
+    for i, paragraph in iter_first_paragraphs(urls, max_workers, per_host_limit):
+        paragraphs[i] = paragraph
+    return paragraphs
+
+
+def collect_candidates(
+    html: str,
+    max_per_category: int = MAX_COLLECTION_PER_CATEGORY
+) -> Dict[str, List[Tuple[str, str]]]:
+    """랭킹 페이지에서 카테고리별 수집 후보 (제목, 링크) 선정
+    
+    Args:
+        html: 랭킹 페이지 HTML
+        max_per_category: 카테고리별 최대 수집 개수
+    
+    Returns:
+        Dict[str, List[Tuple[str, str]]]: KEYWORDS 순서의 카테고리별 후보 (랭킹 순서 유지)
+    """
+    candidates = {k: [] for k in KEYWORDS}
+    for title, href in extract_ranking_links(html, HTML_PARSER_BACKEND):
         if not href.startswith("http"):
             link = "https://news.naver.com" + href
         else:
             link = href
 
-        for category, words in KEYWORDS.items():
-            if any(word in title for word in words):
-                if len(results[category]) < 10:
-                    paragraph = extract_first_paragraph(link)
-                    results[category].append((title, link, paragraph))
-                break
+        # 모든 카테고리 키워드를 한 번에 검색해 KEYWORDS 순서상 첫 카테고리로 분류
+        category = categorize_title(title)
+        if category and len(candidates[category]) < max_per_category:
+            candidates[category].append((title, link))
+    return candidates
+
+
+def main():
+    """메인 실행 함수"""
+    with get_metrics().timer('ranking_fetch'):
+        res = get_session().get(NEWS_URL)
+
+    # 1단계: 카테고리 분류 (수집 개수 제한 적용)
+    candidates = collect_candidates(res.text)
+
+    # 2단계: 본문 병렬 수집 (순서 유지)
+    links = [link for items in candidates.values() for _, link in items]
+    paragraphs = iter(fetch_first_paragraphs(links))
+    results = {
+        category: [(title, link, next(paragraphs)) for title, link in items]
+        for category, items in candidates.items()
+    }
 
     # 날짜별 폴더 생성
     today = get_kst_date()
     year_month = get_year_month_path()
     output_dir = os.path.join(RAW_DATA_DIR, year_month)
-    os.makedirs(output_dir, exist_ok=True)
     
-    # 저장 경로
-    output_file = os.path.join(output_dir, f"output_{today}.md")
+    # 구조화된 레코드(JSONL)를 기준 출력으로 저장, Markdown은 보기용
+    records = make_records(today, results, min_items=MIN_ARTICLES_PER_CATEGORY)
+    output_file = os.path.join(output_dir, f"output_{today}.jsonl")
+    write_records(output_file, records)
+    if WRITE_MARKDOWN:
+        render_markdown(os.path.join(output_dir, f"output_{today}.md"), today, records)
     
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(f"# 📅 {today} 네이버 경제 키워드 뉴스 요약\n\n")
-        for cat, items in results.items():
-            if len(items) >= 3:
-                f.write(f"## 📌 {cat}\n\n")
-                for i, (title, link, para) in enumerate(items[:10], 1):
-                    f.write(f"{i}. **{title}**\n   - {para}\n   - [기사 링크]({link})\n\n")
+    # 로컬 저장소에 바로 기록 (Google Sheets 동기화는 업로더가 담당)
+    get_article_store().upsert_articles(records_to_rows(records))
     
     print(f"뉴스 수집 완료: {output_file}")
+    log_fetch_cache_stats()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,8 @@
+# Storage Package
+
+from .article_store import ArticleStore, get_article_store
+
+__all__ = [
+    'ArticleStore',
+    'get_article_store'
+]
@@ -0,0 +1,307 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.config import ARTICLE_DB_PATH
+
+_store: Optional['ArticleStore'] = None
+_store_lock = threading.Lock()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    category TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    link TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    synced_at REAL,
+    sheet_row INTEGER,
+    UNIQUE (date, link)
+);
+CREATE INDEX IF NOT EXISTS idx_articles_date_category ON articles (date, category);
+CREATE INDEX IF NOT EXISTS idx_articles_link ON articles (link);
+CREATE INDEX IF NOT EXISTS idx_articles_pending ON articles (synced_at);
+
+CREATE TABLE IF NOT EXISTS summaries (
+    date TEXT PRIMARY KEY,
+    message TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    synced_at REAL,
+    sheet_row INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS insights (
+    date TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    content TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    synced_at REAL,
+    sheet_row INTEGER,
+    PRIMARY KEY (date, kind)
+);
+"""
+
+# 본문 수집에 실패한 기사 표시 문자열
+FAILED_CONTENT_MARKERS = ("본문 추출 실패", "본문 요청 실패")
+
+
+class ArticleStore:
+    """기사, 요약, 인사이트를 저장하는 로컬 SQLite 저장소
+    
+    행은 Google Sheets와 같은 [날짜, 카테고리, 제목, 요약, 링크] 형태로 반환되며,
+    synced_at이 비어 있거나 마지막 동기화 이후 수정된 행만 동기화 대상이 됨
+    """
+    
+    def __init__(self, path: str = ARTICLE_DB_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+    
+    def upsert_articles(self, rows: Iterable[Tuple[str, str, str, str, str]]) -> int:
+        """기사 저장 ((날짜, 링크) 기준, 내용이 바뀐 경우에만 갱신)
+        
+        Args:
+            rows: (날짜, 카테고리, 제목, 요약, 링크) 튜플들
+        
+        Returns:
+            int: 새로 추가되거나 변경된 기사 수
+        """
+        now = time.time()
+        changed = 0
+        with self._lock:
+            for date, category, title, content, link in rows:
+                cursor = self._conn.execute(
+                    """INSERT INTO articles (date, category, title, content, link, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (date, link) DO UPDATE SET
+                        category = excluded.category,
+                        title = excluded.title,
+                        content = excluded.content,
+                        updated_at = excluded.updated_at
+                    WHERE category != excluded.category
+                        OR title != excluded.title
+                        OR content != excluded.content""",
+                    (date, category, title, content, link, now)
+                )
+                changed += cursor.rowcount
+            self._conn.commit()
+        return changed
+    
+    def get_articles(
+        self,
+        dates: Iterable[str],
+        category: Optional[str] = None,
+        exclude_failed: bool = True
+    ) -> List[List[str]]:
+        """날짜(및 카테고리)별 기사 조회
+        
+        Args:
+            dates: 조회할 날짜들 (YYYY-MM-DD)
+            category: 카테고리 (None이면 전체)
+            exclude_failed: 본문 수집 실패 기사 제외 여부 (기본값: True)
+        
+        Returns:
+            List[List[str]]: [날짜, 카테고리, 제목, 요약, 링크] 리스트 (저장 순서)
+        """
+        dates = list(dates)
+        if not dates:
+            return []
+        
+        query = f"SELECT date, category, title, content, link FROM articles WHERE date IN ({','.join('?' * len(dates))})"
+        params = list(dates)
+        if category is not None:
+            query += " AND category = ?"
+            params.append(category)
+        query += " ORDER BY id"
+        
+        with self._lock:
+            rows = [list(row) for row in self._conn.execute(query, params)]
+        
+        if exclude_failed:
+            rows = [r for r in rows if not any(marker in r[3] for marker in FAILED_CONTENT_MARKERS)]
+        return rows
+    
+    def count_articles(self, date: str) -> int:
+        """날짜별 저장된 기사 수 조회
+        
+        Args:
+            date: 날짜 (YYYY-MM-DD)
+        
+        Returns:
+            int: 기사 수 (본문 수집 실패 포함)
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles WHERE date = ?", (date,)).fetchone()[0]
+    
+    def save_summary(self, date: str, message: str) -> None:
+        """일일 요약 메시지 저장
+        
+        Args:
+            date: 날짜 (YYYY-MM-DD)
+            message: 요약 메시지
+        """
+        with self._lock:
+            self._conn.execute(
+                """INSERT INTO summaries (date, message, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT (date) DO UPDATE SET message = excluded.message, updated_at = excluded.updated_at
+                WHERE message != excluded.message""",
+                (date, message, time.time())
+            )
+            self._conn.commit()
+    
+    def get_summary(self, date: str) -> Optional[str]:
+        """일일 요약 메시지 조회
+        
+        Args:
+            date: 날짜 (YYYY-MM-DD)
+        
+        Returns:
+            str: 요약 메시지 (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT message FROM summaries WHERE date = ?", (date,)).fetchone()
+        return row[0] if row else None
+    
+    def get_summary_rows(self) -> List[List[str]]:
+        """전체 일일 요약 조회 (부동산 인사이트 포함)
+        
+        Returns:
+            List[List[str]]: [날짜, 요약, 부동산인사이트] 리스트 (날짜순)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT s.date, s.message, COALESCE(i.content, '') FROM summaries s
+                LEFT JOIN insights i ON i.date = s.date AND i.kind = 'real_estate'
+                ORDER BY s.date"""
+            ).fetchall()
+        return [list(row) for row in rows]
+    
+    def save_insight(self, date: str, kind: str, content: str) -> None:
+        """인사이트 저장
+        
+        Args:
+            date: 날짜 (YYYY-MM-DD)
+            kind: 인사이트 종류 ('real_estate', 'weekly')
+            content: 인사이트 텍스트
+        """
+        with self._lock:
+            self._conn.execute(
+                """INSERT INTO insights (date, kind, content, updated_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT (date, kind) DO UPDATE SET content = excluded.content, updated_at = excluded.updated_at
+                WHERE content != excluded.content""",
+                (date, kind, content, time.time())
+            )
+            # 부동산 인사이트는 요약결과 시트의 요약 행에 함께 기록되므로 요약 행도 재동기화
+            if kind == 'real_estate':
+                self._conn.execute("UPDATE summaries SET updated_at = ? WHERE date = ?", (time.time(), date))
+            self._conn.commit()
+    
+    def get_insight(self, date: str, kind: str) -> Optional[str]:
+        """인사이트 조회
+        
+        Args:
+            date: 날짜 (YYYY-MM-DD)
+            kind: 인사이트 종류 ('real_estate', 'weekly')
+        
+        Returns:
+            str: 인사이트 텍스트 (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM insights WHERE date = ? AND kind = ?", (date, kind)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def get_pending_articles(self) -> List[Dict]:
+        """동기화가 필요한 기사 조회 (신규 또는 동기화 이후 변경)
+        
+        Returns:
+            List[Dict]: id, sheet_row, row([날짜, 카테고리, 제목, 요약, 링크])
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT id, sheet_row, date, category, title, content, link FROM articles
+                WHERE synced_at IS NULL OR updated_at > synced_at ORDER BY id"""
+            ).fetchall()
+        return [{'id': r[0], 'sheet_row': r[1], 'row': list(r[2:])} for r in rows]
+    
+    def get_pending_summaries(self) -> List[Dict]:
+        """동기화가 필요한 일일 요약 조회 (부동산 인사이트 포함)
+        
+        Returns:
+            List[Dict]: date, sheet_row, row([날짜, 요약, 부동산인사이트])
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT s.date, s.sheet_row, s.message, COALESCE(i.content, '') FROM summaries s
+                LEFT JOIN insights i ON i.date = s.date AND i.kind = 'real_estate'
+                WHERE s.synced_at IS NULL OR s.updated_at > s.synced_at ORDER BY s.date"""
+            ).fetchall()
+        return [{'date': r[0], 'sheet_row': r[1], 'row': [r[0], r[2], r[3]]} for r in rows]
+    
+    def get_pending_insights(self, kind: str) -> List[Dict]:
+        """동기화가 필요한 인사이트 조회
+        
+        Args:
+            kind: 인사이트 종류
+        
+        Returns:
+            List[Dict]: date, sheet_row, row([날짜, 인사이트])
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT date, sheet_row, content FROM insights
+                WHERE kind = ? AND (synced_at IS NULL OR updated_at > synced_at) ORDER BY date""",
+                (kind,)
+            ).fetchall()
+        return [{'date': r[0], 'sheet_row': r[1], 'row': [r[0], r[2]]} for r in rows]
+    
+    def mark_synced(self, table: str, keys: List[Dict], sheet_rows: Optional[List[Optional[int]]] = None) -> None:
+        """동기화 완료 표시
+        
+        Args:
+            table: 'articles', 'summaries', 'insights' 중 하나
+            keys: 행 식별자 dict 리스트 (articles: id / summaries: date / insights: date, kind)
+            sheet_rows: 행별 시트 행 번호 (None이면 기존 값 유지)
+        """
+        if table not in ('articles', 'summaries', 'insights'):
+            raise ValueError(f"알 수 없는 테이블: {table}")
+        
+        now = time.time()
+        sheet_rows = sheet_rows or [None] * len(keys)
+        with self._lock:
+            for key, sheet_row in zip(keys, sheet_rows):
+                where = " AND ".join(f"{column} = ?" for column in key)
+                self._conn.execute(
+                    f"UPDATE {table} SET synced_at = ?, sheet_row = COALESCE(?, sheet_row) WHERE {where}",
+                    [now, sheet_row, *key.values()]
+                )
+            self._conn.commit()
+    
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+def get_article_store() -> ArticleStore:
+    """프로세스 전역 기사 저장소 반환
+    
+    Returns:
+        ArticleStore: 공유 저장소 객체
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ArticleStore()
+    return _store
@@ -0,0 +1,319 @@
+import os
+import sys
+import logging
+import argparse
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.utils import (
+    create_worksheet_if_not_exists,
+    append_rows_batched,
+    call_with_quota_retry,
+    parse_updated_range,
+    record_appended_rows,
+    get_rows_for_dates,
+    load_key_index,
+    normalize_url
+)
+from src.storage import ArticleStore, get_article_store
+from src.config import SPREADSHEET_ID, SOURCE_SHEET, TARGET_SHEET, WEEKLY_SHEET, SHEETS_UPSERT_MODE
+
+logger = logging.getLogger(__name__)
+
+SHEET_HEADERS = {
+    SOURCE_SHEET: ['날짜', '카테고리', '제목', '요약', '링크'],
+    TARGET_SHEET: ['날짜', '요약', '부동산인사이트'],
+    WEEKLY_SHEET: ['날짜', '요약']
+}
+
+# 시트별 행 식별 키 열 (뉴스요약: 날짜 + 링크, 나머지: 날짜)
+SHEET_KEY_COLUMNS = {
+    SOURCE_SHEET: ('A', 'E'),
+    TARGET_SHEET: ('A',),
+    WEEKLY_SHEET: ('A',)
+}
+
+
+def sheet_key(sheet_name: str, values: List[str]) -> Tuple[str, ...]:
+    """행 식별 키 생성 (링크는 정규화해 추적 파라미터나 이전 변환기가 남긴 ')' 차이를 무시)
+    
+    Args:
+        sheet_name: 워크시트 이름
+        values: SHEET_KEY_COLUMNS 순서의 키 열 값
+    
+    Returns:
+        Tuple[str, ...]: 행 식별 키
+    """
+    if sheet_name == SOURCE_SHEET:
+        date, link = values
+        return date.strip(), normalize_url(link.strip().rstrip(')'))
+    return tuple(value.strip() for value in values)
+
+
+def _appended_row_numbers(responses: List[Dict], count: int) -> List[Optional[int]]:
+    """append_rows 응답에서 추가된 행 번호 목록 추출
+    
+    Args:
+        responses: append_rows_batched의 청크별 응답
+        count: 추가한 행 수
+    
+    Returns:
+        List[Optional[int]]: 추가 순서대로의 시트 행 번호 (알 수 없으면 None)
+    """
+    row_numbers = []
+    for response in responses:
+        parsed = parse_updated_range(response.get('updates', {}).get('updatedRange', ''))
+        if parsed is None:
+            return [None] * count
+        row_numbers.extend(range(parsed[0], parsed[1] + 1))
+    return (row_numbers + [None] * count)[:count]
+
+
+def _sync_pending(sheet_name: str, pending: List[Dict], upsert: bool = SHEETS_UPSERT_MODE) -> List[Optional[int]]:
+    """대기 중인 행을 시트에 반영 (신규 행은 일괄 추가, 변경된 행은 일괄 수정)
+    
+    upsert 모드에서는 시트의 키 열을 한 번 읽어 키가 이미 있는 행은 수정하므로
+    저장소의 행 번호 기록이 없거나 틀려도 (재실행, 새 저장소) 행이 중복되지 않음
+    
+    Args:
+        sheet_name: 워크시트 이름
+        pending: sheet_row, row 키를 가진 dict 리스트
+        upsert: 시트의 키 색인으로 기존 행 확인 여부 (기본값: SHEETS_UPSERT_MODE)
+    
+    Returns:
+        List[Optional[int]]: pending 순서대로의 시트 행 번호
+    """
+    headers = SHEET_HEADERS[sheet_name]
+    worksheet = create_worksheet_if_not_exists(
+        SPREADSHEET_ID, sheet_name, rows=100, cols=len(headers), headers=headers
+    )
+    last_column = chr(ord('A') + len(headers) - 1)
+    
+    write_items = pending
+    if upsert:
+        positions = [ord(col) - ord('A') for col in SHEET_KEY_COLUMNS[sheet_name]]
+        index = load_key_index(
+            worksheet, SHEET_KEY_COLUMNS[sheet_name], lambda values: sheet_key(sheet_name, values)
+        )
+        keys = [sheet_key(sheet_name, [item['row'][pos] for pos in positions]) for item in pending]
+        
+        # 같은 키가 여러 번 대기 중이면 마지막 값만 반영
+        latest = {}
+        for key, item in zip(keys, pending):
+            item['sheet_row'] = index.get(key)
+            latest[key] = item
+        write_items = list(latest.values())
+    
+    new_items = [item for item in write_items if item['sheet_row'] is None]
+    changed_items = [item for item in write_items if item['sheet_row'] is not None]
+    
+    if changed_items:
+        call_with_quota_retry(
+            worksheet.batch_update,
+            [
+                {'range': f"A{item['sheet_row']}:{last_column}{item['sheet_row']}", 'values': [item['row']]}
+                for item in changed_items
+            ],
+            value_input_option='RAW'
+        )
+    
+    new_rows = [item['row'] for item in new_items]
+    if new_rows:
+        responses = append_rows_batched(worksheet, new_rows, value_input_option='RAW')
+        if sheet_name == SOURCE_SHEET:
+            record_appended_rows(SPREADSHEET_ID, sheet_name, new_rows, responses)
+        for item, row_number in zip(new_items, _appended_row_numbers(responses, len(new_rows))):
+            item['sheet_row'] = row_number
+    
+    if upsert:
+        # 중복으로 건너뛴 항목도 같은 키로 반영된 행 번호를 기록
+        for key, item in zip(keys, pending):
+            item['sheet_row'] = latest[key]['sheet_row']
+    
+    logger.info(f"{sheet_name} 시트 반영: 추가 {len(new_items)}개, 수정 {len(changed_items)}개")
+    return [item['sheet_row'] for item in pending]
+
+
+def sync_articles(store: Optional[ArticleStore] = None) -> int:
+    """신규/변경 기사를 뉴스요약 시트에 동기화
+    
+    Args:
+        store: 기사 저장소 (기본값: 공유 저장소)
+    
+    Returns:
+        int: 동기화한 행 수
+    """
+    store = store or get_article_store()
+    pending = store.get_pending_articles()
+    if not pending:
+        return 0
+    
+    row_numbers = _sync_pending(SOURCE_SHEET, pending)
+    store.mark_synced('articles', [{'id': item['id']} for item in pending], row_numbers)
+    logger.info(f"{SOURCE_SHEET} 시트 동기화: {len(pending)}개 행")
+    return len(pending)
+
+
+def sync_summaries(store: Optional[ArticleStore] = None) -> int:
+    """신규/변경 일일 요약을 요약결과 시트에 동기화
+    
+    Args:
+        store: 기사 저장소 (기본값: 공유 저장소)
+    
+    Returns:
+        int: 동기화한 행 수
+    """
+    store = store or get_article_store()
+    pending = store.get_pending_summaries()
+    if not pending:
+        return 0
+    
+    row_numbers = _sync_pending(TARGET_SHEET, pending)
+    store.mark_synced('summaries', [{'date': item['date']} for item in pending], row_numbers)
+    logger.info(f"{TARGET_SHEET} 시트 동기화: {len(pending)}개 행")
+    return len(pending)
+
+
+def sync_weekly(store: Optional[ArticleStore] = None) -> int:
+    """신규/변경 주간 요약을 주간요약 시트에 동기화
+    
+    Args:
+        store: 기사 저장소 (기본값: 공유 저장소)
+    
+    Returns:
+        int: 동기화한 행 수
+    """
+    store = store or get_article_store()
+    pending = store.get_pending_insights('weekly')
+    if not pending:
+        return 0
+    
+    row_numbers = _sync_pending(WEEKLY_SHEET, pending)
+    store.mark_synced('insights', [{'date': item['date'], 'kind': 'weekly'} for item in pending], row_numbers)
+    logger.info(f"{WEEKLY_SHEET} 시트 동기화: {len(pending)}개 행")
+    return len(pending)
+
+
+def load_articles(dates: List[str], store: Optional[ArticleStore] = None) -> List[List[str]]:
+    """날짜별 기사 조회 (로컬 저장소 우선, 저장소에 없는 날짜만 Google Sheets에서 조회)
+    
+    Args:
+        dates: 조회할 날짜들 (YYYY-MM-DD)
+        store: 기사 저장소 (기본값: 공유 저장소)
+    
+    Returns:
+        List[List[str]]: 본문 수집 실패를 제외한 [날짜, 카테고리, 제목, 요약, 링크] 리스트 (날짜순)
+    """
+    store = store or get_article_store()
+    rows = store.get_articles(dates)
+    
+    missing_dates = [date for date in dates if store.count_articles(date) == 0]
+    if missing_dates:
+        sheet_rows = get_rows_for_dates(SPREADSHEET_ID, SOURCE_SHEET, missing_dates)
+        rows += [r for r in sheet_rows if "본문 추출 실패" not in r[3]]
+    
+    return sorted(rows, key=lambda r: r[0])
+
+
+def _read_sheet_rows(sheet_name: str) -> Dict[int, List[str]]:
+    """시트 전체를 한 번 읽어 행 번호별 값 반환 (헤더와 날짜가 빈 행 제외)"""
+    headers = SHEET_HEADERS[sheet_name]
+    worksheet = create_worksheet_if_not_exists(
+        SPREADSHEET_ID, sheet_name, rows=100, cols=len(headers), headers=headers
+    )
+    width = len(headers)
+    return {
+        row_num: (list(row) + [''] * width)[:width]
+        for row_num, row in enumerate(call_with_quota_retry(worksheet.get_all_values)[1:], 2)
+        if row and row[0]
+    }
+
+
+def _mark_restored(
+    store: ArticleStore,
+    table: str,
+    sheet_name: str,
+    pending: List[Dict],
+    sheet_rows: Dict[int, List[str]],
+    key_of: Callable[[Dict], Dict]
+) -> int:
+    """대기 중인 행 중 시트 내용과 같은 행만 동기화된 것으로 표시 (시트 행 번호 기록)"""
+    positions = [ord(col) - ord('A') for col in SHEET_KEY_COLUMNS[sheet_name]]
+    by_key = {}
+    for row_num, row in sheet_rows.items():
+        by_key.setdefault(sheet_key(sheet_name, [row[pos] for pos in positions]), (row_num, row))
+    
+    keys, row_numbers = [], []
+    for item in pending:
+        match = by_key.get(sheet_key(sheet_name, [item['row'][pos] for pos in positions]))
+        if match and match[1] == [str(value) for value in item['row']]:
+            keys.append(key_of(item))
+            row_numbers.append(match[0])
+    store.mark_synced(table, keys, row_numbers)
+    return len(keys)
+
+
+def restore_from_sheets(store: Optional[ArticleStore] = None) -> Dict[str, int]:
+    """Google Sheets의 기사/요약/주간요약으로 로컬 저장소 복원 (저장소 캐시가 없어진 경우)
+    
+    시트 내용과 같은 행은 동기화된 것으로 표시하므로 복원 후 동기화에서 다시 쓰지 않음.
+    저장소에 이미 있는 행은 시트 값으로 덮어쓰므로 저장소 파일이 없을 때 사용
+    
+    Args:
+        store: 기사 저장소 (기본값: 공유 저장소)
+    
+    Returns:
+        Dict[str, int]: 종류별(articles, summaries, weekly) 동기화 완료로 표시한 행 수
+    """
+    store = store or get_article_store()
+    
+    articles = _read_sheet_rows(SOURCE_SHEET)
+    store.upsert_articles(tuple(row) for row in articles.values())
+    
+    summaries = _read_sheet_rows(TARGET_SHEET)
+    for date, message, insight in summaries.values():
+        store.save_summary(date, message)
+        if insight:
+            store.save_insight(date, 'real_estate', insight)
+    
+    weekly = _read_sheet_rows(WEEKLY_SHEET)
+    for date, content in weekly.values():
+        store.save_insight(date, 'weekly', content)
+    
+    counts = {
+        'articles': _mark_restored(
+            store, 'articles', SOURCE_SHEET, store.get_pending_articles(), articles,
+            lambda item: {'id': item['id']}
+        ),
+        'summaries': _mark_restored(
+            store, 'summaries', TARGET_SHEET, store.get_pending_summaries(), summaries,
+            lambda item: {'date': item['date']}
+        ),
+        'weekly': _mark_restored(
+            store, 'insights', WEEKLY_SHEET, store.get_pending_insights('weekly'), weekly,
+            lambda item: {'date': item['date'], 'kind': 'weekly'}
+        )
+    }
+    logger.info(f"Google Sheets에서 저장소 복원: {counts}")
+    return counts
+
+
+def main():
+    """메인 실행 함수"""
+    articles = sync_articles()
+    summaries = sync_summaries()
+    weekly = sync_weekly()
+    print(f"Google Sheets 동기화 완료: 기사 {articles}건, 요약 {summaries}건, 주간요약 {weekly}건")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 저장소 → Google Sheets 동기화")
+    parser.add_argument("--restore", action="store_true", help="Google Sheets 내용으로 로컬 저장소 복원 (저장소 캐시 유실 시)")
+    args = parser.parse_args()
+    
+    if args.restore:
+        counts = restore_from_sheets()
+        print(f"저장소 복원 완료: 기사 {counts['articles']}건, 요약 {counts['summaries']}건, 주간요약 {counts['weekly']}건")
+    else:
+        main()
@@ -1,43 +1,89 @@
 import os
 import sys
 import csv
+import argparse
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from src.utils import get_kst_date, get_year_month_path, append_row_to_sheet
+from src.utils import get_kst_date, get_year_month_path
+from src.storage import get_article_store
+from src.scrapers.article_records import read_records, records_to_rows, write_records_csv
 from src.config import SPREADSHEET_ID, SOURCE_SHEET, RAW_DATA_DIR, PROCESSED_DATA_DIR
 
 
-def upload_csv_to_google_sheets(csv_file):
-    """CSV 파일을 Google Sheets에 업로드"""
+def import_csv_to_store(csv_file):
+    """CSV 파일의 기사를 로컬 저장소에 반영
+    
+    스크래퍼가 이미 저장소에 기록한 날짜는 Markdown 재파싱 결과로 덮어쓰지 않음
+    """
     with open(csv_file, newline='', encoding='utf-8') as f:
         reader = csv.reader(f)
         next(reader)  # skip header
-        for row in reader:
-            append_row_to_sheet(SPREADSHEET_ID, SOURCE_SHEET, row)
+        rows = [tuple(row) for row in reader if len(row) == 5]
+    
+    return import_rows_to_store(rows)
+
+
+def import_rows_to_store(rows):
+    """기사 행을 로컬 저장소에 반영 (저장소에 기사가 없는 날짜만)
+    
+    Args:
+        rows: (날짜, 카테고리, 제목, 요약, 링크) 튜플 리스트
+    
+    Returns:
+        int: 새로 추가된 기사 수
+    """
+    store = get_article_store()
+    missing_dates = {row[0] for row in rows if store.count_articles(row[0]) == 0}
+    return store.upsert_articles(row for row in rows if row[0] in missing_dates)
+
+
+def export_records(records_file, csv_file):
+    """스크래퍼가 저장한 JSONL 레코드를 CSV로 보관하고 로컬 저장소에 반영
+    
+    Markdown 재파싱 없이 구조화된 레코드를 그대로 사용
+    
+    Args:
+        records_file: 입력 JSONL 파일 경로
+        csv_file: 출력 CSV 파일 경로
+    
+    Returns:
+        int: 새로 추가된 기사 수
+    """
+    records = read_records(records_file)
+    write_records_csv(csv_file, records)
+    return import_rows_to_store(records_to_rows(records))
+
+
+def parse_markdown_rows(md_file):
+    """스크래퍼 Markdown 파일에서 (날짜, 카테고리, 제목, 요약, 링크) 행 추출"""
+    with open(md_file, 'r', encoding='utf-8') as md:
+        lines = md.readlines()
+    
+    rows = []
+    current_cat = None
+    date = os.path.basename(md_file).split("_")[-1].replace(".md", "")
+
+    for i, line in enumerate(lines):
+        if line.startswith("## 📌"):
+            current_cat = line.strip().replace("## 📌", "").strip()
+        elif line.strip().startswith("1.") or (len(line.strip()) > 1 and line.strip()[0].isdigit() and line.strip()[1] == "."):
+            try:
+                title_line = line.strip().split("**")[1]
+                summary = lines[i + 1].replace("- ", "").strip()
+                link = lines[i + 2].strip().split("(")[-1].rstrip(")")
+                rows.append((date, current_cat, title_line, summary, link))
+            except:
+                continue
+    return rows
 
 
 def convert_md_to_csv(md_file, csv_file):
     """Markdown 파일을 CSV로 변환"""
-    with open(md_file, 'r', encoding='utf-8') as md, open(csv_file, 'w', newline='', encoding='utf-8') as csvf:
+    with open(csv_file, 'w', newline='', encoding='utf-8') as csvf:
         writer = csv.writer(csvf)
         writer.writerow(['날짜', '카테고리', '제목', '요약', '링크'])
-
-        lines = md.readlines()
-        current_cat = None
-        date = os.path.basename(md_file).split("_")[-1].replace(".md", "")
-
-        for i, line in enumerate(lines):
-            if line.startswith("## 📌"):
-                current_cat = line.strip().replace("## 📌", "").strip()
-            elif line.strip().startswith("1.") or (len(line.strip()) > 1 and line.strip()[0].isdigit() and line.strip()[1] == "."):
-                try:
-                    title_line = line.strip().split("**")[1]
-                    summary = lines[i + 1].replace("- ", "").strip()
-                    link = lines[i + 2].split("(")[-1].rstrip(")")
-                    writer.writerow([date, current_cat, title_line, summary, link])
-                except:
-                    continue
+        writer.writerows(parse_markdown_rows(md_file))
 
 
 def main():
@@ -46,19 +92,37 @@ def main():
     year_month = get_year_month_path()
     
     # 입력 파일 경로 (RAW_DATA_DIR에서 읽기)
-    md_dir = os.path.join(RAW_DATA_DIR, year_month)
-    md_file = os.path.join(md_dir, f"output_{today}.md")
+    raw_dir = os.path.join(RAW_DATA_DIR, year_month)
+    records_file = os.path.join(raw_dir, f"output_{today}.jsonl")
+    md_file = os.path.join(raw_dir, f"output_{today}.md")
     
     # 출력 파일 경로 (PROCESSED_DATA_DIR에 저장)
     csv_dir = os.path.join(PROCESSED_DATA_DIR, year_month)
     os.makedirs(csv_dir, exist_ok=True)
     csv_file = os.path.join(csv_dir, f"output_{today}.csv")
     
-    convert_md_to_csv(md_file, csv_file)
-    upload_csv_to_google_sheets(csv_file)
+    if os.path.exists(records_file):
+        export_records(records_file, csv_file)
+    else:
+        # JSONL 레코드가 없는 이전 형식의 날짜는 Markdown을 파싱
+        convert_md_to_csv(md_file, csv_file)
+        import_csv_to_store(csv_file)
+    
+    # 로컬 저장소를 기준으로 신규/변경 행만 Google Sheets에 동기화
+    from src.uploaders.sheets_sync import sync_articles
+    sync_articles()
     
     print(f"CSV 변환 및 업로드 완료: {csv_file}")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="뉴스 CSV 변환 및 Google Sheets 업로드")
+    parser.add_argument("--rebuild-index", action="store_true", help="기존 시트 전체를 읽어 날짜 색인 재생성")
+    args = parser.parse_args()
+    
+    if args.rebuild_index:
+        from src.utils import rebuild_date_index
+        ranges = rebuild_date_index(SPREADSHEET_ID, SOURCE_SHEET)
+        print(f"날짜 색인 재생성 완료: {len(ranges)}일")
+    else:
+        main()
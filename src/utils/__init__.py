@@ -1,64 +1,110 @@
 # Utils Package
 
-from .time_utils import (
-    get_kst_now,
-    get_kst_date,
-    get_kst_date_with_weekday,
-    get_week_dates,
-    get_year_month_path,
-    is_weekend,
-    get_formatted_datetime
-)
+import importlib
 
-from .sheets_utils import (
-    setup_credentials,
-    get_credentials,
-    get_sheets_client,
-    get_worksheet,
-    create_worksheet_if_not_exists,
-    append_row_to_sheet,
-    get_all_values,
-    update_cell,
-    find_cell
-)
-
-from .api_utils import (
-    get_anthropic_headers,
-    get_claude_response,
-    summarize_title,
-    summarize_content,
-    get_category_trend,
-    generate_real_estate_insight,
-    generate_weekly_summary
-)
-
-__all__ = [
+# 공개 이름 → 하위 모듈 (처음 사용할 때 import)
+# gspread, google.oauth2, requests 등 무거운 의존성은 필요한 단계에서만 로드되어 실행 시작이 빨라짐
+_LAZY_IMPORTS = {
     # time_utils
-    'get_kst_now',
-    'get_kst_date',
-    'get_kst_date_with_weekday',
-    'get_week_dates',
-    'get_year_month_path',
-    'is_weekend',
-    'get_formatted_datetime',
+    'get_kst_now': 'time_utils',
+    'get_kst_date': 'time_utils',
+    'get_kst_date_with_weekday': 'time_utils',
+    'get_week_dates': 'time_utils',
+    'get_year_month_path': 'time_utils',
+    'is_weekend': 'time_utils',
+    'get_formatted_datetime': 'time_utils',
+    
+    # http_utils
+    'create_session': 'http_utils',
+    'get_session': 'http_utils',
+    'close_session': 'http_utils',
+    
+    # cache_utils
+    'ResponseCache': 'cache_utils',
+    'get_response_cache': 'cache_utils',
+    'get_cache_stats': 'cache_utils',
+    'log_cache_stats': 'cache_utils',
+    
+    # fetch_cache
+    'normalize_url': 'fetch_cache',
+    'FetchCache': 'fetch_cache',
+    'get_fetch_cache': 'fetch_cache',
+    'get_fetch_cache_stats': 'fetch_cache',
+    'log_fetch_cache_stats': 'fetch_cache',
+    
+    # metrics
+    'RunMetrics': 'metrics',
+    'get_metrics': 'metrics',
+    'timed': 'metrics',
+    
+    # token_ledger
+    'estimate_cost': 'token_ledger',
+    'TokenLedger': 'token_ledger',
+    'get_token_ledger': 'token_ledger',
+    'log_token_usage': 'token_ledger',
     
     # sheets_utils
-    'setup_credentials',
-    'get_credentials',
-    'get_sheets_client',
-    'get_worksheet',
-    'create_worksheet_if_not_exists',
-    'append_row_to_sheet',
-    'get_all_values',
-    'update_cell',
-    'find_cell',
+    'setup_credentials': 'sheets_utils',
+    'get_credentials': 'sheets_utils',
+    'get_gspread_client': 'sheets_utils',
+    'get_sheets_client': 'sheets_utils',
+    'get_worksheet': 'sheets_utils',
+    'invalidate_sheets_cache': 'sheets_utils',
+    'create_worksheet_if_not_exists': 'sheets_utils',
+    'append_row_to_sheet': 'sheets_utils',
+    'call_with_quota_retry': 'sheets_utils',
+    'append_rows_batched': 'sheets_utils',
+    'append_rows_to_sheet': 'sheets_utils',
+    'get_all_values': 'sheets_utils',
+    'update_cell': 'sheets_utils',
+    'find_cell': 'sheets_utils',
+    
+    # sheet_index
+    'parse_updated_range': 'sheet_index',
+    'get_date_index': 'sheet_index',
+    'update_date_index': 'sheet_index',
+    'record_appended_rows': 'sheet_index',
+    'rebuild_date_index': 'sheet_index',
+    'get_rows_for_dates': 'sheet_index',
+    'load_key_index': 'sheet_index',
     
     # api_utils
-    'get_anthropic_headers',
-    'get_claude_response',
-    'summarize_title',
-    'summarize_content',
-    'get_category_trend',
-    'generate_real_estate_insight',
-    'generate_weekly_summary'
-]
+    'get_anthropic_headers': 'api_utils',
+    'get_claude_response': 'api_utils',
+    'get_claude_responses': 'api_utils',
+    'get_claude_responses_async': 'api_utils',
+    'summarize_title': 'api_utils',
+    'summarize_content': 'api_utils',
+    'get_category_trend': 'api_utils',
+    'summarize_category_batch': 'api_utils',
+    'summarize_categories_batch': 'api_utils',
+    'generate_real_estate_insight': 'api_utils',
+    'generate_weekly_summary': 'api_utils',
+    'generate_weekly_summaries': 'api_utils',
+    
+    # rate_limit
+    'TokenBucket': 'rate_limit',
+    'RateLimiter': 'rate_limit',
+    'get_rate_limiter': 'rate_limit',
+    'backoff_delay': 'rate_limit',
+    
+    # keyword_matcher
+    'KeywordHit': 'keyword_matcher',
+    'KeywordMatcher': 'keyword_matcher'
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """공개 이름을 처음 참조할 때 해당 하위 모듈을 import (PEP 562)"""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
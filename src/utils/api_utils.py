@@ -1,8 +1,21 @@
 import os
+import json
+import time
+import asyncio
 import requests
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple, Union
 import logging
 
+from .http_utils import get_session
+from .cache_utils import ResponseCache, get_response_cache
+from .rate_limit import get_rate_limiter, backoff_delay
+from .metrics import get_metrics
+from .token_ledger import get_token_ledger
+from src.config import CLAUDE_CACHE_ENABLED, PROMPT_TEMPLATE_VERSION, CLAUDE_MAX_CONCURRENCY, ANTHROPIC_API_URL
+
+# 재시도할 HTTP 상태 코드 (레이트 리밋, 서버 오류, 과부하)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504, 529}
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,26 +36,66 @@ def get_anthropic_headers() -> Dict[str, str]:
     }
 
 
+def get_anthropic_url() -> str:
+    """Anthropic API 기본 URL 반환 (ANTHROPIC_API_URL 환경변수가 있으면 우선)
+    
+    Returns:
+        str: 끝에 '/'가 없는 기본 URL
+    """
+    return os.environ.get('ANTHROPIC_API_URL', ANTHROPIC_API_URL).rstrip('/')
+
+
 def get_claude_response(
     prompt: str,
     model: str = "claude-3-haiku-20240307",
     max_tokens: int = 100,
     temperature: float = 0.3,
-    retry_count: int = 3
+    retry_count: int = 3,
+    use_cache: bool = CLAUDE_CACHE_ENABLED,
+    prompt_type: str = 'other'
 ) -> str:
     """Claude API 호출 및 응답 반환
     
+    성공한 응답은 (모델, 템플릿 버전, 온도, 최대 토큰, 프롬프트) 해시를 키로
+    로컬 캐시에 저장되어 같은 입력의 재호출 시 API를 호출하지 않음.
+    응답의 usage는 토큰 기록(TokenLedger)에 남고, 하루 예산에 도달하면 저렴한 모델로,
+    하드 한도에 도달하면 API를 호출하지 않고 "API 예산 초과"를 반환함 (호출부의 대체 결과 사용)
+    
     Args:
         prompt: 프롬프트 텍스트
         model: 사용할 모델 (기본값: claude-3-haiku)
         max_tokens: 최대 토큰 수 (기본값: 100)
         temperature: 생성 온도 (기본값: 0.3)
         retry_count: 재시도 횟수 (기본값: 3)
+        use_cache: 응답 캐시 사용 여부 (기본값: CLAUDE_CACHE_ENABLED)
+        prompt_type: 토큰 기록용 프롬프트 종류 ('title', 'content', 'trend', 'batch', 'insight', 'weekly')
         
     Returns:
         str: Claude의 응답 텍스트
     """
+    # 예산에 따라 모델을 먼저 정하고 캐시는 그 모델 키로 한 번만 조회 (적중/미스 통계가 호출당 1회)
+    ledger = get_token_ledger()
+    chosen = ledger.choose_model(model)
+    
+    cache = get_response_cache() if use_cache else None
+    cache_key = ResponseCache.make_key(
+        model=chosen or model,
+        template_version=PROMPT_TEMPLATE_VERSION,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        prompt=prompt
+    )
+    cached = cache.get(cache_key) if cache is not None else None
+    if cached is not None:
+        return cached
+    
+    # 하드 한도 도달 시에도 캐시 적중은 비용이 없으므로 위에서 먼저 반환
+    if chosen is None:
+        return "API 예산 초과"
+    model = chosen
+    
     headers = get_anthropic_headers()
+    url = f"{get_anthropic_url()}/v1/messages"
     
     data = {
         "model": model,
@@ -51,21 +104,45 @@ def get_claude_response(
         "messages": [{"role": "user", "content": prompt}]
     }
     
+    session = get_session()
+    limiter = get_rate_limiter()
+    metrics = get_metrics()
+    # 한국어 프롬프트는 대략 글자당 1토큰 미만이므로 글자 수를 상한 추정치로 사용
+    estimated_tokens = len(prompt) + max_tokens
+    
     for i in range(retry_count):
+        limiter.acquire(estimated_tokens)
+        retry_after = None
+        if i > 0:
+            metrics.incr('claude.retries')
+        
         try:
-            response = requests.post(
-                "https://api.anthropic.com/v1/messages", 
-                headers=headers, 
-                json=data,
-                timeout=30
-            )
+            with metrics.timer('claude_call'):
+                response = session.post(
+                    url, 
+                    headers=headers, 
+                    json=data,
+                    timeout=30
+                )
             
             if response.status_code == 200:
-                return response.json()["content"][0]["text"].strip()
-            else:
-                logger.warning(f"API 요청 실패 (시도 {i+1}/{retry_count}): {response.status_code}")
-                if i == retry_count - 1:
-                    return f"API 요청 실패: {response.status_code}"
+                result = response.json()
+                usage = result.get("usage", {})
+                input_tokens = usage.get("input_tokens", 0)
+                output_tokens = usage.get("output_tokens", 0)
+                cost = ledger.record(model, prompt_type, input_tokens, output_tokens)
+                metrics.incr('claude.input_tokens', input_tokens)
+                metrics.incr('claude.output_tokens', output_tokens)
+                metrics.incr('claude.cost_usd', cost)
+                text = result["content"][0]["text"].strip()
+                if cache is not None:
+                    cache.set(cache_key, text)
+                return text
+            
+            logger.warning(f"API 요청 실패 (시도 {i+1}/{retry_count}): {response.status_code}")
+            if i == retry_count - 1 or response.status_code not in RETRYABLE_STATUS_CODES:
+                return f"API 요청 실패: {response.status_code}"
+            retry_after = response.headers.get("retry-after")
                     
         except requests.exceptions.Timeout:
             logger.warning(f"API 요청 타임아웃 (시도 {i+1}/{retry_count})")
@@ -76,10 +153,62 @@ def get_claude_response(
             logger.error(f"API 요청 중 오류 발생: {str(e)}")
             if i == retry_count - 1:
                 return f"API 오류: {str(e)}"
+        
+        time.sleep(backoff_delay(i, retry_after))
     
     return "API 요청 실패"
 
 
+async def get_claude_responses_async(
+    prompts: List[Union[str, Dict]],
+    concurrency: int = CLAUDE_MAX_CONCURRENCY,
+    **kwargs
+) -> List[str]:
+    """여러 프롬프트를 동시에 Claude API로 요청
+    
+    Args:
+        prompts: 프롬프트 텍스트 또는 get_claude_response 인자 dict 리스트
+        concurrency: 최대 동시 요청 수 (기본값: CLAUDE_MAX_CONCURRENCY)
+        **kwargs: 모든 요청에 공통으로 적용할 get_claude_response 인자
+        
+    Returns:
+        List[str]: 입력 순서와 동일한 순서의 응답 텍스트 리스트
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def request(prompt):
+        params = dict(kwargs)
+        if isinstance(prompt, dict):
+            params.update(prompt)
+        else:
+            params["prompt"] = prompt
+        
+        async with semaphore:
+            return await asyncio.to_thread(get_claude_response, **params)
+    
+    return list(await asyncio.gather(*(request(prompt) for prompt in prompts)))
+
+
+def get_claude_responses(
+    prompts: List[Union[str, Dict]],
+    concurrency: int = CLAUDE_MAX_CONCURRENCY,
+    **kwargs
+) -> List[str]:
+    """get_claude_responses_async의 동기 버전
+    
+    Args:
+        prompts: 프롬프트 텍스트 또는 get_claude_response 인자 dict 리스트
+        concurrency: 최대 동시 요청 수 (기본값: CLAUDE_MAX_CONCURRENCY)
+        **kwargs: 모든 요청에 공통으로 적용할 get_claude_response 인자
+        
+    Returns:
+        List[str]: 입력 순서와 동일한 순서의 응답 텍스트 리스트
+    """
+    if not prompts:
+        return []
+    return asyncio.run(get_claude_responses_async(prompts, concurrency, **kwargs))
+
+
 def summarize_title(title: str, max_length: int = 25) -> str:
     """뉴스 제목 요약
     
@@ -105,16 +234,21 @@ def summarize_title(title: str, max_length: int = 25) -> str:
 
 요약:"""
 
-    response = get_claude_response(prompt, max_tokens=50)
+    response = get_claude_response(prompt, max_tokens=50, prompt_type='title')
     
     # API 오류 시 원본 제목의 앞부분 반환
     if "API" in response or "오류" in response:
-        clean_title = title.replace('"', '').replace("'", '').replace('[단독]', '').strip()
-        return clean_title[:max_length]
+        return _fallback_title(title, max_length)
     
     return response
 
 
+def _fallback_title(title: str, max_length: int) -> str:
+    """요약 실패 시 사용할 제목 (따옴표와 [단독]을 뺀 원본 제목의 앞부분)"""
+    clean_title = title.replace('"', '').replace("'", '').replace('[단독]', '').strip()
+    return clean_title[:max_length]
+
+
 def summarize_content(content: str, max_length: int = 20) -> str:
     """뉴스 내용 요약
     
@@ -140,7 +274,7 @@ def summarize_content(content: str, max_length: int = 20) -> str:
 
 요약:"""
 
-    response = get_claude_response(prompt, max_tokens=50)
+    response = get_claude_response(prompt, max_tokens=50, prompt_type='content')
     
     # API 오류 시 기본 메시지 반환
     if "API" in response or "오류" in response:
@@ -172,7 +306,7 @@ def get_category_trend(items: List[tuple], max_items: int = 3) -> str:
 
 요약:"""
 
-    response = get_claude_response(prompt, max_tokens=30)
+    response = get_claude_response(prompt, max_tokens=30, prompt_type='trend')
     
     # API 오류 시 기본 메시지 반환
     if "API" in response or "오류" in response:
@@ -181,6 +315,172 @@ def get_category_trend(items: List[tuple], max_items: int = 3) -> str:
     return response
 
 
+def _parse_batch_response(response: str) -> Optional[dict]:
+    """배치 요약 응답에서 JSON 객체 추출
+    
+    Args:
+        response: Claude 응답 텍스트
+        
+    Returns:
+        dict: 파싱된 JSON 객체 (실패 시 None)
+    """
+    start = response.find("{")
+    end = response.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    
+    try:
+        parsed = json.loads(response[start:end + 1])
+    except ValueError:
+        return None
+    
+    return parsed if isinstance(parsed, dict) else None
+
+
+def build_category_batch_prompt(
+    items: List[tuple],
+    title_max_length: int = 25,
+    content_max_length: int = 20,
+    trend_max_length: int = 15
+) -> Dict:
+    """카테고리 배치 요약 요청 생성
+    
+    Args:
+        items: (제목, 내용, 링크) 튜플 리스트
+        title_max_length: 제목 요약 최대 길이 (기본값: 25)
+        content_max_length: 내용 요약 최대 길이 (기본값: 20)
+        trend_max_length: 트렌드 요약 최대 길이 (기본값: 15)
+        
+    Returns:
+        Dict: get_claude_response 인자 dict (prompt, max_tokens, prompt_type)
+    """
+    articles = [
+        {"id": idx, "title": title, "content": content[:300]}
+        for idx, (title, content, _) in enumerate(items, 1)
+    ]
+    
+    prompt = f"""다음 뉴스 기사들을 요약하세요.
+
+기사 목록(JSON):
+{json.dumps(articles, ensure_ascii=False)}
+
+규칙:
+- trend: 기사들의 공통 트렌드를 {trend_max_length}자 이내 하나의 간결한 문장으로
+- title: 각 기사 제목을 {title_max_length}자 이내로, 불필요한 특수문자나 따옴표 제거
+- summary: 각 기사 내용의 핵심을 {content_max_length}자 이내로, 핵심 사실이나 수치 포함
+- 모든 기사에 대해 입력과 같은 id로 결과를 작성
+
+예시:
+{{"trend": "서울 아파트값 상승세", "items": [{{"id": 1, "title": "애플 나의찾기 15년만 국내 출시", "summary": "상급지 이동과 절세 목적 현금화"}}]}}
+
+다른 설명 없이 위 형식의 JSON만 출력하세요."""
+
+    return {"prompt": prompt, "max_tokens": 80 * len(items) + 60, "prompt_type": "batch"}
+
+
+def parse_category_batch_response(
+    items: List[tuple],
+    response: str,
+    title_max_length: int = 25,
+    content_max_length: int = 20
+) -> Tuple[str, List[Tuple[str, str]]]:
+    """카테고리 배치 요약 응답 파싱
+    
+    파싱에 실패한 항목만 개별 요약 함수로 대체. 배치 요청 자체가 실패했으면
+    (응답이 "API"로 시작) 같은 API를 항목마다 다시 호출하지 않고 실패 결과를 반환
+    
+    Args:
+        items: (제목, 내용, 링크) 튜플 리스트
+        response: 배치 요약 요청의 응답 텍스트
+        title_max_length: 제목 요약 최대 길이 (기본값: 25)
+        content_max_length: 내용 요약 최대 길이 (기본값: 20)
+        
+    Returns:
+        Tuple[str, List[Tuple[str, str]]]: (트렌드, [(제목 요약, 내용 요약), ...])
+    """
+    if response.startswith("API"):
+        logger.warning(f"배치 요약 요청 실패, 개별 요약 없이 실패 결과 사용: {response}")
+        return "주요 동향", [
+            (_fallback_title(title, title_max_length), "주요 내용 요약 실패")
+            for title, _, _ in items
+        ]
+    
+    parsed = _parse_batch_response(response)
+    
+    results_by_id = {}
+    trend = None
+    if parsed:
+        trend = parsed.get("trend")
+        for result in parsed.get("items", []):
+            if not isinstance(result, dict):
+                continue
+            title_summary = result.get("title")
+            content_summary = result.get("summary")
+            if isinstance(title_summary, str) and isinstance(content_summary, str):
+                results_by_id[result.get("id")] = (title_summary.strip(), content_summary.strip())
+    else:
+        logger.warning("배치 요약 응답 파싱 실패, 개별 요약으로 대체")
+    
+    if not isinstance(trend, str) or not trend.strip():
+        trend = get_category_trend(items)
+    
+    summaries = []
+    for idx, (title, content, _) in enumerate(items, 1):
+        if idx in results_by_id:
+            summaries.append(results_by_id[idx])
+        else:
+            summaries.append((
+                summarize_title(title, title_max_length),
+                summarize_content(content, content_max_length)
+            ))
+    
+    return trend.strip(), summaries
+
+
+def summarize_category_batch(items: List[tuple]) -> Tuple[str, List[Tuple[str, str]]]:
+    """카테고리 내 기사들을 한 번의 API 호출로 요약
+    
+    트렌드, 제목 요약, 내용 요약을 JSON으로 한꺼번에 받아오고,
+    파싱에 실패한 항목만 개별 요약 함수로 대체 (요청 자체가 실패하면 실패 결과 반환)
+    
+    Args:
+        items: (제목, 내용, 링크) 튜플 리스트
+        
+    Returns:
+        Tuple[str, List[Tuple[str, str]]]: (트렌드, [(제목 요약, 내용 요약), ...])
+    """
+    if not items:
+        return "주요 동향", []
+    
+    response = get_claude_response(**build_category_batch_prompt(items))
+    return parse_category_batch_response(items, response)
+
+
+def summarize_categories_batch(
+    grouped: Dict[str, List[tuple]],
+    concurrency: int = CLAUDE_MAX_CONCURRENCY
+) -> Dict[str, Tuple[str, List[Tuple[str, str]]]]:
+    """여러 카테고리의 배치 요약을 동시에 요청
+    
+    Args:
+        grouped: 카테고리별 (제목, 내용, 링크) 튜플 리스트
+        concurrency: 최대 동시 요청 수 (기본값: CLAUDE_MAX_CONCURRENCY)
+        
+    Returns:
+        Dict[str, Tuple]: 카테고리별 (트렌드, [(제목 요약, 내용 요약), ...])
+    """
+    categories = [cat for cat, items in grouped.items() if items]
+    responses = get_claude_responses(
+        [build_category_batch_prompt(grouped[cat]) for cat in categories],
+        concurrency=concurrency
+    )
+    
+    results = {cat: ("주요 동향", []) for cat in grouped}
+    for cat, response in zip(categories, responses):
+        results[cat] = parse_category_batch_response(grouped[cat], response)
+    return results
+
+
 def generate_real_estate_insight(text_block: str, model: str = "claude-3-sonnet-20240229") -> str:
     """부동산 인사이트 생성
     
@@ -202,29 +502,66 @@ def generate_real_estate_insight(text_block: str, model: str = "claude-3-sonnet-
         prompt, 
         model=model,
         max_tokens=300,
-        temperature=0.5
+        temperature=0.5,
+        prompt_type='insight'
     )
 
 
-def generate_weekly_summary(texts: str, model: str = "claude-3-haiku-20240307") -> str:
-    """주간 요약 생성
+def build_weekly_summary_prompt(texts: str) -> str:
+    """주간 요약 프롬프트 생성
     
     Args:
         texts: 요약할 텍스트들
-        model: 사용할 모델 (기본값: claude-3-haiku)
         
     Returns:
-        str: 주간 요약 텍스트
+        str: 프롬프트 텍스트
     """
-    prompt = f"""아래는 이번 주의 주요 경제 뉴스 기사들입니다. 이 내용을 요약하여 아파트 투자자 입장에서 의미 있는 인사이트를 제시해주세요.
+    return f"""아래는 이번 주의 주요 경제 뉴스 기사들입니다. 이 내용을 요약하여 아파트 투자자 입장에서 의미 있는 인사이트를 제시해주세요.
     
 {texts}
 
 요약:"""
 
+
+def generate_weekly_summary(texts: str, model: str = "claude-3-haiku-20240307") -> str:
+    """주간 요약 생성
+    
+    Args:
+        texts: 요약할 텍스트들
+        model: 사용할 모델 (기본값: claude-3-haiku)
+        
+    Returns:
+        str: 주간 요약 텍스트
+    """
     return get_claude_response(
-        prompt,
+        build_weekly_summary_prompt(texts),
+        model=model,
+        max_tokens=500,
+        temperature=0.5,
+        prompt_type='weekly'
+    )
+
+
+def generate_weekly_summaries(
+    text_blocks: List[str],
+    model: str = "claude-3-haiku-20240307",
+    concurrency: int = CLAUDE_MAX_CONCURRENCY
+) -> List[str]:
+    """여러 주간 요약을 동시에 생성
+    
+    Args:
+        text_blocks: 카테고리별 요약할 텍스트 리스트
+        model: 사용할 모델 (기본값: claude-3-haiku)
+        concurrency: 최대 동시 요청 수 (기본값: CLAUDE_MAX_CONCURRENCY)
+        
+    Returns:
+        List[str]: 입력 순서와 동일한 순서의 주간 요약 텍스트 리스트
+    """
+    return get_claude_responses(
+        [build_weekly_summary_prompt(texts) for texts in text_blocks],
+        concurrency=concurrency,
         model=model,
         max_tokens=500,
-        temperature=0.5
+        temperature=0.5,
+        prompt_type='weekly'
     )
@@ -0,0 +1,174 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from src.config import (
+    CLAUDE_CACHE_PATH,
+    CLAUDE_CACHE_TTL_DAYS,
+    CLAUDE_CACHE_MAX_ENTRIES
+)
+
+logger = logging.getLogger(__name__)
+
+_cache: Optional['ResponseCache'] = None
+_cache_lock = threading.Lock()
+
+
+class ResponseCache:
+    """SQLite 기반 API 응답 캐시 (TTL 및 LRU 방식 삭제)"""
+    
+    def __init__(
+        self,
+        path: str = CLAUDE_CACHE_PATH,
+        ttl_seconds: float = CLAUDE_CACHE_TTL_DAYS * 86400,
+        max_entries: int = CLAUDE_CACHE_MAX_ENTRIES
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+        )
+        self._conn.commit()
+    
+    @staticmethod
+    def make_key(**parts) -> str:
+        """캐시 키 생성
+        
+        Args:
+            **parts: 키를 구성하는 값들 (모델, 템플릿 버전, 온도, 입력 텍스트 등)
+            
+        Returns:
+            str: SHA-256 해시 문자열
+        """
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """캐시 조회 (만료된 항목은 miss 처리)
+        
+        Args:
+            key: 캐시 키
+            
+        Returns:
+            str: 캐시된 값 (없으면 None)
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+    
+    def set(self, key: str, value: str) -> None:
+        """캐시 저장 후 용량 초과 항목 정리
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+    
+    def _evict(self, now: float) -> None:
+        """만료 항목 및 최대 개수 초과 항목 삭제 (lock 보유 상태에서 호출)"""
+        self._conn.execute(
+            "DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,)
+        )
+        self._conn.execute(
+            """DELETE FROM responses WHERE key IN (
+                SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )""",
+            (self.max_entries,)
+        )
+    
+    def stats(self) -> Dict[str, int]:
+        """캐시 적중 통계 반환
+        
+        Returns:
+            Dict[str, int]: hits, misses, entries
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries}
+    
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+def get_response_cache() -> ResponseCache:
+    """프로세스 전역 Claude 응답 캐시 반환
+    
+    Returns:
+        ResponseCache: 공유 캐시 객체
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+    return _cache
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """Claude 응답 캐시 통계 반환 (캐시 미사용 시 0)
+    
+    Returns:
+        Dict[str, int]: hits, misses, entries
+    """
+    if _cache is None:
+        return {'hits': 0, 'misses': 0, 'entries': 0}
+    return _cache.stats()
+
+
+def log_cache_stats(target_logger: Optional[logging.Logger] = None) -> None:
+    """Claude 응답 캐시 통계 로깅
+    
+    Args:
+        target_logger: 사용할 로거 (기본값: 모듈 로거)
+    """
+    stats = get_cache_stats()
+    total = stats['hits'] + stats['misses']
+    hit_rate = stats['hits'] / total * 100 if total else 0.0
+    (target_logger or logger).info(
+        f"Claude 캐시: 적중 {stats['hits']}회, 미적중 {stats['misses']}회 "
+        f"(적중률 {hit_rate:.1f}%, 저장 {stats['entries']}건)"
+    )
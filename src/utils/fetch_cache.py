@@ -0,0 +1,208 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from src.config import (
+    FETCH_CACHE_PATH,
+    FETCH_CACHE_MAX_AGE_DAYS,
+    FETCH_CACHE_FRESH_HOURS,
+    URL_TRACKING_PARAMS
+)
+
+logger = logging.getLogger(__name__)
+
+_cache: Optional['FetchCache'] = None
+_cache_lock = threading.Lock()
+
+
+def normalize_url(url: str) -> str:
+    """캐시 키용 기사 URL 정규화
+    
+    호스트 소문자화, 추적용 쿼리 파라미터(ntype 등)와 fragment 제거, 남은 파라미터 정렬.
+    구형 네이버 기사 주소(news.naver.com/main/read.naver?oid=&aid=)는
+    n.news.naver.com/article/{oid}/{aid} 형태로 통일함
+    
+    Args:
+        url: 원본 URL
+    
+    Returns:
+        str: 정규화된 URL
+    """
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    params = [
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if k not in URL_TRACKING_PARAMS and not k.startswith('utm_')
+    ]
+    
+    query = dict(params)
+    if host in ('news.naver.com', 'm.news.naver.com') and parsed.path.endswith('read.naver') and 'oid' in query and 'aid' in query:
+        return f"https://n.news.naver.com/article/{query['oid']}/{query['aid']}"
+    if host == 'm.news.naver.com':
+        host = 'n.news.naver.com'
+    
+    return urlunparse((parsed.scheme.lower() or 'https', host, parsed.path, '', urlencode(sorted(params)), ''))
+
+
+class FetchCache:
+    """기사 페이지 추출 결과 캐시 (정규화 URL 기준, ETag/Last-Modified 보관)"""
+    
+    def __init__(
+        self,
+        path: str = FETCH_CACHE_PATH,
+        max_age_seconds: float = FETCH_CACHE_MAX_AGE_DAYS * 86400,
+        fresh_seconds: float = FETCH_CACHE_FRESH_HOURS * 3600
+    ):
+        self.path = path
+        self.max_age_seconds = max_age_seconds
+        self.fresh_seconds = fresh_seconds
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                paragraph TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                validated_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_pages_validated ON pages (validated_at)"
+        )
+        self._conn.commit()
+        self.evict()
+    
+    def get(self, url: str) -> Optional[Dict]:
+        """캐시 항목 조회
+        
+        Args:
+            url: 정규화된 URL
+        
+        Returns:
+            Dict: paragraph, etag, last_modified, fresh(재검증 없이 사용 가능 여부) (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT paragraph, etag, last_modified, validated_at FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            'paragraph': row[0],
+            'etag': row[1],
+            'last_modified': row[2],
+            'fresh': time.time() - row[3] < self.fresh_seconds
+        }
+    
+    def set(self, url: str, paragraph: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """추출 결과 저장
+        
+        Args:
+            url: 정규화된 URL
+            paragraph: 추출한 첫 문단
+            etag: 응답 ETag 헤더
+            last_modified: 응답 Last-Modified 헤더
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO pages (url, paragraph, etag, last_modified, fetched_at, validated_at)
+                VALUES (?, ?, ?, ?, ?, ?)""",
+                (url, paragraph, etag, last_modified, now, now)
+            )
+            self._conn.commit()
+    
+    def touch(self, url: str) -> None:
+        """304 응답으로 재검증된 항목의 검증 시각 갱신
+        
+        Args:
+            url: 정규화된 URL
+        """
+        with self._lock:
+            self._conn.execute("UPDATE pages SET validated_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+    
+    def record(self, outcome: str) -> None:
+        """요청 결과 집계 ('hits', 'revalidated', 'misses')"""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+    
+    def evict(self) -> int:
+        """마지막 검증 후 max_age가 지난 항목 삭제
+        
+        Returns:
+            int: 삭제된 항목 수
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM pages WHERE validated_at < ?", (time.time() - self.max_age_seconds,)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+    
+    def stats(self) -> Dict[str, int]:
+        """캐시 사용 통계 반환
+        
+        Returns:
+            Dict[str, int]: hits, revalidated, misses, entries
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        return {'hits': self.hits, 'revalidated': self.revalidated, 'misses': self.misses, 'entries': entries}
+    
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+def get_fetch_cache() -> FetchCache:
+    """프로세스 전역 기사 페이지 캐시 반환
+    
+    Returns:
+        FetchCache: 공유 캐시 객체
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = FetchCache()
+    return _cache
+
+
+def get_fetch_cache_stats() -> Dict[str, int]:
+    """기사 페이지 캐시 통계 반환 (캐시 미사용 시 0)
+    
+    Returns:
+        Dict[str, int]: hits, revalidated, misses, entries
+    """
+    if _cache is None:
+        return {'hits': 0, 'revalidated': 0, 'misses': 0, 'entries': 0}
+    return _cache.stats()
+
+
+def log_fetch_cache_stats(target_logger: Optional[logging.Logger] = None) -> None:
+    """기사 페이지 캐시 통계 로깅
+    
+    Args:
+        target_logger: 사용할 로거 (기본값: 모듈 로거)
+    """
+    if _cache is None:
+        return
+    stats = get_fetch_cache_stats()
+    (target_logger or logger).info(
+        f"기사 캐시: 적중 {stats['hits']}회, 재검증 {stats['revalidated']}회, "
+        f"다운로드 {stats['misses']}회 (저장 {stats['entries']}건)"
+    )
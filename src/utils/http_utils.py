@@ -0,0 +1,121 @@
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .metrics import get_metrics
+from src.config import (
+    REQUEST_TIMEOUT,
+    HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_FACTOR,
+    HTTP_DEFAULT_POOL_SIZE,
+    HTTP_POOL_SIZES
+)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """타임아웃이 지정되지 않은 요청에 기본 타임아웃을 적용하는 어댑터"""
+    
+    def __init__(self, *args, timeout: float = REQUEST_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+    
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        response = super().send(request, **kwargs)
+        
+        # urllib3가 내부에서 재시도한 횟수 집계
+        metrics = get_metrics()
+        metrics.incr('http.requests')
+        retries = getattr(response.raw, 'retries', None)
+        if retries is not None and retries.history:
+            metrics.incr('http.retries', len(retries.history))
+        return response
+
+
+def _build_retry() -> Retry:
+    """재시도 정책 생성
+    
+    GET 등 멱등 요청은 연결 오류, 429, 5xx 응답 시 재시도하고
+    POST는 요청이 전송되지 않은 연결 오류만 재시도
+    
+    Returns:
+        Retry: urllib3 재시도 정책
+    """
+    return Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+
+
+def create_session(
+    pool_sizes: Optional[Dict[str, int]] = None,
+    default_pool_size: int = HTTP_DEFAULT_POOL_SIZE,
+    timeout: float = REQUEST_TIMEOUT
+) -> requests.Session:
+    """커넥션 풀링과 재시도가 설정된 세션 생성
+    
+    Args:
+        pool_sizes: URL prefix별 커넥션 풀 크기 (기본값: HTTP_POOL_SIZES)
+        default_pool_size: 그 외 호스트의 커넥션 풀 크기
+        timeout: 기본 요청 타임아웃 (초)
+        
+    Returns:
+        Session: keep-alive 커넥션을 재사용하는 세션
+    """
+    if pool_sizes is None:
+        pool_sizes = HTTP_POOL_SIZES
+    
+    session = requests.Session()
+    
+    default_adapter = TimeoutHTTPAdapter(
+        timeout=timeout,
+        pool_connections=len(pool_sizes) + 1,
+        pool_maxsize=default_pool_size,
+        max_retries=_build_retry()
+    )
+    session.mount('http://', default_adapter)
+    session.mount('https://', default_adapter)
+    
+    # 호스트별 어댑터 (더 긴 prefix가 우선 적용됨)
+    for prefix, size in pool_sizes.items():
+        session.mount(prefix, TimeoutHTTPAdapter(
+            timeout=timeout,
+            pool_connections=1,
+            pool_maxsize=size,
+            max_retries=_build_retry()
+        ))
+    
+    return session
+
+
+def get_session() -> requests.Session:
+    """프로세스 전역 공유 세션 반환
+    
+    Returns:
+        Session: 공유 HTTP 세션
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def close_session() -> None:
+    """공유 세션 종료 (커넥션 풀 해제)"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
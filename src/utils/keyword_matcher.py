@@ -0,0 +1,191 @@
+import threading
+from collections import deque
+from typing import Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+
+class KeywordHit(NamedTuple):
+    """키워드 매칭 결과"""
+    keyword: str
+    group: Hashable
+    weight: float
+    field: str
+    start: int
+    end: int
+
+
+class KeywordMatcher:
+    """Aho-Corasick 오토마톤 기반 다중 키워드 매처
+    
+    등록된 모든 키워드를 텍스트 한 번 순회로 찾으므로 키워드 수가 늘어나도
+    검색 비용은 텍스트 길이와 매칭 수에만 비례함. 같은 키워드를 여러 그룹에
+    서로 다른 가중치로 등록할 수 있음. 오토마톤은 첫 검색 때 잠금 안에서 한 번만
+    만들어지므로 여러 스레드가 같은 매처로 검색해도 됨
+    """
+    
+    def __init__(self, groups: Optional[Dict[Hashable, Union[Dict[str, float], Iterable[str]]]] = None):
+        self._entries: List[Tuple[str, Hashable, float]] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        self._built = True
+        self._lock = threading.Lock()
+        
+        for group, keywords in (groups or {}).items():
+            self.add_group(group, keywords)
+    
+    def add(self, keyword: str, group: Hashable, weight: float = 1) -> None:
+        """키워드 등록
+        
+        Args:
+            keyword: 찾을 문자열
+            group: 키워드가 속한 그룹 (예: 'investment', ('category', '부동산'))
+            weight: 가중치 (기본값: 1)
+        """
+        if not keyword:
+            raise ValueError("빈 키워드는 등록할 수 없습니다")
+        
+        with self._lock:
+            node = 0
+            for char in keyword:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = next_node
+            
+            self._output[node].append(len(self._entries))
+            self._entries.append((keyword, group, weight))
+            self._built = False
+    
+    def add_group(self, group: Hashable, keywords: Union[Dict[str, float], Iterable[str]]) -> None:
+        """그룹 단위 키워드 등록
+        
+        Args:
+            group: 그룹 이름
+            keywords: {키워드: 가중치} 딕셔너리 또는 키워드 리스트 (가중치 1)
+        """
+        items = keywords.items() if isinstance(keywords, dict) else ((k, 1) for k in keywords)
+        for keyword, weight in items:
+            self.add(keyword, group, weight)
+    
+    def _ensure_built(self) -> None:
+        """오토마톤이 없으면 생성 (여러 스레드가 동시에 만들거나 만드는 중인 표를 읽지 않도록 잠금)"""
+        if self._built:
+            return
+        with self._lock:
+            if not self._built:
+                self._build()
+    
+    def _build(self) -> None:
+        """실패 링크 계산 (BFS) 및 출력 목록 병합 (_lock을 잡은 상태에서 호출)"""
+        # 출력 목록은 등록 직후 상태로 되돌린 뒤 실패 링크를 따라 다시 병합
+        own_output = [[] for _ in self._goto]
+        for index, (keyword, _, _) in enumerate(self._entries):
+            node = 0
+            for char in keyword:
+                node = self._goto[node][char]
+            own_output[node].append(index)
+        self._output = own_output
+        
+        queue = deque()
+        for node in self._goto[0].values():
+            self._fail[node] = 0
+            queue.append(node)
+        
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+                queue.append(child)
+        
+        self._built = True
+    
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """텍스트에서 모든 키워드 출현 위치 반환 (겹치는 매칭 포함)
+        
+        Args:
+            text: 검색할 텍스트
+        
+        Yields:
+            Tuple[int, int, int]: (시작 위치, 끝 위치, 키워드 번호)
+        """
+        self._ensure_built()
+        
+        goto, fail, output, entries = self._goto, self._fail, self._output, self._entries
+        node = 0
+        for pos, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for index in output[node]:
+                end = pos + 1
+                yield end - len(entries[index][0]), end, index
+    
+    def search(self, text: str, field: str = 'text') -> List[KeywordHit]:
+        """텍스트의 모든 키워드 매칭 반환
+        
+        Args:
+            text: 검색할 텍스트
+            field: 결과에 기록할 필드 이름
+        
+        Returns:
+            List[KeywordHit]: 매칭 목록 (출현 순서)
+        """
+        hits = []
+        for start, end, index in self.iter_matches(text or ''):
+            keyword, group, weight = self._entries[index]
+            hits.append(KeywordHit(keyword, group, weight, field, start, end))
+        return hits
+    
+    def scan(self, fields: Dict[str, str]) -> List[KeywordHit]:
+        """여러 필드를 각각 한 번씩 순회하며 매칭 반환
+        
+        Args:
+            fields: {필드 이름: 텍스트} (예: {'title': 제목, 'content': 본문})
+        
+        Returns:
+            List[KeywordHit]: 모든 필드의 매칭 목록
+        """
+        hits = []
+        for field, text in fields.items():
+            hits.extend(self.search(text, field))
+        return hits
+    
+    def groups(self, text: str) -> set:
+        """텍스트에 등장하는 키워드 그룹 집합 반환
+        
+        Args:
+            text: 검색할 텍스트
+        
+        Returns:
+            set: 매칭된 그룹들
+        """
+        return {self._entries[index][1] for _, _, index in self.iter_matches(text or '')}
+    
+    def first_group(self, text: str, order: Iterable[Hashable]) -> Optional[Hashable]:
+        """order 순서상 가장 먼저 오는 매칭 그룹 반환
+        
+        Args:
+            text: 검색할 텍스트
+            order: 그룹 우선순위
+        
+        Returns:
+            매칭된 그룹 중 우선순위가 가장 높은 그룹 (없으면 None)
+        """
+        matched = self.groups(text)
+        return next((group for group in order if group in matched), None)
+    
+    @property
+    def entries(self) -> List[Tuple[str, Hashable, float]]:
+        """등록된 (키워드, 그룹, 가중치) 목록 (iter_matches의 키워드 번호 순서)"""
+        return list(self._entries)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
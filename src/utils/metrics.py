@@ -0,0 +1,164 @@
+import os
+import json
+import time
+import logging
+import threading
+import functools
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
+
+from .cache_utils import get_cache_stats
+from .fetch_cache import get_fetch_cache_stats
+from src.config import LOG_DIR
+
+logger = logging.getLogger(__name__)
+
+_metrics: Optional['RunMetrics'] = None
+_metrics_lock = threading.Lock()
+
+
+class RunMetrics:
+    """실행 단위 성능 지표 (단계별 소요 시간과 재시도/바이트/토큰 카운터)
+    
+    타이머 이름은 '단계' 또는 '단계.세부' 형태로 쓰며 (예: 'claude_call', 'pipeline.summarize'),
+    같은 이름으로 여러 번 기록하면 횟수, 합계, 최대값으로 집계됨
+    """
+    
+    def __init__(self):
+        self.started_at = time.time()
+        self._timings: Dict[str, List[float]] = defaultdict(list)
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+    
+    def record_time(self, name: str, seconds: float) -> None:
+        """단계 소요 시간 기록
+        
+        Args:
+            name: 단계 이름
+            seconds: 소요 시간 (초)
+        """
+        with self._lock:
+            self._timings[name].append(seconds)
+    
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """with 블록의 소요 시간을 name으로 기록 (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_time(name, time.perf_counter() - started)
+    
+    def incr(self, name: str, value: float = 1) -> None:
+        """카운터 증가
+        
+        Args:
+            name: 카운터 이름 (예: 'claude.retries', 'article.bytes')
+            value: 증가량
+        """
+        with self._lock:
+            self._counters[name] += value
+    
+    def report(self) -> Dict:
+        """지금까지의 지표를 JSON으로 저장 가능한 dict로 반환
+        
+        Returns:
+            Dict: started_at, duration, timings(이름별 count/total/max/mean), counters, caches
+        """
+        with self._lock:
+            timings = {
+                name: {
+                    'count': len(values),
+                    'total': round(sum(values), 3),
+                    'max': round(max(values), 3),
+                    'mean': round(sum(values) / len(values), 3)
+                }
+                for name, values in sorted(self._timings.items())
+            }
+            counters = {name: value for name, value in sorted(self._counters.items())}
+        
+        return {
+            'started_at': datetime.fromtimestamp(self.started_at).isoformat(timespec='seconds'),
+            'duration': round(time.time() - self.started_at, 3),
+            'timings': timings,
+            'counters': counters,
+            'caches': {'claude': get_cache_stats(), 'article': get_fetch_cache_stats()}
+        }
+    
+    def write_report(self, script_name: str, log_dir: str = LOG_DIR) -> str:
+        """지표를 logs/YYYY-MM/{script_name}_{시각}.json 파일로 저장
+        
+        Args:
+            script_name: 스크립트 이름
+            log_dir: 로그 디렉토리 (기본값: LOG_DIR)
+        
+        Returns:
+            str: 저장한 파일 경로
+        """
+        now = datetime.now()
+        directory = os.path.join(log_dir, now.strftime('%Y-%m'))
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{script_name}_{now.strftime('%Y%m%d_%H%M%S')}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'script': script_name, **self.report()}, f, ensure_ascii=False, indent=2)
+        return path
+    
+    def summary(self, top: int = 5) -> str:
+        """알림용 요약 (총 시간, 오래 걸린 단계, 주요 카운터)
+        
+        Args:
+            top: 표시할 단계 수
+        
+        Returns:
+            str: 여러 줄 요약 텍스트
+        """
+        report = self.report()
+        counters = report['counters']
+        caches = report['caches']
+        
+        slowest = sorted(report['timings'].items(), key=lambda item: item[1]['total'], reverse=True)[:top]
+        lines = [f"⏱️ 총 {report['duration']:.1f}초"]
+        lines += [f"• {name}: {stat['total']:.1f}초 ({stat['count']}회)" for name, stat in slowest]
+        
+        lines.append(
+            f"🤖 Claude 토큰 {int(counters.get('claude.input_tokens', 0))}/{int(counters.get('claude.output_tokens', 0))} "
+            f"(${counters.get('claude.cost_usd', 0):.4f}), "
+            f"재시도 {int(counters.get('claude.retries', 0))}회, 캐시 적중 {caches['claude']['hits']}회"
+        )
+        lines.append(
+            f"🌐 기사 {int(counters.get('article.bytes', 0)) // 1024}KB, "
+            f"캐시 적중 {caches['article']['hits'] + caches['article']['revalidated']}회, "
+            f"HTTP 재시도 {int(counters.get('http.retries', 0))}회, Sheets 재시도 {int(counters.get('sheets.retries', 0))}회"
+        )
+        return "\n".join(lines)
+
+
+def get_metrics() -> RunMetrics:
+    """프로세스 전역 실행 지표 반환
+    
+    Returns:
+        RunMetrics: 공유 지표 객체
+    """
+    global _metrics
+    if _metrics is None:
+        with _metrics_lock:
+            if _metrics is None:
+                _metrics = RunMetrics()
+    return _metrics
+
+
+def timed(name: str) -> Callable:
+    """함수 실행 시간을 name으로 기록하는 데코레이터
+    
+    Args:
+        name: 단계 이름
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_metrics().timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,115 @@
+import random
+import threading
+import time
+from typing import Optional
+
+from src.config import (
+    CLAUDE_REQUESTS_PER_MINUTE,
+    CLAUDE_TOKENS_PER_MINUTE,
+    CLAUDE_BACKOFF_BASE,
+    CLAUDE_BACKOFF_MAX
+)
+
+_limiter: Optional['RateLimiter'] = None
+_limiter_lock = threading.Lock()
+
+
+class TokenBucket:
+    """분당 허용량 기반 토큰 버킷 (스레드 안전)"""
+    
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+    
+    def acquire(self, amount: float = 1.0) -> float:
+        """토큰이 충분해질 때까지 대기 후 차감
+        
+        Args:
+            amount: 차감할 토큰 수 (버킷 용량보다 크면 용량만큼 차감)
+            
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return waited
+                delay = (amount - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class RateLimiter:
+    """요청 수와 토큰 수를 함께 제한하는 레이트 리미터"""
+    
+    def __init__(
+        self,
+        requests_per_minute: float = CLAUDE_REQUESTS_PER_MINUTE,
+        tokens_per_minute: float = CLAUDE_TOKENS_PER_MINUTE
+    ):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+    
+    def acquire(self, estimated_tokens: int) -> float:
+        """요청 1건과 추정 토큰만큼 허용량 확보
+        
+        Args:
+            estimated_tokens: 요청의 추정 토큰 수 (입력 + 최대 출력)
+            
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        return self.requests.acquire(1) + self.tokens.acquire(estimated_tokens)
+
+
+def get_rate_limiter() -> RateLimiter:
+    """프로세스 전역 Claude API 레이트 리미터 반환
+    
+    Returns:
+        RateLimiter: 공유 레이트 리미터
+    """
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = RateLimiter()
+    return _limiter
+
+
+def backoff_delay(
+    attempt: int,
+    retry_after: Optional[str] = None,
+    base: float = CLAUDE_BACKOFF_BASE,
+    cap: float = CLAUDE_BACKOFF_MAX
+) -> float:
+    """재시도 대기 시간 계산
+    
+    retry-after 헤더가 있으면 그 값을 따르고, 없으면 full jitter 지수 백오프 적용
+    
+    Args:
+        attempt: 0부터 시작하는 재시도 횟수
+        retry_after: 응답의 retry-after 헤더 값 (초 단위)
+        base: 기본 대기 시간 (초)
+        cap: 최대 대기 시간 (초)
+        
+    Returns:
+        float: 대기 시간 (초)
+    """
+    if retry_after:
+        try:
+            return min(cap, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
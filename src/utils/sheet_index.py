@@ -0,0 +1,270 @@
+import re
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import gspread
+
+from .sheets_utils import (
+    get_worksheet,
+    create_worksheet_if_not_exists,
+    call_with_quota_retry
+)
+from src.config import DATE_INDEX_SHEET
+
+logger = logging.getLogger(__name__)
+
+INDEX_HEADERS = ["시트", "날짜", "시작행", "끝행"]
+
+_UPDATED_RANGE_PATTERN = re.compile(r"!?[A-Z]*(\d+)(?::[A-Z]*(\d+))?$")
+
+
+def parse_updated_range(updated_range: str) -> Optional[Tuple[int, int]]:
+    """A1 표기 범위에서 시작/끝 행 번호 추출
+    
+    Args:
+        updated_range: A1 표기 범위 (예: "'뉴스요약'!A120:E210")
+    
+    Returns:
+        Tuple[int, int]: (시작 행, 끝 행) (파싱 실패 시 None)
+    """
+    match = _UPDATED_RANGE_PATTERN.search(updated_range or "")
+    if not match:
+        return None
+    start = int(match.group(1))
+    end = int(match.group(2) or start)
+    return start, end
+
+
+def get_date_index(spreadsheet_id: str, sheet_name: str) -> Dict[str, Tuple[int, int]]:
+    """시트의 날짜 → 행 범위 색인 반환
+    
+    Args:
+        spreadsheet_id: Google Sheets 문서 ID
+        sheet_name: 색인 대상 워크시트 이름
+    
+    Returns:
+        Dict[str, Tuple[int, int]]: 날짜별 (시작 행, 끝 행) (색인이 없으면 빈 dict)
+    """
+    try:
+        index_ws = get_worksheet(spreadsheet_id, DATE_INDEX_SHEET)
+    except gspread.exceptions.WorksheetNotFound:
+        return {}
+    
+    index = {}
+    for row in call_with_quota_retry(index_ws.get_all_values)[1:]:
+        if len(row) >= 4 and row[0] == sheet_name and row[2].isdigit() and row[3].isdigit():
+            index[row[1]] = (int(row[2]), int(row[3]))
+    return index
+
+
+def update_date_index(
+    spreadsheet_id: str,
+    sheet_name: str,
+    ranges: Dict[str, Tuple[int, int]]
+) -> None:
+    """날짜별 행 범위를 색인 시트에 기록 (기존 범위와 병합)
+    
+    Args:
+        spreadsheet_id: Google Sheets 문서 ID
+        sheet_name: 색인 대상 워크시트 이름
+        ranges: 날짜별 (시작 행, 끝 행)
+    """
+    if not ranges:
+        return
+    
+    index_ws = create_worksheet_if_not_exists(
+        spreadsheet_id,
+        DATE_INDEX_SHEET,
+        rows=100,
+        cols=len(INDEX_HEADERS),
+        headers=INDEX_HEADERS
+    )
+    existing = call_with_quota_retry(index_ws.get_all_values)
+    
+    positions = {}
+    for row_num, row in enumerate(existing, 1):
+        if row_num > 1 and len(row) >= 4 and row[0] == sheet_name:
+            positions[row[1]] = (row_num, row)
+    
+    updates = []
+    new_rows = []
+    for date, (start, end) in sorted(ranges.items()):
+        if date in positions:
+            row_num, row = positions[date]
+            if row[2].isdigit() and row[3].isdigit():
+                start, end = min(start, int(row[2])), max(end, int(row[3]))
+            updates.append({'range': f"A{row_num}:D{row_num}", 'values': [[sheet_name, date, start, end]]})
+        else:
+            new_rows.append([sheet_name, date, start, end])
+    
+    if updates:
+        call_with_quota_retry(index_ws.batch_update, updates, value_input_option='RAW')
+    if new_rows:
+        call_with_quota_retry(index_ws.append_rows, new_rows, value_input_option='RAW')
+
+
+def record_appended_rows(
+    spreadsheet_id: str,
+    sheet_name: str,
+    rows: List[List[str]],
+    responses: List[Dict]
+) -> None:
+    """append_rows 응답을 바탕으로 추가된 행들의 날짜 색인 갱신
+    
+    Args:
+        spreadsheet_id: Google Sheets 문서 ID
+        sheet_name: 행을 추가한 워크시트 이름
+        rows: 추가한 행 데이터 리스트 (첫 번째 열이 날짜)
+        responses: append_rows_batched의 청크별 응답
+    """
+    ranges = {}
+    offset = 0
+    for response in responses:
+        parsed = parse_updated_range(response.get('updates', {}).get('updatedRange', ''))
+        if parsed is None:
+            logger.warning("추가된 행 범위를 확인할 수 없어 날짜 색인을 갱신하지 않습니다.")
+            return
+        
+        start, end = parsed
+        for row_num in range(start, end + 1):
+            if offset >= len(rows):
+                break
+            date = rows[offset][0]
+            low, high = ranges.get(date, (row_num, row_num))
+            ranges[date] = (min(low, row_num), max(high, row_num))
+            offset += 1
+    
+    update_date_index(spreadsheet_id, sheet_name, ranges)
+
+
+def rebuild_date_index(spreadsheet_id: str, sheet_name: str) -> Dict[str, Tuple[int, int]]:
+    """시트 전체를 한 번 읽어 날짜 색인 재생성 (기존 데이터 최초 색인용)
+    
+    Args:
+        spreadsheet_id: Google Sheets 문서 ID
+        sheet_name: 색인 대상 워크시트 이름
+    
+    Returns:
+        Dict[str, Tuple[int, int]]: 날짜별 (시작 행, 끝 행)
+    """
+    worksheet = get_worksheet(spreadsheet_id, sheet_name)
+    values = call_with_quota_retry(worksheet.col_values, 1)
+    
+    ranges = {}
+    for row_num, date in enumerate(values, 1):
+        if row_num == 1 or not date:
+            continue
+        low, high = ranges.get(date, (row_num, row_num))
+        ranges[date] = (min(low, row_num), max(high, row_num))
+    
+    update_date_index(spreadsheet_id, sheet_name, ranges)
+    return ranges
+
+
+def get_rows_for_dates(
+    spreadsheet_id: str,
+    sheet_name: str,
+    dates: Iterable[str],
+    last_column: str = 'E'
+) -> List[List[str]]:
+    """날짜 색인을 이용해 해당 날짜의 행만 조회
+    
+    색인이 없으면 전체 시트를 읽어 날짜로 필터링. 색인된 마지막 행 이후의 행도
+    함께 읽으므로 색인 갱신 없이 추가된 행도 조회됨
+    
+    Args:
+        spreadsheet_id: Google Sheets 문서 ID
+        sheet_name: 워크시트 이름
+        dates: 조회할 날짜 (YYYY-MM-DD)
+        last_column: 조회할 마지막 열 (기본값: 'E')
+    
+    Returns:
+        List[List[str]]: 해당 날짜의 행 리스트 (시트 순서 유지)
+    """
+    dates = set(dates)
+    if not dates:
+        return []
+    index = get_date_index(spreadsheet_id, sheet_name)
+    worksheet = get_worksheet(spreadsheet_id, sheet_name)
+    
+    if not index:
+        logger.info(f"{sheet_name} 날짜 색인이 없어 전체 시트를 조회합니다.")
+        rows = call_with_quota_retry(worksheet.get_all_values)[1:]
+        return [r for r in rows if r and r[0] in dates]
+    
+    # 색인에 없는 날짜는 행이 없는 날짜로 봄
+    spans = sorted(index[date] for date in dates if date in index)
+    
+    # 인접하거나 겹치는 범위는 하나의 범위로 병합
+    merged = []
+    for start, end in spans:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    
+    ranges = [f"A{start}:{last_column}{end}" for start, end in merged]
+    
+    # 색인 갱신 없이 추가된 행은 색인된 마지막 행 이후에만 있으므로 그 부분만 함께 조회
+    # (시트 크기를 넘는 범위는 요청 오류이므로 남은 행이 있을 때만)
+    tail_start = max(end for _, end in index.values()) + 1
+    if tail_start <= worksheet.row_count:
+        ranges.append(f"A{tail_start}:{last_column}")
+    if not ranges:
+        return []
+    
+    width = ord(last_column.upper()) - ord('A') + 1
+    value_ranges = call_with_quota_retry(worksheet.batch_get, ranges)
+    if tail_start <= worksheet.row_count and value_ranges[-1]:
+        logger.warning(
+            f"{sheet_name} 날짜 색인 이후 색인되지 않은 행 {len(value_ranges[-1])}개를 함께 조회합니다. "
+            f"(색인 재생성: rebuild_date_index)"
+        )
+    
+    rows = []
+    for value_range in value_ranges:
+        for row in value_range:
+            row = list(row) + [''] * (width - len(row))
+            if row[0] in dates:
+                rows.append(row)
+    return rows
+
+
+def load_key_index(
+    worksheet: gspread.Worksheet,
+    key_columns: Sequence[str],
+    key_func: Optional[Callable[[List[str]], Tuple]] = None
+) -> Dict[Tuple, int]:
+    """키 열만 한 번의 요청으로 읽어 키 → 행 번호 색인 생성
+    
+    같은 키가 여러 행에 있으면 가장 위 행을 사용함
+    
+    Args:
+        worksheet: 워크시트 객체
+        key_columns: 키를 이루는 열 문자 (예: ('A', 'E'))
+        key_func: 열 값 리스트를 키로 바꾸는 함수 (기본값: tuple)
+    
+    Returns:
+        Dict[Tuple, int]: 키별 시트 행 번호 (헤더 제외)
+    """
+    columns = call_with_quota_retry(worksheet.batch_get, [f"{col}2:{col}" for col in key_columns])
+    length = max((len(column) for column in columns), default=0)
+    
+    index = {}
+    duplicates = 0
+    for offset in range(length):
+        values = [
+            column[offset][0] if offset < len(column) and column[offset] else ''
+            for column in columns
+        ]
+        if not any(values):
+            continue
+        key = key_func(values) if key_func else tuple(values)
+        if key in index:
+            duplicates += 1
+            continue
+        index[key] = offset + 2
+    
+    if duplicates:
+        logger.warning(f"{worksheet.title} 시트에 중복 키 {duplicates}개 (가장 위 행 기준으로 갱신)")
+    return index
@@ -1,16 +1,40 @@
 import base64
 import os
-from typing import List, Dict, Optional
+import time
+import logging
+import threading
+from typing import Any, Callable, List, Dict, Optional, Tuple
 import gspread
+from requests import Session
+from requests.adapters import HTTPAdapter
 from google.oauth2.service_account import Credentials
 from google.oauth2 import service_account
 
+from .rate_limit import backoff_delay
+from .metrics import get_metrics
+from src.config import SHEETS_BATCH_SIZE, SHEETS_MAX_RETRIES, SHEETS_API_URL
 
-def setup_credentials() -> str:
+logger = logging.getLogger(__name__)
+
+# 재시도할 Sheets API 오류 코드 (할당량 초과, 서버 오류)
+RETRYABLE_SHEETS_ERRORS = {429, 500, 502, 503}
+
+# 프로세스 전역 캐시 (인증 및 스프레드시트 메타데이터 조회를 1회로 제한)
+_credentials: Optional[service_account.Credentials] = None
+_client: Optional[gspread.Client] = None
+_spreadsheets: Dict[str, gspread.Spreadsheet] = {}
+_worksheets: Dict[Tuple[str, str], gspread.Worksheet] = {}
+_cache_lock = threading.RLock()
+
+
+def setup_credentials(overwrite: bool = False) -> str:
     """Google 인증 정보 설정
     
     환경변수에서 base64로 인코딩된 credentials를 읽어와 파일로 저장
     
+    Args:
+        overwrite: 파일이 이미 있어도 환경변수 값으로 다시 저장 (기본값: False)
+    
     Returns:
         str: credentials 파일 경로
     """
@@ -24,8 +48,8 @@ def setup_credentials() -> str:
     
     cred_path = os.path.join(cred_dir, 'credentials.json')
     
-    # 이미 파일이 존재하면 덮어쓰지 않음
-    if not os.path.exists(cred_path):
+    # 이미 파일이 존재하면 덮어쓰지 않음 (overwrite 제외)
+    if overwrite or not os.path.exists(cred_path):
         with open(cred_path, "w") as f:
             f.write(base64.b64decode(b64_cred).decode('utf-8'))
     
@@ -33,18 +57,56 @@ def setup_credentials() -> str:
 
 
 def get_credentials() -> service_account.Credentials:
-    """Google API 인증 정보 반환
+    """Google API 인증 정보 반환 (프로세스 내 1회 생성)
     
     Returns:
         Credentials: Google API 인증 객체
     """
-    cred_path = setup_credentials()
-    scopes = ['https://www.googleapis.com/auth/spreadsheets']
-    return Credentials.from_service_account_file(cred_path, scopes=scopes)
+    global _credentials
+    with _cache_lock:
+        if _credentials is None:
+            cred_path = setup_credentials()
+            scopes = ['https://www.googleapis.com/auth/spreadsheets']
+            _credentials = Credentials.from_service_account_file(cred_path, scopes=scopes)
+        return _credentials
+
+
+class _BaseURLAdapter(HTTPAdapter):
+    """Sheets API 요청을 다른 기본 URL(로컬 대체 서버 등)로 보내는 어댑터"""
+    
+    def __init__(self, base_url: str):
+        super().__init__()
+        self.base_url = base_url.rstrip('/')
+    
+    def send(self, request, **kwargs):
+        request.url = self.base_url + request.url[len(SHEETS_API_URL):]
+        return super().send(request, **kwargs)
+
+
+def get_gspread_client() -> gspread.Client:
+    """gspread 클라이언트 반환 (프로세스 내 1회 인증)
+    
+    액세스 토큰은 만료 시 google-auth 세션이 요청 직전에 자동으로 갱신.
+    SHEETS_API_URL 환경변수가 있으면 인증 없이 해당 서버로 요청함
+    
+    Returns:
+        Client: gspread 클라이언트 객체
+    """
+    global _client
+    with _cache_lock:
+        if _client is None:
+            base_url = os.environ.get('SHEETS_API_URL')
+            if base_url:
+                session = Session()
+                session.mount(SHEETS_API_URL, _BaseURLAdapter(base_url))
+                _client = gspread.Client(None, session=session)
+            else:
+                _client = gspread.authorize(get_credentials())
+        return _client
 
 
 def get_sheets_client(spreadsheet_id: str) -> gspread.Spreadsheet:
-    """Google Sheets 클라이언트 반환
+    """Google Sheets 클라이언트 반환 (문서별 1회 조회 후 캐시)
     
     Args:
         spreadsheet_id: Google Sheets 문서 ID
@@ -52,13 +114,14 @@ def get_sheets_client(spreadsheet_id: str) -> gspread.Spreadsheet:
     Returns:
         Spreadsheet: Google Sheets 클라이언트 객체
     """
-    credentials = get_credentials()
-    gc = gspread.authorize(credentials)
-    return gc.open_by_key(spreadsheet_id)
+    with _cache_lock:
+        if spreadsheet_id not in _spreadsheets:
+            _spreadsheets[spreadsheet_id] = get_gspread_client().open_by_key(spreadsheet_id)
+        return _spreadsheets[spreadsheet_id]
 
 
 def get_worksheet(spreadsheet_id: str, sheet_name: str) -> gspread.Worksheet:
-    """워크시트 객체 반환
+    """워크시트 객체 반환 (워크시트별 1회 조회 후 캐시)
     
     Args:
         spreadsheet_id: Google Sheets 문서 ID
@@ -67,8 +130,36 @@ def get_worksheet(spreadsheet_id: str, sheet_name: str) -> gspread.Worksheet:
     Returns:
         Worksheet: 워크시트 객체
     """
-    sh = get_sheets_client(spreadsheet_id)
-    return sh.worksheet(sheet_name)
+    key = (spreadsheet_id, sheet_name)
+    with _cache_lock:
+        if key not in _worksheets:
+            _worksheets[key] = get_sheets_client(spreadsheet_id).worksheet(sheet_name)
+        return _worksheets[key]
+
+
+def invalidate_sheets_cache(spreadsheet_id: Optional[str] = None, sheet_name: Optional[str] = None) -> None:
+    """캐시된 클라이언트/스프레드시트/워크시트 핸들 제거
+    
+    인자 없이 호출하면 인증 정보까지 모두 제거하여 다음 호출 시 재인증
+    
+    Args:
+        spreadsheet_id: 제거할 문서 ID (None이면 전체)
+        sheet_name: 제거할 워크시트 이름 (None이면 문서의 모든 워크시트)
+    """
+    global _credentials, _client
+    with _cache_lock:
+        if spreadsheet_id is None:
+            _credentials = None
+            _client = None
+            _spreadsheets.clear()
+            _worksheets.clear()
+            return
+        
+        for key in list(_worksheets):
+            if key[0] == spreadsheet_id and (sheet_name is None or key[1] == sheet_name):
+                del _worksheets[key]
+        if sheet_name is None:
+            _spreadsheets.pop(spreadsheet_id, None)
 
 
 def create_worksheet_if_not_exists(
@@ -90,15 +181,18 @@ def create_worksheet_if_not_exists(
     Returns:
         Worksheet: 워크시트 객체
     """
-    sh = get_sheets_client(spreadsheet_id)
-    
     try:
-        worksheet = sh.worksheet(sheet_name)
+        return get_worksheet(spreadsheet_id, sheet_name)
     except gspread.exceptions.WorksheetNotFound:
-        worksheet = sh.add_worksheet(title=sheet_name, rows=rows, cols=cols)
-        if headers:
-            worksheet.append_row(headers)
+        pass
+    
+    sh = get_sheets_client(spreadsheet_id)
+    worksheet = sh.add_worksheet(title=sheet_name, rows=rows, cols=cols)
+    if headers:
+        worksheet.append_row(headers)
     
+    with _cache_lock:
+        _worksheets[(spreadsheet_id, sheet_name)] = worksheet
     return worksheet
 
 
@@ -120,6 +214,89 @@ def append_row_to_sheet(
     worksheet.append_row(data, value_input_option=value_input_option)
 
 
+def call_with_quota_retry(func: Callable, *args, max_retries: int = SHEETS_MAX_RETRIES, **kwargs) -> Any:
+    """Sheets API 호출 (할당량 초과 시 백오프 후 재시도)
+    
+    Args:
+        func: 호출할 gspread 메서드
+        *args: 메서드 인자
+        max_retries: 최대 재시도 횟수 (기본값: SHEETS_MAX_RETRIES)
+        **kwargs: 메서드 키워드 인자
+        
+    Returns:
+        Any: 메서드 반환값
+    """
+    metrics = get_metrics()
+    for attempt in range(max_retries + 1):
+        try:
+            with metrics.timer('sheets_call'):
+                return func(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            if e.code == 401:
+                # 토큰이 폐기된 경우 다음 조회 시 재인증되도록 캐시 제거
+                invalidate_sheets_cache()
+            if e.code not in RETRYABLE_SHEETS_ERRORS or attempt == max_retries:
+                raise
+            retry_after = e.response.headers.get('Retry-After') if e.response is not None else None
+            delay = backoff_delay(attempt, retry_after, base=2.0, cap=64.0)
+            logger.warning(f"Sheets API 오류 {e.code}, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+            metrics.incr('sheets.retries')
+            time.sleep(delay)
+
+
+def append_rows_batched(
+    worksheet: gspread.Worksheet,
+    rows: List[List[str]],
+    value_input_option: str = 'RAW',
+    chunk_size: int = SHEETS_BATCH_SIZE
+) -> List[Dict]:
+    """워크시트에 여러 행을 청크 단위로 한 번에 추가
+    
+    Args:
+        worksheet: 워크시트 객체
+        rows: 추가할 행 데이터 리스트
+        value_input_option: 입력 옵션 ('RAW' 또는 'USER_ENTERED')
+        chunk_size: 요청당 최대 행 수 (기본값: SHEETS_BATCH_SIZE)
+        
+    Returns:
+        List[Dict]: 청크별 API 응답 (updates.updatedRange 포함)
+    """
+    responses = []
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        responses.append(call_with_quota_retry(
+            worksheet.append_rows,
+            chunk,
+            value_input_option=value_input_option
+        ))
+    return responses
+
+
+def append_rows_to_sheet(
+    spreadsheet_id: str,
+    sheet_name: str,
+    rows: List[List[str]],
+    value_input_option: str = 'RAW',
+    chunk_size: int = SHEETS_BATCH_SIZE
+) -> List[Dict]:
+    """시트에 여러 행을 일괄 추가
+    
+    Args:
+        spreadsheet_id: Google Sheets 문서 ID
+        sheet_name: 워크시트 이름
+        rows: 추가할 행 데이터 리스트
+        value_input_option: 입력 옵션 ('RAW' 또는 'USER_ENTERED')
+        chunk_size: 요청당 최대 행 수 (기본값: SHEETS_BATCH_SIZE)
+        
+    Returns:
+        List[Dict]: 청크별 API 응답
+    """
+    if not rows:
+        return []
+    worksheet = get_worksheet(spreadsheet_id, sheet_name)
+    return append_rows_batched(worksheet, rows, value_input_option, chunk_size)
+
+
 def get_all_values(spreadsheet_id: str, sheet_name: str, skip_headers: bool = True) -> List[List[str]]:
     """시트의 모든 값 반환
     
@@ -20,13 +20,16 @@ def get_kst_date() -> str:
     return get_kst_now().strftime('%Y-%m-%d')
 
 
-def get_kst_date_with_weekday() -> str:
+def get_kst_date_with_weekday(date: Optional[str] = None) -> str:
     """한국 표준시(KST) 기준 현재 날짜와 요일 반환
     
+    Args:
+        date: 대상 날짜 (YYYY-MM-DD, 기본값: 오늘)
+    
     Returns:
         str: MM/DD(요일) 형식의 날짜 문자열
     """
-    kst_now = get_kst_now()
+    kst_now = datetime.strptime(date, '%Y-%m-%d') if date else get_kst_now()
     weekdays = ['월', '화', '수', '목', '금', '토', '일']
     weekday = weekdays[kst_now.weekday()]
     return kst_now.strftime(f'%m/%d({weekday})')
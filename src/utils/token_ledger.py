@@ -0,0 +1,221 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .time_utils import get_kst_date
+from src.config import (
+    CLAUDE_PRICING,
+    TOKEN_LEDGER_PATH,
+    CLAUDE_DAILY_BUDGET_USD,
+    CLAUDE_DAILY_HARD_LIMIT_USD,
+    CLAUDE_BUDGET_FALLBACK_MODEL
+)
+
+logger = logging.getLogger(__name__)
+
+_ledger: Optional['TokenLedger'] = None
+_ledger_lock = threading.Lock()
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """토큰 수로 호출 비용 계산
+    
+    가격표에 없는 모델은 가장 비싼 모델 가격으로 계산 (예산을 넘기지 않도록)
+    
+    Args:
+        model: 모델 이름
+        input_tokens: 입력 토큰 수
+        output_tokens: 출력 토큰 수
+    
+    Returns:
+        float: 비용 (USD)
+    """
+    input_price, output_price = CLAUDE_PRICING.get(model) or max(CLAUDE_PRICING.values())
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+class TokenLedger:
+    """Claude 호출별 토큰/비용 기록과 하루 예산 관리
+    
+    기록은 SQLite에 남아 여러 실행(프로세스)에 걸쳐 하루 비용이 누적되며,
+    run_id로 이번 실행분만 따로 집계할 수 있음
+    """
+    
+    def __init__(
+        self,
+        path: str = TOKEN_LEDGER_PATH,
+        daily_budget: Optional[float] = CLAUDE_DAILY_BUDGET_USD,
+        hard_limit: Optional[float] = CLAUDE_DAILY_HARD_LIMIT_USD,
+        fallback_model: str = CLAUDE_BUDGET_FALLBACK_MODEL
+    ):
+        self.path = path
+        self.daily_budget = daily_budget
+        self.hard_limit = hard_limit
+        self.fallback_model = fallback_model
+        self.run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        self._spent: Dict[str, float] = {}    # 날짜별 누적 비용 (처음 조회할 때 DB에서 읽음)
+        self._warned = set()                  # 이미 경고한 예산 단계
+        self._lock = threading.Lock()
+        
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS token_usage (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL,
+                date TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                model TEXT NOT NULL,
+                prompt_type TEXT NOT NULL,
+                input_tokens INTEGER NOT NULL,
+                output_tokens INTEGER NOT NULL,
+                cost_usd REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_token_usage_date ON token_usage (date)")
+        self._conn.commit()
+    
+    def _spent_locked(self, date: str) -> float:
+        if date not in self._spent:
+            row = self._conn.execute(
+                "SELECT COALESCE(SUM(cost_usd), 0) FROM token_usage WHERE date = ?", (date,)
+            ).fetchone()
+            self._spent[date] = row[0]
+        return self._spent[date]
+    
+    def record(self, model: str, prompt_type: str, input_tokens: int, output_tokens: int) -> float:
+        """API 응답의 usage 기록
+        
+        Args:
+            model: 실제 호출한 모델
+            prompt_type: 프롬프트 종류 ('title', 'content', 'trend', 'batch', 'insight', 'weekly' 등)
+            input_tokens: 입력 토큰 수
+            output_tokens: 출력 토큰 수
+        
+        Returns:
+            float: 이번 호출 비용 (USD)
+        """
+        cost = estimate_cost(model, input_tokens, output_tokens)
+        date = get_kst_date()
+        with self._lock:
+            self._conn.execute(
+                """INSERT INTO token_usage
+                (run_id, date, created_at, model, prompt_type, input_tokens, output_tokens, cost_usd)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (self.run_id, date, time.time(), model, prompt_type, input_tokens, output_tokens, cost)
+            )
+            self._conn.commit()
+            self._spent[date] = self._spent_locked(date) + cost
+        return cost
+    
+    def spent(self, date: Optional[str] = None) -> float:
+        """하루 누적 비용
+        
+        Args:
+            date: 날짜 (기본값: 오늘 KST)
+        
+        Returns:
+            float: 비용 (USD)
+        """
+        with self._lock:
+            return self._spent_locked(date or get_kst_date())
+    
+    def choose_model(self, model: str) -> Optional[str]:
+        """예산에 따라 이번 호출에 사용할 모델 결정
+        
+        Args:
+            model: 요청한 모델
+        
+        Returns:
+            str: 사용할 모델 (예산 도달 시 저렴한 모델), 하드 한도 도달 시 None (호출하지 않음)
+        """
+        spent = self.spent()
+        if self.hard_limit is not None and spent >= self.hard_limit:
+            self._warn_once('hard', f"Claude 하루 한도 도달 (${spent:.4f} / ${self.hard_limit}), 로컬 대체 결과 사용")
+            return None
+        if (
+            self.daily_budget is not None and spent >= self.daily_budget
+            and estimate_cost(model, 1, 1) > estimate_cost(self.fallback_model, 1, 1)
+        ):
+            self._warn_once('budget', f"Claude 하루 예산 도달 (${spent:.4f} / ${self.daily_budget}), {self.fallback_model}로 전환")
+            return self.fallback_model
+        return model
+    
+    def _warn_once(self, level: str, message: str) -> None:
+        with self._lock:
+            if level in self._warned:
+                return
+            self._warned.add(level)
+        logger.warning(message)
+    
+    def usage(self, date: Optional[str] = None, run_only: bool = False) -> List[Dict]:
+        """모델/프롬프트 종류별 사용량 집계
+        
+        Args:
+            date: 날짜 (기본값: 오늘 KST)
+            run_only: 이번 실행분만 집계
+        
+        Returns:
+            List[Dict]: model, prompt_type, calls, input_tokens, output_tokens, cost_usd (비용 내림차순)
+        """
+        query = """SELECT model, prompt_type, COUNT(*), SUM(input_tokens), SUM(output_tokens), SUM(cost_usd)
+            FROM token_usage WHERE date = ?"""
+        params = [date or get_kst_date()]
+        if run_only:
+            query += " AND run_id = ?"
+            params.append(self.run_id)
+        query += " GROUP BY model, prompt_type ORDER BY SUM(cost_usd) DESC"
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            {
+                'model': row[0],
+                'prompt_type': row[1],
+                'calls': row[2],
+                'input_tokens': row[3],
+                'output_tokens': row[4],
+                'cost_usd': round(row[5], 6)
+            }
+            for row in rows
+        ]
+    
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+def get_token_ledger() -> TokenLedger:
+    """프로세스 전역 토큰 기록 반환
+    
+    Returns:
+        TokenLedger: 공유 기록 객체
+    """
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                _ledger = TokenLedger()
+    return _ledger
+
+
+def log_token_usage(target_logger: Optional[logging.Logger] = None) -> None:
+    """이번 실행의 모델/프롬프트 종류별 토큰 사용량과 오늘 누적 비용 로깅
+    
+    Args:
+        target_logger: 사용할 로거 (기본값: 모듈 로거)
+    """
+    if _ledger is None:
+        return
+    log = target_logger or logger
+    for row in _ledger.usage(run_only=True):
+        log.info(
+            f"Claude 토큰 [{row['model']}/{row['prompt_type']}]: {row['calls']}회, "
+            f"입력 {row['input_tokens']}, 출력 {row['output_tokens']} (${row['cost_usd']:.4f})"
+        )
+    log.info(f"Claude 오늘 누적 비용: ${_ledger.spent():.4f}")